@@ -253,6 +253,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"❌ Error closing Supabase database: {e}")
 
+    # Close the pooled escalation API session
+    try:
+        from services.escalation_service import close_session
+        await close_session()
+    except Exception as e:
+        logger.error(f"❌ Error closing escalation API session: {e}")
+
 
 # FASTAPI APP
 
@@ -3,28 +3,82 @@ Booking and slot management flow handlers
 """
 
 import re
-from datetime import datetime, timedelta
+import time
+import asyncio
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
 from typing import Dict, Any, Tuple, List
 from loguru import logger
 
+from rapidfuzz import fuzz
 from pipecat.frames.frames import TTSSpeakFrame
 from pipecat_flows import FlowManager, NodeConfig, FlowArgs
 from services.cerba_api import cerba_api
-from services.slotAgenda import list_slot, create_slot, delete_slot
-from utils.api_retry import retry_api_call
+from services.slotAgenda import list_slot, cached_list_slot, invalidate_slot_cache, create_slot, delete_slot
+from services.timezone_utils import utc_to_italian_display, parse_iso_datetime, utc_to_naive_string
+from services.patient_lookup import lookup_by_phone_and_dob, populate_patient_state
+from utils.api_retry import retry_api_call, retry_api_call_async
+from utils.italian_time import italian_words_to_time
+from utils.date_parser import parse_readable_date, format_dob_for_api
 from models.requests import HealthService, HealthCenter
 from services.llm_interpretation import interpret_sorting_scenario
+from services.sorting_api import call_sorting_api, build_service_group
 from config.settings import settings
+from utils.cache import TTLCache
+# Node factories that don't import this module; flows.nodes.booking, completion and
+# doctor_selection import booking_handlers at load time, so those stay function-local
+from flows.nodes.transfer import create_transfer_node_with_escalation
+from flows.nodes.router import create_router_node
+from flows.nodes.patient_info import create_recollect_address_node
+from flows.nodes.pricing import create_price_info_node
+from flows.nodes.second_service import create_second_service_search_node
+from flows.nodes.patient_summary import create_patient_summary_node
+from flows.nodes.patient_details import create_collect_full_name_node
 
 ITALIAN_TZ = ZoneInfo("Europe/Rome")
 
+# Time-of-day search windows in database time format (no timezone conversion):
+# key -> (start, end, time_preference label, preferred_time)
+_TIME_RANGES = {
+    "morning": ("08:00:00+00", "12:00:00+00", "morning (08:00-12:00)", "morning"),
+    "afternoon": ("12:00:00+00", "19:00:00+00", "afternoon (12:00-19:00)", "afternoon"),
+    "any": (None, None, "any time", "any"),
+}
+
+_SEP = "=" * 80
+
+# Per-search slot state, cleared before searching slots for another service or retrying
+_SLOT_STATE_KEYS = ("available_slots", "cached_all_slots", "cached_search_params",
+                    "first_available_mode", "slot_cache")
+
+# Specific time preference: "9", "14:30", "2pm", "12:15 AM"
+_TIME_RE = re.compile(r"^\s*(\d{1,2})(?::(\d{2}))?\s*(am|pm)?\s*$", re.IGNORECASE)
+
+
+@dataclass(slots=True)
+class DisplayService:
+    """Service-like value shown on the slot selection node for grouped scenarios."""
+    name: str
+    uuid: str
+    code: str
+
+
+DATE_CACHE_TTL = 60  # seconds; never outlives the current Italian day
+
+# How long slots from a search stay reusable when the same search is asked again
+SLOT_REUSE_TTL = 120  # seconds
+
+# Speculative "first available" slot searches, started when a date search comes
+# back empty so the follow-up search for the earliest bookable day is already in flight
+FIRST_AVAILABLE_PREFETCH_TTL = 45  # seconds
+_first_available_prefetch = TTLCache(default_ttl=FIRST_AVAILABLE_PREFETCH_TTL)
+
 
 def _auto_select_center(center_hint: str, centers: list):
     """Auto-select center if clear fuzzy match against center_hint.
     Returns HealthCenter or None if ambiguous.
     """
-    from rapidfuzz import fuzz
 
     if len(centers) == 1:
         logger.info(f"📍 Center auto-select: only 1 center → {centers[0].name}")
@@ -56,14 +110,13 @@ async def _price_inquiry_slot_search(flow_manager, selected_center, selected_ser
     Replicates the price_inquiry path from select_center_and_book.
     Supports optional doctor filtering via state["price_inquiry_doctor"].
     """
-    import asyncio
 
     patient_gender = flow_manager.state.get("patient_gender", "m")
     patient_dob = flow_manager.state.get("patient_dob", "")
     current_service = selected_services[0] if selected_services else None
     doctor_name = flow_manager.state.get("price_inquiry_doctor")
 
-    tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+    tomorrow = (date.today() + timedelta(days=1)).isoformat()
 
     # If doctor requested, look up via providing-entity API
     providing_entity_uuid = None
@@ -78,7 +131,7 @@ async def _price_inquiry_slot_search(flow_manager, selected_center, selected_ser
 
         try:
             service_uuids = [s.uuid for s in selected_services]
-            dob_formatted = patient_dob.replace("-", "")
+            dob_formatted = format_dob_for_api(flow_manager.state, patient_dob)
             loop = asyncio.get_event_loop()
             doctors = await loop.run_in_executor(
                 None,
@@ -148,11 +201,248 @@ async def _price_inquiry_slot_search(flow_manager, selected_center, selected_ser
     return await perform_slot_search_and_transition({}, flow_manager)
 
 
+def _normalize_time_pref(time_preference: str, preferred_time: str = "") -> str:
+    """Map the LLM's time_preference/preferred_time to a _TIME_RANGES key, or "specific"."""
+    preferred_lower = preferred_time.lower()
+    for key in ("morning", "afternoon"):
+        if time_preference == key or key in preferred_lower:
+            return key
+    if preferred_time and time_preference == "specific":
+        return "specific"
+    return "any"
+
+
 def get_min_booking_time() -> datetime:
     """Earliest bookable moment = now + 24h in Italian timezone."""
     return datetime.now(ITALIAN_TZ) + timedelta(hours=24)
 
 
+def _get_today_tomorrow(flow_manager: FlowManager) -> Tuple[str, str]:
+    """Today's and tomorrow's dates (Italian time) as ISO strings, cached in state."""
+    cached = flow_manager.state.get("_date_cache")
+    if cached and time.monotonic() < cached[0]:
+        return cached[1], cached[2]
+
+    now = datetime.now(ITALIAN_TZ)
+    today = now.date()
+    tomorrow = today + timedelta(days=1)
+    seconds_to_midnight = (datetime.combine(tomorrow, datetime.min.time(), ITALIAN_TZ) - now).total_seconds()
+    expires_at = time.monotonic() + min(DATE_CACHE_TTL, seconds_to_midnight)
+    flow_manager.state["_date_cache"] = (expires_at, today.isoformat(), tomorrow.isoformat())
+    return today.isoformat(), tomorrow.isoformat()
+
+
+def _build_pending_params(state: dict, preferred_date: str, start_time, end_time, time_preference: str, **extra) -> dict:
+    """Build pending_slot_search_params (consumed by perform_slot_search_and_transition) from state."""
+    selected_services = state.get("selected_services", [])
+    current_service_index = state.get("current_service_index", 0)
+    return {
+        "selected_center": state.get("selected_center"),
+        "selected_services": selected_services,
+        "preferred_date": preferred_date,
+        "start_time": start_time,
+        "end_time": end_time,
+        "time_preference": time_preference,
+        "patient_gender": state.get("patient_gender", 'm'),
+        "patient_dob": state.get("patient_dob", '1980-04-13'),
+        "current_service_index": current_service_index,
+        "current_service": selected_services[current_service_index] if selected_services else None,
+        **extra
+    }
+
+
+def _remember_slot_search(flow_manager: FlowManager, slot_kwargs: dict, slots: list) -> None:
+    """Record which list_slot search produced state["available_slots"]."""
+    flow_manager.state["available_slots_search"] = (dict(slot_kwargs), time.monotonic(), slots)
+
+
+def _reusable_slots(flow_manager: FlowManager, slot_kwargs: dict):
+    """Return the stored slots if they came from the same search less than SLOT_REUSE_TTL seconds ago."""
+    cached = flow_manager.state.get("available_slots_search")
+    if not cached or cached[0] != slot_kwargs:
+        return None
+    # Any other writer of available_slots (show more, doctor filter, retries) invalidates the record
+    if cached[2] is not flow_manager.state.get("available_slots"):
+        return None
+    if time.monotonic() - cached[1] > SLOT_REUSE_TTL:
+        return None
+    return cached[2]
+
+
+def _first_available_prefetch_key(center_uuid: str, date_search: str, uuid_exam, gender: str, dob_formatted: str, providing_entity: str = None) -> str:
+    """Cache key for a prefetched "first available" slot search."""
+    return "|".join([center_uuid, date_search, ",".join(uuid_exam), gender, dob_formatted, providing_entity or ""])
+
+
+def _prefetch_first_available_slots(flow_manager: FlowManager, selected_center, uuid_exam, patient_gender: str, dob_formatted: str, providing_entity: str = None) -> None:
+    """Start the earliest-bookable-day slot search in the background.
+
+    The result is picked up by perform_slot_search_and_transition if the patient
+    asks for the first available date within FIRST_AVAILABLE_PREFETCH_TTL seconds.
+    """
+    min_dt = get_min_booking_time()
+    date_search = min_dt.date().isoformat()
+    key = _first_available_prefetch_key(selected_center.uuid, date_search, uuid_exam, patient_gender, dob_formatted, providing_entity)
+    if _first_available_prefetch.get(key) is not None:
+        return
+
+    slot_kwargs = dict(
+        health_center_uuid=selected_center.uuid,
+        date_search=date_search,
+        uuid_exam=uuid_exam,
+        gender=patient_gender,
+        date_of_birth=dob_formatted,
+        start_time=min_dt.strftime('%Y-%m-%d %H:%M:%S+00'),
+        end_time=None
+    )
+    if providing_entity:
+        slot_kwargs["providing_entity"] = providing_entity
+
+    future = asyncio.ensure_future(asyncio.to_thread(cached_list_slot, **slot_kwargs))
+    # Mark exceptions as retrieved — an unused prefetch must not log "never retrieved"
+    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+    _first_available_prefetch.cleanup_expired()
+    _first_available_prefetch.set(key, future)
+    flow_manager.state["first_available_prefetch_key"] = key
+    logger.info(f"⚡ Prefetching first available slots for {date_search}")
+
+
+def _take_prefetched_first_available(flow_manager: FlowManager, key: str):
+    """Pop the prefetched slot search for key, or None if there is none."""
+    future = _first_available_prefetch.get(key)
+    if future is None:
+        return None
+    _first_available_prefetch.delete(key)
+    flow_manager.state.pop("first_available_prefetch_key", None)
+    return future
+
+
+def _invalidate_first_available_prefetch(flow_manager: FlowManager) -> None:
+    """Drop this session's pending prefetch (availability changed after a booking)."""
+    key = flow_manager.state.pop("first_available_prefetch_key", None)
+    if key:
+        _first_available_prefetch.delete(key)
+
+
+def _invalidate_slot_searches(flow_manager: FlowManager) -> None:
+    """Forget prefetched, reusable and cached slot searches after a slot was booked or released."""
+    _invalidate_first_available_prefetch(flow_manager)
+    flow_manager.state.pop("available_slots_search", None)
+    selected_center = flow_manager.state.get("selected_center")
+    if selected_center:
+        invalidate_slot_cache(selected_center.uuid)
+
+
+_UTC_SUFFIXES = ("", "+00", "+00:00", "Z")
+
+
+def _utc_sort_key(timestamp: str):
+    """'YYYY-MM-DD HH:MM:SS' for a whole-second UTC ISO timestamp (string order == time order), else None."""
+    if len(timestamp) >= 19 and timestamp[19:] in _UTC_SUFFIXES:
+        return f"{timestamp[:10]} {timestamp[11:19]}"
+    return None
+
+
+def _service_lines(services: list) -> str:
+    """One indented "[n] name (UUID: ...)" line per service, for debug logs."""
+    return "\n".join(f"   [{idx+1}] {svc.name} (UUID: {svc.uuid})" for idx, svc in enumerate(services))
+
+
+def _scenario_bundle(state: dict, selected_services: list, current_service_index: int) -> Tuple[Tuple[str, ...], str]:
+    """Scenario 1: multiple services bundled together (group=true) - ALL UUIDs of the single group."""
+    logger.debug("🎁 BUNDLE SCENARIO: Multiple services bundled together")
+    service_groups = state.get("service_groups", [])
+
+    if not service_groups:
+        logger.error("❌ Bundle scenario but no service groups found!")
+        raise ValueError("Bundle scenario but no service groups")
+
+    bundle = service_groups[0]
+    logger.opt(lazy=True).debug("   Services in bundle: {}\n{}", lambda: len(bundle["services"]), lambda: _service_lines(bundle["services"]))
+    return bundle["uuids"], bundle["name"]
+
+
+def _scenario_combined(state: dict, selected_services: list, current_service_index: int) -> Tuple[Tuple[str, ...], str]:
+    """Scenario 2: services combined into a single service (single group, group=false) - one UUID."""
+    logger.debug("🔗 COMBINED SCENARIO: Services combined into one service")
+    service_groups = state.get("service_groups", [])
+
+    if not service_groups:
+        logger.error("❌ Combined scenario but no service groups found!")
+        raise ValueError("Combined scenario but no service groups")
+
+    single_service = service_groups[0]["services"][0]
+    return (single_service.uuid,), single_service.name
+
+
+def _scenario_separate(state: dict, selected_services: list, current_service_index: int) -> Tuple[Tuple[str, ...], str]:
+    """Scenario 3: multiple groups booked separately (all group=false) - the current group's UUIDs."""
+    service_groups = state.get("service_groups", [])
+    current_group_index = state.get("current_group_index", 0)
+    logger.debug("📦 SEPARATE SCENARIO: Multiple groups, booking separately")
+    logger.debug("   Current group index: {} of {}", current_group_index, len(service_groups))
+
+    if current_group_index >= len(service_groups):
+        logger.error(f"❌ Invalid group index {current_group_index} for {len(service_groups)} groups!")
+        raise ValueError("Invalid group index")
+
+    current_group = service_groups[current_group_index]
+    logger.opt(lazy=True).debug("   Services in current group: {}\n{}", lambda: len(current_group["services"]), lambda: _service_lines(current_group["services"]))
+    return current_group["uuids"], current_group["name"]
+
+
+def _scenario_legacy(state: dict, selected_services: list, current_service_index: int) -> Tuple[Tuple[str, ...], str]:
+    """doctor_specific (filtered later by providing_entity) or legacy fallback (pre-sorting API) - the current service."""
+    booking_scenario = state.get("booking_scenario", "legacy")
+    if booking_scenario == "doctor_specific":
+        logger.debug("🩺 DOCTOR-SPECIFIC SCENARIO: Using selected service with providing_entity filter")
+    else:
+        logger.debug("🔄 LEGACY SCENARIO: Using original selected_services")
+        logger.warning("⚠️  Sorting API was not used or failed - falling back to legacy mode")
+
+    if not selected_services or current_service_index >= len(selected_services):
+        logger.error(f"❌ {booking_scenario} mode but no selected service found!")
+        raise ValueError("No services available for booking")
+
+    current_service = selected_services[current_service_index]
+    return (current_service.uuid,), current_service.name
+
+
+# Booking scenario -> (uuid tuple, display name) resolver; anything else uses _scenario_legacy
+_SCENARIO_HANDLERS = {
+    "bundle": _scenario_bundle,
+    "combined": _scenario_combined,
+    "separate": _scenario_separate,
+}
+
+
+def _resolve_slot_search_target(state: dict, selected_services: list, current_service_index: int) -> Tuple[Tuple[str, ...], str, str]:
+    """Resolve the service UUIDs, their comma-joined form and the display name to search slots for.
+
+    Dispatches on the booking scenario decided after the sorting API
+    (see _SCENARIO_HANDLERS). The result is memoized in state["_resolved_target"]
+    until the scenario, the group/service index or the service lists change.
+    Raises ValueError if the scenario has nothing to search for.
+    """
+    booking_scenario = state.get("booking_scenario", "legacy")
+    service_groups = state.get("service_groups", [])
+    current_group_index = state.get("current_group_index", 0)
+
+    # Lists are compared by identity (the cache holds references, so ids cannot be reused)
+    cache_key = (booking_scenario, current_group_index, current_service_index, len(service_groups), len(selected_services))
+    cached = state.get("_resolved_target")
+    if cached and cached[0] == cache_key and cached[1] is service_groups and cached[2] is selected_services:
+        return cached[3]
+
+    resolve = _SCENARIO_HANDLERS.get(booking_scenario, _scenario_legacy)
+    uuid_exam, service_name = resolve(state, selected_services, current_service_index)
+
+    result = (uuid_exam, ",".join(uuid_exam), service_name)
+    state["_resolved_target"] = (cache_key, service_groups, selected_services, result)
+    return result
+
+
 def _get_doctor_display_name(flow_manager: FlowManager) -> str:
     """Get selected doctor's display name from state, or empty string if not doctor-specific."""
     doctor = flow_manager.state.get("selected_providing_entity")
@@ -167,13 +457,12 @@ def _build_booked_slots_summary(flow_manager: FlowManager) -> str:
     booked_slots = flow_manager.state.get("booked_slots", [])
     if not booked_slots:
         return ""
-    from services.timezone_utils import utc_to_italian_display
     parts = []
     for slot in booked_slots:
         name = slot.get("service_name", "Unknown")
         italian_start = utc_to_italian_display(slot.get("start_time", ""))
         if italian_start:
-            dt = datetime.strptime(italian_start, "%Y-%m-%d %H:%M:%S")
+            dt = parse_iso_datetime(italian_start)
             parts.append(f"{name} il {dt.strftime('%d/%m/%Y')} alle {dt.strftime('%-H:%M')}")
         else:
             parts.append(name)
@@ -237,9 +526,8 @@ async def search_final_centers_and_transition(args: FlowArgs, flow_manager: Flow
         tts_service = flow_manager.state.get("tts_service")
         if tts_service:
             await tts_service.queue_frame(TTSSpeakFrame(tts_message))
-        dob_formatted = date_of_birth.replace("-", "")
+        dob_formatted = format_dob_for_api(flow_manager.state, date_of_birth)
 
-        import asyncio
         loop = asyncio.get_event_loop()
 
         radius_display = current_radius if current_radius else "22 (default)"
@@ -273,12 +561,10 @@ async def search_final_centers_and_transition(args: FlowArgs, flow_manager: Flow
                 if address_retry_count == 0:
                     flow_manager.state["address_retry_count"] = 1
                     logger.warning(f"⚠️ Address not recognized in final search, asking patient to retry")
-                    from flows.nodes.patient_info import create_recollect_address_node
                     return {"success": False, "message": "Address not recognized"}, create_recollect_address_node()
                 else:
                     logger.error(f"❌ Address still invalid after retry in final search, offering transfer")
 
-            from flows.nodes.transfer import create_transfer_node_with_escalation
             return {
                 "success": False,
                 "error": error_str,
@@ -368,7 +654,6 @@ async def search_final_centers_and_transition(args: FlowArgs, flow_manager: Flow
                            "services_found", "current_search_term", "expanded_search",
                            "search_radius_used", "address_retry_count", "booking_scenario"]:
                     flow_manager.state.pop(k, None)
-                from flows.nodes.router import create_router_node
                 return {
                     "success": False,
                     "message": (
@@ -416,7 +701,6 @@ async def handle_radius_expansion_response(args: FlowArgs, flow_manager: FlowMan
                    "services_found", "current_search_term", "expanded_search",
                    "search_radius_used", "address_retry_count", "booking_scenario"]:
             flow_manager.state.pop(k, None)
-        from flows.nodes.router import create_router_node
         return {
             "success": False,
             "message": (
@@ -482,7 +766,6 @@ async def select_center_and_book(args: FlowArgs, flow_manager: FlowManager) -> T
     # Call the sorting API to get optimized service packages for this center
     # ============================================================================
 
-    from services.sorting_api import call_sorting_api
 
     # Get required data from state
     selected_services = flow_manager.state.get("selected_services", [])
@@ -490,7 +773,7 @@ async def select_center_and_book(args: FlowArgs, flow_manager: FlowManager) -> T
     patient_dob = flow_manager.state.get("patient_dob", "")
 
     # Format DOB for API (remove dashes if present: "1980-04-13" -> "19800413")
-    dob_formatted = patient_dob.replace("-", "") if patient_dob else "19800413"
+    dob_formatted = format_dob_for_api(flow_manager.state, patient_dob, "19800413")
 
     logger.info(f"🔄 Initiating sorting API call:")
     logger.info(f"   Center: {selected_center.name} ({selected_center.uuid})")
@@ -577,10 +860,7 @@ async def select_center_and_book(args: FlowArgs, flow_manager: FlowManager) -> T
                             continue
 
                     if services:
-                        service_groups.append({
-                            "services": services,
-                            "is_group": is_group
-                        })
+                        service_groups.append(build_service_group(services, is_group))
                         logger.debug(f"   ✅ Added group {group_idx}: {len(services)} service(s), is_group={is_group}")
 
                 if not service_groups:
@@ -694,11 +974,9 @@ async def select_center_and_book(args: FlowArgs, flow_manager: FlowManager) -> T
         service_groups = flow_manager.state["service_groups"]
         booking_scenario = flow_manager.state.get("booking_scenario", "separate")
         if booking_scenario == "separate":
-            first_group_services = service_groups[0]["services"]
-            first_service_name = " più ".join([svc.name for svc in first_group_services])
+            first_service_name = service_groups[0]["name"]
         elif booking_scenario in ["bundle", "combined"]:
-            first_group_services = service_groups[0]["services"]
-            first_service_name = " più ".join([svc.name for svc in first_group_services])
+            first_service_name = service_groups[0]["name"]
     elif "selected_services" in flow_manager.state and flow_manager.state["selected_services"]:
         first_service = flow_manager.state["selected_services"][0]
         first_service_name = first_service.name
@@ -725,6 +1003,19 @@ async def check_cerba_membership_and_transition(args: FlowArgs, flow_manager: Fl
     # Recalculate prices in booked_slots if user is a cerba member
     booked_slots = flow_manager.state.get("booked_slots", [])
     if is_member:
+        # Bundle multiplier depends only on the booking scenario, not on the slot:
+        # decide it once instead of re-scanning service_groups per booked slot
+        booking_scenario = flow_manager.state.get("booking_scenario", "legacy")
+        service_groups = flow_manager.state.get("service_groups", [])
+        is_bundled = False
+        service_count = 1
+        if booking_scenario in ["bundle", "separate"] and service_groups:
+            for group in service_groups:
+                if group.get("is_group", False) and len(group["services"]) > 1:
+                    is_bundled = True
+                    service_count = len(group["services"])
+                    break
+
         for slot_data in booked_slots:
             health_services = slot_data.get("health_services", [])
             if health_services:
@@ -732,19 +1023,6 @@ async def check_cerba_membership_and_transition(args: FlowArgs, flow_manager: Fl
                 cerba_price = service.get("cerba_card_price")
                 if cerba_price is not None:
                     # Recalculate with cerba pricing (handle bundle multiplication)
-                    booking_scenario = flow_manager.state.get("booking_scenario", "legacy")
-                    service_groups = flow_manager.state.get("service_groups", [])
-
-                    # Check if this slot belongs to a bundled group
-                    is_bundled = False
-                    service_count = 1
-                    if booking_scenario in ["bundle", "separate"] and service_groups:
-                        for group in service_groups:
-                            if group.get("is_group", False) and len(group["services"]) > 1:
-                                is_bundled = True
-                                service_count = len(group["services"])
-                                break
-
                     old_price = slot_data.get("price", 0)
                     if is_bundled and service_count > 1:
                         slot_data["price"] = cerba_price * service_count
@@ -775,10 +1053,7 @@ async def auto_search_first_available(flow_manager: FlowManager) -> Tuple[Dict[s
     Replicates the first_available_mode logic from collect_datetime_and_transition.
     User can change date later via slot_selection_node's search_different_date handler.
     """
-    italian_tz = ZoneInfo("Europe/Rome")
-    today = datetime.now(italian_tz)
-    tomorrow = today + timedelta(days=1)
-    preferred_date = tomorrow.strftime('%Y-%m-%d')
+    _, preferred_date = _get_today_tomorrow(flow_manager)
 
     # Set state for first available mode
     flow_manager.state["preferred_date"] = preferred_date
@@ -789,13 +1064,10 @@ async def auto_search_first_available(flow_manager: FlowManager) -> Tuple[Dict[s
     flow_manager.state["preferred_time"] = "first available"
     logger.info(f"🎯 AUTO FIRST AVAILABLE - searching from TOMORROW: {preferred_date}")
 
-    # Get required data from state
-    selected_services = flow_manager.state.get("selected_services", [])
-    selected_center = flow_manager.state.get("selected_center")
-    patient_gender = flow_manager.state.get("patient_gender", 'm')
-    patient_dob = flow_manager.state.get("patient_dob", '1980-04-13')
-    current_service_index = flow_manager.state.get("current_service_index", 0)
-    current_service = selected_services[current_service_index] if selected_services else None
+    # Set pending_slot_search_params for perform_slot_search_and_transition
+    params = _build_pending_params(flow_manager.state, preferred_date, None, None, "any time")
+    flow_manager.state["pending_slot_search_params"] = params
+    current_service = params["current_service"]
 
     # Get correct service name based on booking scenario
     booking_scenario = flow_manager.state.get("booking_scenario", "legacy")
@@ -803,27 +1075,12 @@ async def auto_search_first_available(flow_manager: FlowManager) -> Tuple[Dict[s
     if booking_scenario in ("separate", "bundle", "combined") and service_groups:
         current_group_index = flow_manager.state.get("current_group_index", 0)
         if current_group_index < len(service_groups):
-            group_services = service_groups[current_group_index]["services"]
-            service_name = " più ".join([svc.name for svc in group_services])
+            service_name = service_groups[current_group_index]["name"]
         else:
             service_name = current_service.name if current_service else "il servizio"
     else:
         service_name = current_service.name if current_service else "il servizio"
 
-    # Set pending_slot_search_params for perform_slot_search_and_transition
-    flow_manager.state["pending_slot_search_params"] = {
-        "selected_center": selected_center,
-        "selected_services": selected_services,
-        "preferred_date": preferred_date,
-        "start_time": None,
-        "end_time": None,
-        "time_preference": "any time",
-        "patient_gender": patient_gender,
-        "patient_dob": patient_dob,
-        "current_service_index": current_service_index,
-        "current_service": current_service
-    }
-
     # Doctor-specific booking: fetch doctors
     if flow_manager.state.get("doctor_booking_mode"):
         tts_service = flow_manager.state.get("tts_service")
@@ -850,11 +1107,16 @@ async def collect_datetime_and_transition(args: FlowArgs, flow_manager: FlowMana
     if not preferred_date:
         return {"success": False, "message": "Please provide a date for your appointment"}, None
 
+    # Every branch below searches for the current selected service
+    if not flow_manager.state.get("selected_services"):
+        from flows.nodes.completion import create_error_node
+        return {"success": False, "message": "No services selected"}, create_error_node("No services selected. Please start over.")
+
     try:
         # Handle "FIRST AVAILABLE" mode - USE 24H MINIMUM
         if first_available_mode:
             min_dt = get_min_booking_time()
-            preferred_date = min_dt.strftime('%Y-%m-%d')
+            preferred_date = min_dt.date().isoformat()
             # Set start_time floor so API only returns slots ≥24h from now
             min_start_time = min_dt.strftime('%Y-%m-%d %H:%M:%S+00')
 
@@ -866,13 +1128,11 @@ async def collect_datetime_and_transition(args: FlowArgs, flow_manager: FlowMana
             flow_manager.state["preferred_time"] = "first available"
             logger.info(f"🎯 FIRST AVAILABLE MODE ACTIVATED - searching from TOMORROW: {preferred_date}")
 
-            # Get required data for slot search
-            selected_services = flow_manager.state.get("selected_services", [])
-            selected_center = flow_manager.state.get("selected_center")
-            patient_gender = flow_manager.state.get("patient_gender", 'm')
-            patient_dob = flow_manager.state.get("patient_dob", '1980-04-13')
-            current_service_index = flow_manager.state.get("current_service_index", 0)
-            current_service = selected_services[current_service_index] if selected_services else None
+            # CRITICAL: Set pending_slot_search_params for perform_slot_search_and_transition
+            params = _build_pending_params(flow_manager.state, preferred_date, min_start_time, None, "any time")
+            flow_manager.state["pending_slot_search_params"] = params
+            logger.info(f"✅ Set pending_slot_search_params for first available mode")
+            current_service = params["current_service"]
 
             # Get correct service name based on booking scenario (separate uses service_groups)
             booking_scenario = flow_manager.state.get("booking_scenario", "legacy")
@@ -880,27 +1140,11 @@ async def collect_datetime_and_transition(args: FlowArgs, flow_manager: FlowMana
             if booking_scenario in ("separate", "bundle", "combined") and service_groups:
                 current_group_index = flow_manager.state.get("current_group_index", 0)
                 if current_group_index < len(service_groups):
-                    group_services = service_groups[current_group_index]["services"]
-                    service_name = " più ".join([svc.name for svc in group_services])
+                    service_name = service_groups[current_group_index]["name"]
                 else:
-                    service_name = current_service.name if current_service else "il servizio"
+                    service_name = current_service.name
             else:
-                service_name = current_service.name if current_service else "il servizio"
-
-            # CRITICAL: Set pending_slot_search_params for perform_slot_search_and_transition
-            flow_manager.state["pending_slot_search_params"] = {
-                "selected_center": selected_center,
-                "selected_services": selected_services,
-                "preferred_date": preferred_date,
-                "start_time": min_start_time,
-                "end_time": None,
-                "time_preference": "any time",
-                "patient_gender": patient_gender,
-                "patient_dob": patient_dob,
-                "current_service_index": current_service_index,
-                "current_service": current_service
-            }
-            logger.info(f"✅ Set pending_slot_search_params for first available mode")
+                service_name = current_service.name
 
             # Doctor-specific booking: fetch doctors even in first available mode
             if flow_manager.state.get("doctor_booking_mode"):
@@ -916,44 +1160,33 @@ async def collect_datetime_and_transition(args: FlowArgs, flow_manager: FlowMana
             return await perform_slot_search_and_transition(args, flow_manager)
 
         # Parse and validate date (for normal date selection, not first available)
-        date_obj = datetime.strptime(preferred_date, "%Y-%m-%d")
+        requested_day = date.fromisoformat(preferred_date)
+        preferred_date = requested_day.isoformat()  # fromisoformat also accepts YYYYMMDD; keep YYYY-MM-DD
         min_dt = get_min_booking_time()
-        if date_obj.date() < min_dt.date():
-            earliest = min_dt.strftime('%Y-%m-%d')
+        min_day = min_dt.date()
+        if requested_day < min_day:
+            earliest = min_day.isoformat()
             return {"success": False, "message": f"La data più vicina disponibile per la prenotazione è {earliest}. Per favore scegli una data a partire da {earliest}."}, None
 
         # Store date
         flow_manager.state["preferred_date"] = preferred_date
 
         # Handle time preferences - use database time format directly (no timezone conversion)
+        range_key = _normalize_time_pref(time_preference, preferred_time)
 
-        if time_preference == "morning" or "morning" in preferred_time.lower():
-            # 08:00-12:00 time range (database format)
-            flow_manager.state["start_time"] = f"{preferred_date} 08:00:00+00"
-            flow_manager.state["end_time"] = f"{preferred_date} 12:00:00+00"
-            flow_manager.state["time_preference"] = "morning (08:00-12:00)"
-            flow_manager.state["preferred_time"] = "morning"
-            logger.info(f"📅 Date/Time collected: {preferred_date} - Morning (08:00-12:00)")
-        elif time_preference == "afternoon" or "afternoon" in preferred_time.lower():
-            # 12:00-19:00 time range (database format)
-            flow_manager.state["start_time"] = f"{preferred_date} 12:00:00+00"
-            flow_manager.state["end_time"] = f"{preferred_date} 19:00:00+00"
-            flow_manager.state["time_preference"] = "afternoon (12:00-19:00)"
-            flow_manager.state["preferred_time"] = "afternoon"
-            logger.info(f"📅 Date/Time collected: {preferred_date} - Afternoon (12:00-19:00)")
-        elif preferred_time and time_preference == "specific":
+        if range_key == "specific":
             # Parse specific time
-            time_str = preferred_time.lower().replace("am", "").replace("pm", "").strip()
-            if ":" in time_str:
-                hour, minute = map(int, time_str.split(":"))
-            else:
-                hour = int(time_str)
-                minute = 0
+            match = _TIME_RE.match(preferred_time)
+            if not match:
+                raise ValueError(f"Unrecognized time: {preferred_time}")
+            hour = int(match.group(1))
+            minute = int(match.group(2) or 0)
 
             # Handle PM times if needed
-            if "pm" in preferred_time.lower() and hour != 12:
+            ampm = (match.group(3) or "").lower()
+            if ampm == "pm" and hour != 12:
                 hour += 12
-            elif "am" in preferred_time.lower() and hour == 12:
+            elif ampm == "am" and hour == 12:
                 hour = 0
 
             # Use database time format directly (no timezone conversion)
@@ -965,44 +1198,30 @@ async def collect_datetime_and_transition(args: FlowArgs, flow_manager: FlowMana
             flow_manager.state["time_preference"] = f"specific time ({hour:02d}:{minute:02d})"
             logger.info(f"📅 Date/Time collected: {preferred_date} at {hour:02d}:{minute:02d}")
         else:
-            # No specific time preference - use full day range
-            flow_manager.state["start_time"] = None
-            flow_manager.state["end_time"] = None
-            flow_manager.state["time_preference"] = "any time"
-            flow_manager.state["preferred_time"] = "any"
-            logger.info(f"📅 Date collected: {preferred_date} - No time preference")
+            # Morning / afternoon window, or full day range when there is no preference
+            start, end, label, preferred = _TIME_RANGES[range_key]
+            flow_manager.state["start_time"] = f"{preferred_date} {start}" if start else None
+            flow_manager.state["end_time"] = f"{preferred_date} {end}" if end else None
+            flow_manager.state["time_preference"] = label
+            flow_manager.state["preferred_time"] = preferred
+            logger.info(f"📅 Date/Time collected: {preferred_date} - {label}")
 
         # 24h rule: if selected date == min_dt date, floor start_time to min_dt
-        if date_obj.date() == min_dt.date():
+        if requested_day == min_day:
             min_start = min_dt.strftime(f'{preferred_date} %H:%M:%S+00')
             current_start = flow_manager.state.get("start_time")
             if not current_start or current_start < min_start:
                 flow_manager.state["start_time"] = min_start
                 logger.info(f"⏰ 24h rule: floored start_time to {min_start}")
 
-        # Get required data for slot search
-        selected_services = flow_manager.state.get("selected_services", [])
-        selected_center = flow_manager.state.get("selected_center")
-        patient_gender = flow_manager.state.get("patient_gender", 'm')
-        patient_dob = flow_manager.state.get("patient_dob", '1980-04-13')
-        current_service_index = flow_manager.state.get("current_service_index", 0)
-        current_service = selected_services[current_service_index] if selected_services else None
-        service_name = current_service.name if current_service else "il servizio"
-        time_pref = flow_manager.state.get("time_preference", "any time")
-
         # CRITICAL: Set pending_slot_search_params for perform_slot_search_and_transition
-        flow_manager.state["pending_slot_search_params"] = {
-            "selected_center": selected_center,
-            "selected_services": selected_services,
-            "preferred_date": preferred_date,
-            "start_time": flow_manager.state.get("start_time"),
-            "end_time": flow_manager.state.get("end_time"),
-            "time_preference": time_pref,
-            "patient_gender": patient_gender,
-            "patient_dob": patient_dob,
-            "current_service_index": current_service_index,
-            "current_service": current_service
-        }
+        time_pref = flow_manager.state.get("time_preference", "any time")
+        params = _build_pending_params(
+            flow_manager.state, preferred_date,
+            flow_manager.state.get("start_time"), flow_manager.state.get("end_time"), time_pref
+        )
+        flow_manager.state["pending_slot_search_params"] = params
+        service_name = params["current_service"].name
         logger.info(f"✅ Set pending_slot_search_params for date: {preferred_date}, time_pref: {time_pref}")
 
         # Doctor-specific booking: fetch doctors and match instead of direct slot search
@@ -1033,143 +1252,122 @@ async def update_date_and_search_slots(args: FlowArgs, flow_manager: FlowManager
         return {"success": False, "message": "Please provide a date for your appointment"}, None
 
     try:
+        state = flow_manager.state
+
         # Parse and validate date (24h rule)
-        date_obj = datetime.strptime(preferred_date, "%Y-%m-%d")
+        requested_day = date.fromisoformat(preferred_date)
+        preferred_date = requested_day.isoformat()  # fromisoformat also accepts YYYYMMDD; keep YYYY-MM-DD
         min_dt = get_min_booking_time()
-        if date_obj.date() < min_dt.date():
-            earliest = min_dt.strftime('%Y-%m-%d')
+        min_day = min_dt.date()
+        if requested_day < min_day:
+            earliest = min_day.isoformat()
             return {"success": False, "message": f"La data più vicina disponibile per la prenotazione è {earliest}. Per favore scegli una data a partire da {earliest}."}, None
 
         # Store new date
-        flow_manager.state["preferred_date"] = preferred_date
-        logger.info(f"📅 Updated preferred date to: {preferred_date}")
+        state["preferred_date"] = preferred_date
+        logger.debug("📅 Updated preferred date to: {}", preferred_date)
 
         # 24h rule: if selected date == min_dt date, floor start_time to min_dt
-        if date_obj.date() == min_dt.date():
+        if requested_day == min_day:
             min_start = min_dt.strftime(f'{preferred_date} %H:%M:%S+00')
-            flow_manager.state["start_time"] = min_start
+            state["start_time"] = min_start
             logger.info(f"⏰ 24h rule: floored start_time to {min_start}")
 
         # Handle time preference
         if time_preference == "preserve_existing":
             # Keep existing time preference if available
-            existing_time_pref = flow_manager.state.get("time_preference", "any time")
-            logger.info(f"🕐 Preserving existing time preference: {existing_time_pref}")
+            existing_time_pref = state.get("time_preference", "any time")
+            logger.debug("🕐 Preserving existing time preference: {}", existing_time_pref)
         else:
             # Check if this is an automatic search for 2nd+ service (separate scenario)
-            auto_start_time = flow_manager.state.get("auto_start_time")
+            auto_start_time = state.get("auto_start_time")
 
             if auto_start_time:
                 # Automatic scheduling for 2nd+ services: start from calculated time
-                flow_manager.state["start_time"] = f"{preferred_date} {auto_start_time}:00+00"
-                flow_manager.state["end_time"] = None  # No end time constraint
-                flow_manager.state["time_preference"] = f"any time from {auto_start_time} onwards"
+                state["start_time"] = f"{preferred_date} {auto_start_time}:00+00"
+                state["end_time"] = None  # No end time constraint
+                state["time_preference"] = f"any time from {auto_start_time} onwards"
                 logger.info(f"⏰ AUTOMATIC TIME CONSTRAINT: Starting from {auto_start_time}")
-            elif time_preference == "morning":
-                flow_manager.state["start_time"] = f"{preferred_date} 08:00:00+00"
-                flow_manager.state["end_time"] = f"{preferred_date} 12:00:00+00"
-                flow_manager.state["time_preference"] = "morning (08:00-12:00)"
-            elif time_preference == "afternoon":
-                flow_manager.state["start_time"] = f"{preferred_date} 12:00:00+00"
-                flow_manager.state["end_time"] = f"{preferred_date} 19:00:00+00"
-                flow_manager.state["time_preference"] = "afternoon (12:00-19:00)"
             else:
-                # 'any' preference - no time constraints
-                flow_manager.state["start_time"] = None
-                flow_manager.state["end_time"] = None
-                flow_manager.state["time_preference"] = "any time"
+                # Morning / afternoon window, or no time constraints for 'any'
+                start, end, label, _ = _TIME_RANGES[_normalize_time_pref(time_preference)]
+                state["start_time"] = f"{preferred_date} {start}" if start else None
+                state["end_time"] = f"{preferred_date} {end}" if end else None
+                state["time_preference"] = label
 
-            logger.info(f"🕐 Updated time preference to: {flow_manager.state.get('time_preference')}")
+            logger.debug("🕐 Updated time preference to: {}", state.get("time_preference"))
 
         # Immediately perform slot search with updated parameters
-        selected_center = flow_manager.state.get("selected_center")
-        selected_services = flow_manager.state.get("selected_services", [])
-        start_time = flow_manager.state.get("start_time")
-        end_time = flow_manager.state.get("end_time")
-        patient_gender = flow_manager.state.get("patient_gender", 'm')
-        patient_dob = flow_manager.state.get("patient_dob", "1980-04-13")
+        selected_center = state.get("selected_center")
+        selected_services = state.get("selected_services", [])
+        start_time = state.get("start_time")
+        end_time = state.get("end_time")
+        patient_gender = state.get("patient_gender", 'm')
+        patient_dob = state.get("patient_dob", "1980-04-13")
 
         if not selected_center or not selected_services:
             from flows.nodes.completion import create_error_node
             return {"success": False, "message": "Missing booking details"}, create_error_node("Missing booking details. Please start over.")
 
         # Format DOB for API
-        dob_formatted = patient_dob.replace("-", "")
-
-        # Determine service UUIDs - ALWAYS use current_group_index to get correct service
-        current_group_index = flow_manager.state.get("current_group_index", 0)
-        service_groups = flow_manager.state.get("service_groups", [])
-        selected_services = flow_manager.state.get("selected_services", [])
+        dob_formatted = format_dob_for_api(state, patient_dob)
 
-        # Use service groups if available (bundle/combined/separate scenarios)
-        if service_groups and current_group_index < len(service_groups):
-            current_group = service_groups[current_group_index]
-            current_group_services = current_group["services"]
-            uuid_exam = [svc.uuid for svc in current_group_services]
-            current_service_name = " più ".join([svc.name for svc in current_group_services])
-            logger.info(f"🔍 DATE UPDATE: Using service group {current_group_index} - {current_service_name}")
-        else:
-            # Fallback to legacy single-service logic
-            current_service_index = flow_manager.state.get("current_service_index", 0)
-            if selected_services and current_service_index < len(selected_services):
-                current_service = selected_services[current_service_index]
-                uuid_exam = [current_service.uuid]
-                current_service_name = current_service.name
-                logger.info(f"🔍 DATE UPDATE: Using legacy service {current_service_index} - {current_service_name}")
-            else:
-                logger.error("❌ No service found for slot search!")
-                return {"success": False, "message": "Service not found"}, None
-
-        logger.info(f"🔍 Searching slots for {current_service_name} on {preferred_date}")
-
-        # Call list_slot in executor to avoid blocking event loop
-        import asyncio
-        loop = asyncio.get_event_loop()
+        # Determine service UUIDs for the current group/service of the booking scenario
+        current_service_index = state.get("current_service_index", 0)
+        try:
+            uuid_exam, uuid_joined, current_service_name = _resolve_slot_search_target(state, selected_services, current_service_index)
+        except ValueError:
+            logger.error("❌ No service found for slot search!")
+            return {"success": False, "message": "Service not found"}, None
+        logger.info(f"🔍 DATE UPDATE: Searching slots for {current_service_name} on {preferred_date}")
 
+        slot_kwargs = dict(
+            health_center_uuid=selected_center.uuid,
+            date_search=preferred_date,
+            uuid_exam=uuid_exam,
+            gender=patient_gender,
+            date_of_birth=dob_formatted,
+            start_time=start_time,
+            end_time=end_time
+        )
         # Include providing_entity filter for doctor-specific booking
-        slot_extra = {}
-        pe_uuid = flow_manager.state.get("providing_entity_uuid")
+        pe_uuid = state.get("providing_entity_uuid")
         if pe_uuid:
-            slot_extra["providing_entity"] = pe_uuid
+            slot_kwargs["providing_entity"] = pe_uuid
 
-        slots_response = await loop.run_in_executor(
-            None,
-            lambda: list_slot(
-                health_center_uuid=selected_center.uuid,
-                date_search=preferred_date,
-                uuid_exam=uuid_exam,
-                gender=patient_gender,
-                date_of_birth=dob_formatted,
-                start_time=start_time,
-                end_time=end_time,
-                **slot_extra
-            )
-        )
+        # Same date and time range re-confirmed: re-render the slots we already have
+        slots_response = _reusable_slots(flow_manager, slot_kwargs)
+        if slots_response is not None:
+            logger.info(f"⚡ Reusing {len(slots_response)} slots already found for {preferred_date}")
+        else:
+            # Call list_slot in a worker thread to avoid blocking event loop
+            slots_response = await asyncio.to_thread(cached_list_slot, **slot_kwargs)
 
         if slots_response and len(slots_response) > 0:
             # Store available slots
-            flow_manager.state["available_slots"] = slots_response
+            state["available_slots"] = slots_response
+            _remember_slot_search(flow_manager, slot_kwargs, slots_response)
 
             logger.success(f"✅ Found {len(slots_response)} available slots for {preferred_date}")
 
             # Create new slot selection node with the found slots
             from flows.nodes.booking import create_slot_selection_node
 
-            user_preferred_date = flow_manager.state.get("preferred_date")
-            time_preference_state = flow_manager.state.get("time_preference", "any time")
+            user_preferred_date = state.get("preferred_date")
+            time_preference_state = state.get("time_preference", "any time")
 
             # Get booking scenario from state
-            booking_scenario = flow_manager.state.get("booking_scenario", "legacy")
+            booking_scenario = state.get("booking_scenario", "legacy")
 
             # Create display service object
             if booking_scenario != "legacy":
-                display_service = type('DisplayService', (), {
-                    'name': current_service_name,
-                    'uuid': uuid_exam[0] if len(uuid_exam) == 1 else ','.join(uuid_exam),
-                    'code': 'MULTI' if len(uuid_exam) > 1 else 'N/A'
-                })()
+                display_service = DisplayService(
+                    name=current_service_name,
+                    uuid=uuid_joined,
+                    code='MULTI' if len(uuid_exam) > 1 else 'N/A'
+                )
             else:
-                display_service = current_service
+                display_service = selected_services[current_service_index]
 
             return {
                 "success": True,
@@ -1179,10 +1377,10 @@ async def update_date_and_search_slots(args: FlowArgs, flow_manager: FlowManager
             }, create_slot_selection_node(
                 slots=slots_response,
                 service=display_service,
-                is_cerba_member=flow_manager.state.get("is_cerba_member", False),
+                is_cerba_member=state.get("is_cerba_member", False),
                 user_preferred_date=user_preferred_date,
                 time_preference=time_preference_state,
-                slot_cache=flow_manager.state.setdefault("slot_cache", {})
+                slot_cache=state.setdefault("slot_cache", {})
             )
         else:
             error_message = f"No available slots found for {current_service_name} on {preferred_date}"
@@ -1190,12 +1388,12 @@ async def update_date_and_search_slots(args: FlowArgs, flow_manager: FlowManager
 
             # Go to no slots node with suggestion for different dates
             from flows.nodes.booking import create_no_slots_node
-            has_booked = bool(flow_manager.state.get("booked_slots"))
+            has_booked = bool(state.get("booked_slots"))
             booked_info = _build_booked_slots_summary(flow_manager) if has_booked else ""
             return {
                 "success": False,
                 "message": error_message
-            }, create_no_slots_node(preferred_date, flow_manager.state.get("time_preference", "any time"), has_booked_slots=has_booked, booked_slots_info=booked_info, service_name=current_service_name)
+            }, create_no_slots_node(preferred_date, state.get("time_preference", "any time"), has_booked_slots=has_booked, booked_slots_info=booked_info, service_name=current_service_name)
 
     except (ValueError, TypeError) as e:
         logger.error(f"Date parsing error: {e}")
@@ -1212,30 +1410,16 @@ async def search_slots_and_transition(args: FlowArgs, flow_manager: FlowManager)
         start_time = flow_manager.state.get("start_time")  # Optional
         end_time = flow_manager.state.get("end_time")      # Optional
         time_preference = flow_manager.state.get("time_preference", "any time")
-        patient_gender = flow_manager.state.get("patient_gender", 'm')
-        patient_dob = flow_manager.state.get("patient_dob", '1980-04-13')
         current_service_index = flow_manager.state.get("current_service_index", 0)
         
         if not all([selected_center, selected_services, preferred_date]):
             from flows.nodes.completion import create_error_node
             return {"success": False, "message": "Missing booking information"}, create_error_node("Missing booking information. Please restart.")
         
-        # Get current service being processed
-        current_service = selected_services[current_service_index]
-
         # Store slot search parameters for processing node
-        flow_manager.state["pending_slot_search_params"] = {
-            "selected_center": selected_center,
-            "selected_services": selected_services,
-            "preferred_date": preferred_date,
-            "start_time": start_time,
-            "end_time": end_time,
-            "time_preference": time_preference,
-            "patient_gender": patient_gender,
-            "patient_dob": patient_dob,
-            "current_service_index": current_service_index,
-            "current_service": current_service
-        }
+        params = _build_pending_params(flow_manager.state, preferred_date, start_time, end_time, time_preference)
+        flow_manager.state["pending_slot_search_params"] = params
+        current_service = params["current_service"]
 
         # Speak TTS filler directly via pipeline
         if len(selected_services) > 1:
@@ -1260,17 +1444,17 @@ async def search_slots_and_transition(args: FlowArgs, flow_manager: FlowManager)
 async def retry_slot_selection_handler(args: FlowArgs, flow_manager: FlowManager):
     """Go back to slot search from booking_error, preserving patient/center state"""
     logger.info("🔄 Retrying slot selection from booking_error — clearing slot state only")
-    for key in ["available_slots", "cached_all_slots", "cached_search_params",
-                "slot_cache", "selected_slot", "first_available_mode"]:
+    for key in (*_SLOT_STATE_KEYS, "selected_slot"):
         flow_manager.state.pop(key, None)
     return await perform_slot_search_and_transition(args, flow_manager)
 
 
 async def perform_slot_search_and_transition(args: FlowArgs, flow_manager: FlowManager) -> Tuple[Dict[str, Any], NodeConfig]:
     """Perform the actual slot search after TTS message"""
+    state = flow_manager.state
     try:
         # Get stored slot search parameters
-        params = flow_manager.state.get("pending_slot_search_params", {})
+        params = state.get("pending_slot_search_params", {})
         if not params:
             from flows.nodes.completion import create_error_node
             return {
@@ -1291,126 +1475,31 @@ async def perform_slot_search_and_transition(args: FlowArgs, flow_manager: FlowM
         current_service = params["current_service"]
 
         # Format date of birth for API (remove dashes)
-        dob_formatted = patient_dob.replace("-", "")
+        dob_formatted = format_dob_for_api(state, patient_dob)
 
         # === STEP 2.1: Determine booking scenario and service UUIDs ===
-        logger.info("=" * 80)
-        logger.info("🔍 SLOT SEARCH: Determining booking scenario...")
-        logger.info("=" * 80)
-
-        booking_scenario = flow_manager.state.get("booking_scenario", "legacy")
-        service_groups = flow_manager.state.get("service_groups", [])
-
-        logger.info(f"📋 Booking Scenario: {booking_scenario}")
-        logger.info(f"📊 Service Groups Count: {len(service_groups)}")
+        booking_scenario = state.get("booking_scenario", "legacy")
+        service_groups = state.get("service_groups", [])
+        logger.opt(lazy=True).debug(
+            "{}\n🔍 SLOT SEARCH: Determining booking scenario...\n{}\n📋 Booking Scenario: {}\n📊 Service Groups Count: {}",
+            lambda: _SEP, lambda: _SEP, lambda: booking_scenario,
+            lambda: len(service_groups),
+        )
 
         # Determine uuid_exam and service_name based on scenario
-        uuid_exam = []
-        current_service_name = ""
-
-        if booking_scenario == "bundle":
-            # Scenario 1: Multiple services bundled together (group=true)
-            # Pass ALL UUIDs from the single group as a list
-            logger.info("🎁 BUNDLE SCENARIO: Multiple services bundled together")
-
-            if not service_groups or len(service_groups) == 0:
-                logger.error("❌ Bundle scenario but no service groups found!")
-                raise ValueError("Bundle scenario but no service groups")
-
-            all_services = service_groups[0]["services"]
-            uuid_exam = [svc.uuid for svc in all_services]
-            current_service_name = " più ".join([svc.name for svc in all_services])
-
-            logger.info(f"   Services in bundle: {len(all_services)}")
-            for idx, svc in enumerate(all_services):
-                logger.info(f"   [{idx+1}] {svc.name} (UUID: {svc.uuid})")
-            logger.info(f"   UUID list for API: {uuid_exam}")
-
-        elif booking_scenario == "combined":
-            # Scenario 2: Services combined into single service (single group, group=false)
-            # Pass single UUID
-            logger.info("🔗 COMBINED SCENARIO: Services combined into one service")
-
-            if not service_groups or len(service_groups) == 0:
-                logger.error("❌ Combined scenario but no service groups found!")
-                raise ValueError("Combined scenario but no service groups")
-
-            single_service = service_groups[0]["services"][0]
-            uuid_exam = [single_service.uuid]
-            current_service_name = single_service.name
-
-            logger.info(f"   Combined service: {single_service.name}")
-            logger.info(f"   UUID: {single_service.uuid}")
-
-        elif booking_scenario == "separate":
-            # Scenario 3: Multiple groups, each needs separate booking (all group=false)
-            # Pass current group's UUIDs
-            logger.info("📦 SEPARATE SCENARIO: Multiple groups, booking separately")
-
-            current_group_index = flow_manager.state.get("current_group_index", 0)
-            logger.info(f"   Current group index: {current_group_index} of {len(service_groups)}")
-
-            if current_group_index >= len(service_groups):
-                logger.error(f"❌ Invalid group index {current_group_index} for {len(service_groups)} groups!")
-                raise ValueError("Invalid group index")
-
-            current_group = service_groups[current_group_index]
-            current_group_services = current_group["services"]
-            uuid_exam = [svc.uuid for svc in current_group_services]
-            current_service_name = " più ".join([svc.name for svc in current_group_services])
-
-            logger.info(f"   Services in current group: {len(current_group_services)}")
-            for idx, svc in enumerate(current_group_services):
-                logger.info(f"   [{idx+1}] {svc.name} (UUID: {svc.uuid})")
-            logger.info(f"   UUID list for API: {uuid_exam}")
-
-        elif booking_scenario == "doctor_specific":
-            # Doctor-specific booking: single service, filtered by providing_entity
-            logger.info("🩺 DOCTOR-SPECIFIC SCENARIO: Using selected service with providing_entity filter")
-
-            if not selected_services or len(selected_services) == 0:
-                logger.error("❌ Doctor-specific mode but no selected_services found!")
-                raise ValueError("No services available for booking")
-
-            current_service = selected_services[current_service_index]
-            uuid_exam = [current_service.uuid]
-            current_service_name = current_service.name
-
-            logger.info(f"   Service: {current_service.name}")
-            logger.info(f"   UUID: {current_service.uuid}")
-            logger.info(f"   Providing entity: {params.get('providing_entity', 'N/A')}")
-
-        else:  # legacy fallback
-            # Legacy mode: Use original selected_services approach (pre-sorting API)
-            logger.info("🔄 LEGACY SCENARIO: Using original selected_services")
-            logger.warning("⚠️  Sorting API was not used or failed - falling back to legacy mode")
-
-            if not selected_services or len(selected_services) == 0:
-                logger.error("❌ Legacy mode but no selected_services found!")
-                raise ValueError("No services available for booking")
-
-            current_service = selected_services[current_service_index]
-            uuid_exam = [current_service.uuid]
-            current_service_name = current_service.name
-
-            logger.info(f"   Service: {current_service.name}")
-            logger.info(f"   UUID: {current_service.uuid}")
-
-        logger.info(f"🎯 Final slot search parameters:")
-        logger.info(f"   Service(s): {current_service_name}")
-        logger.info(f"   UUID(s): {uuid_exam}")
-        logger.info(f"   Date: {preferred_date}")
-        logger.info(f"   Time preference: {time_preference}")
-        logger.info(f"   Health Center: {selected_center.name}")
-        logger.info(f"👤 Patient: Gender={patient_gender}, DOB={dob_formatted}")
-        logger.info("=" * 80)
+        uuid_exam, uuid_joined, current_service_name = _resolve_slot_search_target(state, selected_services, current_service_index)
+        if booking_scenario == "doctor_specific":
+            logger.debug("   Providing entity: {}", params.get("providing_entity", "N/A"))
+
+        logger.info(f"🎯 Slot search: {current_service_name} on {preferred_date} ({time_preference}) at {selected_center.name}")
+        logger.debug(
+            "   UUID(s): {}\n👤 Patient: Gender={}, DOB={}\n{}",
+            uuid_exam, patient_gender, dob_formatted, _SEP,
+        )
 
         # === STEP 2.2: Call slot search API with determined UUIDs (with retry) ===
-        # Run in executor to avoid blocking event loop (lets TTS filler play during API call)
-        logger.info(f"🔍 Calling list_slot API with retry...")
+        # Run in a worker thread to avoid blocking event loop (lets TTS filler play during API call)
 
-        import asyncio
-        loop = asyncio.get_event_loop()
         # Build slot search kwargs (include providing_entity if doctor-specific)
         slot_kwargs = dict(
             health_center_uuid=selected_center.uuid,
@@ -1426,21 +1515,36 @@ async def perform_slot_search_and_transition(args: FlowArgs, flow_manager: FlowM
             slot_kwargs["providing_entity"] = providing_entity
             logger.info(f"🩺 Filtering slots by providing_entity: {providing_entity}")
 
-        slots_response, slot_error = await loop.run_in_executor(
-            None,
-            lambda: retry_api_call(
-                api_func=list_slot,
+        # Reuse a speculative first-available search if one matches this whole-day search
+        prefetched = None
+        if end_time is None and not state.get("auto_start_time"):
+            prefetch_key = _first_available_prefetch_key(
+                selected_center.uuid, preferred_date, uuid_exam, patient_gender, dob_formatted, providing_entity
+            )
+            prefetched = _take_prefetched_first_available(flow_manager, prefetch_key)
+
+        slots_response, slot_error = None, None
+        if prefetched is not None:
+            try:
+                slots_response = await prefetched
+                logger.info(f"⚡ Using prefetched first available slots for {preferred_date}")
+            except Exception as e:
+                logger.warning(f"⚠️ Prefetched slot search failed, searching again: {e}")
+                prefetched = None
+
+        if prefetched is None:
+            slots_response, slot_error = await asyncio.to_thread(
+                retry_api_call,
+                api_func=cached_list_slot,
                 max_retries=2,
                 retry_delay=1.0,
                 func_name="Slot Search API",
                 **slot_kwargs
             )
-        )
 
         # Handle API failure after all retries
         if slot_error:
             logger.error(f"❌ Slot search failed after 2 retries: {slot_error}")
-            from flows.nodes.transfer import create_transfer_node_with_escalation
             return {
                 "success": False,
                 "error": str(slot_error),
@@ -1452,19 +1556,27 @@ async def perform_slot_search_and_transition(args: FlowArgs, flow_manager: FlowM
         if start_time and slots_response:
             original_count = len(slots_response)
 
-            # Parse constraint time
             try:
-                # start_time format: "2025-11-17 14:40:00+00"
-                constraint_dt = datetime.fromisoformat(start_time.replace('+00', '+00:00'))
+                # start_time format: "2025-11-17 14:40:00+00"; slots: "2025-11-17T14:40:00+00:00".
+                # Both UTC, so compare normalized strings and only parse timestamps that aren't
+                constraint_key = _utc_sort_key(start_time)
+                constraint_dt = None
 
                 # Filter slots: only keep slots that start at or after the constraint time
                 filtered_slots = []
                 for slot in slots_response:
                     slot_start = slot.get("start_time", "")
-                    if slot_start:
-                        slot_dt = datetime.fromisoformat(slot_start)
-                        if slot_dt >= constraint_dt:
+                    if not slot_start:
+                        continue
+                    slot_key = _utc_sort_key(slot_start)
+                    if constraint_key and slot_key:
+                        if slot_key >= constraint_key:
                             filtered_slots.append(slot)
+                        continue
+                    if constraint_dt is None:
+                        constraint_dt = parse_iso_datetime(start_time.replace('+00', '+00:00'))
+                    if parse_iso_datetime(slot_start) >= constraint_dt:
+                        filtered_slots.append(slot)
 
                 slots_response = filtered_slots
                 logger.info(f"🕐 CLIENT-SIDE TIME FILTER:")
@@ -1485,7 +1597,7 @@ async def perform_slot_search_and_transition(args: FlowArgs, flow_manager: FlowM
                 for slot in slots_response:
                     slot_start = slot.get("start_time", "")
                     if slot_start:
-                        slot_dt = datetime.fromisoformat(slot_start)
+                        slot_dt = parse_iso_datetime(slot_start)
                         # Make min_booking offset-naive if slot_dt is naive, or compare aware
                         if slot_dt.tzinfo is None:
                             if slot_dt >= min_booking.replace(tzinfo=None):
@@ -1504,16 +1616,16 @@ async def perform_slot_search_and_transition(args: FlowArgs, flow_manager: FlowM
 
         if slots_response and len(slots_response) > 0:
             # Store available slots and current service name
-            flow_manager.state["available_slots"] = slots_response
-            flow_manager.state["current_service_index"] = current_service_index
-            flow_manager.state["current_service_name"] = current_service_name  # Store for display
+            state["available_slots"] = slots_response
+            _remember_slot_search(flow_manager, slot_kwargs, slots_response)
+            state["current_service_index"] = current_service_index
+            state["current_service_name"] = current_service_name  # Store for display
 
             logger.success(f"✅ Found {len(slots_response)} available slots for {current_service_name}")
 
             # Price inquiry: present prices instead of slot selection
-            intent = flow_manager.state.get("intent")
+            intent = state.get("intent")
             if intent == "price_inquiry":
-                from flows.nodes.pricing import create_price_info_node
                 return {
                     "success": True,
                     "slots_count": len(slots_response),
@@ -1523,18 +1635,18 @@ async def perform_slot_search_and_transition(args: FlowArgs, flow_manager: FlowM
                     slots=slots_response,
                     service_name=current_service_name,
                     center_name=selected_center.name,
-                    doctor_name=flow_manager.state.get("matched_doctor_name"),
-                    doctor_not_found=flow_manager.state.get("doctor_not_found", False),
-                    requested_doctor=flow_manager.state.get("price_inquiry_doctor")
+                    doctor_name=state.get("matched_doctor_name"),
+                    doctor_not_found=state.get("doctor_not_found", False),
+                    requested_doctor=state.get("price_inquiry_doctor")
                 )
 
             from flows.nodes.booking import create_slot_selection_node
 
             # Pass user preferences for smart filtering
-            user_preferred_date = flow_manager.state.get("preferred_date")
+            user_preferred_date = state.get("preferred_date")
 
             # Check if first available mode is active
-            first_available_mode = flow_manager.state.get("first_available_mode", False)
+            first_available_mode = state.get("first_available_mode", False)
 
             logger.info(f"🚀 SMART FILTERING: Calling slot selection with:")
             logger.info(f"   - user_preferred_date: {user_preferred_date}")
@@ -1547,11 +1659,11 @@ async def perform_slot_search_and_transition(args: FlowArgs, flow_manager: FlowM
             # For legacy: use the existing current_service
             if booking_scenario != "legacy":
                 # Create a minimal service-like dict for slot selection node
-                display_service = type('DisplayService', (), {
-                    'name': current_service_name,
-                    'uuid': uuid_exam[0] if len(uuid_exam) == 1 else ','.join(uuid_exam),
-                    'code': 'MULTI' if len(uuid_exam) > 1 else service_groups[0]["services"][0].code if service_groups else 'N/A'
-                })()
+                display_service = DisplayService(
+                    name=current_service_name,
+                    uuid=uuid_joined,
+                    code='MULTI' if len(uuid_exam) > 1 else service_groups[0]["services"][0].code if service_groups else 'N/A'
+                )
                 logger.info(f"📋 Created display service object: {display_service.name}")
             else:
                 display_service = current_service
@@ -1559,24 +1671,25 @@ async def perform_slot_search_and_transition(args: FlowArgs, flow_manager: FlowM
 
             # CACHE ALL SLOTS FOR "SHOW MORE" REQUESTS (Hybrid First Available)
             if first_available_mode:
-                flow_manager.state["cached_all_slots"] = slots_response
-                flow_manager.state["cached_search_params"] = {
+                state["cached_all_slots"] = slots_response
+                state["cached_search_params"] = {
                     "preferred_date": user_preferred_date,
                     "time_preference": time_preference,
                     "service": {"name": current_service_name, "uuid": uuid_exam},  # Store as dict
-                    "is_cerba_member": flow_manager.state.get("is_cerba_member", False)
+                    "is_cerba_member": state.get("is_cerba_member", False)
                 }
+                _earliest_day_slots(flow_manager, slots_response)
                 logger.info(f"💾 CACHED: Stored {len(slots_response)} slots in state for 'show more' requests")
 
             # Check if this is automatic search for 2nd+ service
             is_automatic_search = False
             first_appointment_date = None
 
-            if booking_scenario == "separate" and flow_manager.state.get("current_group_index", 0) > 0:
-                auto_start_time = flow_manager.state.get("auto_start_time")
+            if booking_scenario == "separate" and state.get("current_group_index", 0) > 0:
+                auto_start_time = state.get("auto_start_time")
                 if auto_start_time:
                     is_automatic_search = True
-                    booked_slots = flow_manager.state.get("booked_slots", [])
+                    booked_slots = state.get("booked_slots", [])
                     if booked_slots:
                         first_appointment_date = booked_slots[0]["start_time"][:10]
                         logger.info(f"🤖 SLOT SELECTION: Automatic search for 2nd+ service, first appointment: {first_appointment_date}")
@@ -1590,13 +1703,13 @@ async def perform_slot_search_and_transition(args: FlowArgs, flow_manager: FlowM
             }, create_slot_selection_node(
                 slots=slots_response,
                 service=display_service,
-                is_cerba_member=flow_manager.state.get("is_cerba_member", False),
+                is_cerba_member=state.get("is_cerba_member", False),
                 user_preferred_date=user_preferred_date,
                 time_preference=time_preference,
                 first_available_mode=first_available_mode,
                 is_automatic_search=is_automatic_search,
                 first_appointment_date=first_appointment_date,
-                slot_cache=flow_manager.state.setdefault("slot_cache", {})
+                slot_cache=state.setdefault("slot_cache", {})
             )
         else:
             error_message = f"No available slots found for {current_service_name} on {preferred_date}"
@@ -1609,21 +1722,30 @@ async def perform_slot_search_and_transition(args: FlowArgs, flow_manager: FlowM
             first_appointment_date = None
             is_automatic_search = False  # Flag to indicate if this is automatic search for 2nd+ service
 
-            if booking_scenario == "separate" and flow_manager.state.get("current_group_index", 0) > 0:
+            if booking_scenario == "separate" and state.get("current_group_index", 0) > 0:
                 # This is 2nd+ service - get first appointment date constraint
-                booked_slots = flow_manager.state.get("booked_slots", [])
+                booked_slots = state.get("booked_slots", [])
                 if booked_slots:
                     first_appointment_date = booked_slots[0]["start_time"][:10]  # Extract YYYY-MM-DD
                     logger.info(f"🚫 DATE CONSTRAINT: 2nd appointment must be on/after {first_appointment_date}")
 
                 # Check if this was an automatic search (user didn't choose the date)
-                auto_start_time = flow_manager.state.get("auto_start_time")
+                auto_start_time = state.get("auto_start_time")
                 if auto_start_time:
                     is_automatic_search = True
                     logger.info(f"🤖 AUTOMATIC SEARCH: This is 2nd+ service with auto date/time")
 
+            # Patient will likely pick another date — start the first available search now,
+            # unless this search already was the earliest bookable day
+            earliest_date = get_min_booking_time().date().isoformat()
+            already_earliest = preferred_date == earliest_date and end_time is None
+            if not (already_earliest or state.get("auto_start_time") or state.get("doctor_booking_mode")):
+                _prefetch_first_available_slots(
+                    flow_manager, selected_center, uuid_exam, patient_gender, dob_formatted, providing_entity
+                )
+
             from flows.nodes.booking import create_no_slots_node
-            has_booked = bool(flow_manager.state.get("booked_slots"))
+            has_booked = bool(state.get("booked_slots"))
             booked_info = _build_booked_slots_summary(flow_manager) if has_booked else ""
             return {
                 "success": False,
@@ -1636,6 +1758,56 @@ async def perform_slot_search_and_transition(args: FlowArgs, flow_manager: FlowM
         return {"success": False, "message": "Failed to search for available slots"}, create_error_node("Failed to search slots. Please try again.")
 
 
+def _parse_slot_times(slot: dict):
+    """Italian-time (start, end, "H:MM", "H:MM - H:MM") for a slot, or None if its times can't be parsed."""
+    # IMPORTANT: Convert UTC database times to Italian local time for comparison
+    # because user selected Italian time but database has UTC times
+
+    italian_start = utc_to_italian_display(slot.get("start_time", ""))
+    italian_end = utc_to_italian_display(slot.get("end_time", ""))
+
+    try:
+        if not italian_start or not italian_end:
+            # Fallback to original method if conversion fails
+            logger.warning(f"⚠️ Timezone conversion failed for slot comparison, using UTC times")
+            start_dt = parse_iso_datetime(slot.get("start_time", "")).replace(tzinfo=None)
+            end_dt = parse_iso_datetime(slot.get("end_time", "")).replace(tzinfo=None)
+        else:
+            # Use converted Italian times for comparison
+            start_dt = parse_iso_datetime(italian_start)
+            end_dt = parse_iso_datetime(italian_end)
+    except Exception as e:
+        logger.warning(f"⚠️ Time parsing error for slot: {e}")
+        return None
+
+    # Format slot time to match selected_time format (H:MM - H:MM)
+    # f-string instead of strftime('%-H:%M'): same output, no locale work, portable
+    slot_time_start = f"{start_dt.hour}:{start_dt.minute:02d}"
+    return start_dt, end_dt, slot_time_start, f"{slot_time_start} - {end_dt.hour}:{end_dt.minute:02d}"
+
+
+def _slot_index(flow_manager: FlowManager, available_slots: list) -> Tuple[dict, list]:
+    """Parsed times for available_slots, grouped by availability UUID and in slot order.
+
+    Returns ({providing_entity_availability_uuid: [(slot, times), ...]}, [times, ...])
+    where times is the _parse_slot_times() result. Built once per slot list and
+    kept in state["_slot_index"], so selection attempts and "not available" replies
+    on the same slots look up a UUID instead of scanning and re-parsing every slot.
+    """
+    cached = flow_manager.state.get("_slot_index")
+    if cached and cached[0] is available_slots:
+        return cached[1], cached[2]
+
+    by_uuid = {}
+    parsed = []
+    for slot in available_slots:
+        slot_times = _parse_slot_times(slot)
+        parsed.append(slot_times)
+        by_uuid.setdefault(slot.get("providing_entity_availability_uuid"), []).append((slot, slot_times))
+    flow_manager.state["_slot_index"] = (available_slots, by_uuid, parsed)
+    return by_uuid, parsed
+
+
 async def select_slot_and_book(args: FlowArgs, flow_manager: FlowManager) -> Tuple[Dict[str, Any], NodeConfig]:
     """Handle slot selection and proceed to booking creation"""
     # Use (value or "") to handle explicit None from LLM
@@ -1644,7 +1816,6 @@ async def select_slot_and_book(args: FlowArgs, flow_manager: FlowManager) -> Tup
     selected_date = (args.get("selected_date") or "").strip()
 
     # Convert Italian words to numeric format if needed (e.g., "quattordici e quaranta" → "14:40")
-    from utils.italian_time import italian_words_to_time
     numeric_time = italian_words_to_time(selected_time_raw)
     if numeric_time:
         selected_time = numeric_time
@@ -1653,11 +1824,11 @@ async def select_slot_and_book(args: FlowArgs, flow_manager: FlowManager) -> Tup
         selected_time = selected_time_raw
 
     # COMPREHENSIVE DEBUG LOGGING FOR SLOT SELECTION
-    logger.info("🔍 DEBUG: === SLOT SELECTION STARTED ===")
-    logger.info(f"🔍 DEBUG: Args received: {args}")
-    logger.info(f"🔍 DEBUG: providing_entity_availability_uuid = '{providing_entity_availability_uuid}'")
-    logger.info(f"🔍 DEBUG: selected_time = '{selected_time}'")
-    logger.info(f"🔍 DEBUG: selected_date = '{selected_date}'")
+    logger.debug("🔍 DEBUG: === SLOT SELECTION STARTED ===")
+    logger.debug("🔍 DEBUG: Args received: {}", args)
+    logger.debug("🔍 DEBUG: providing_entity_availability_uuid = '{}'", providing_entity_availability_uuid)
+    logger.debug("🔍 DEBUG: selected_time = '{}'", selected_time)
+    logger.debug("🔍 DEBUG: selected_date = '{}'", selected_date)
 
     if not providing_entity_availability_uuid:
         logger.error("❌ DEBUG: No providing_entity_availability_uuid provided!")
@@ -1667,13 +1838,12 @@ async def select_slot_and_book(args: FlowArgs, flow_manager: FlowManager) -> Tup
     available_slots = flow_manager.state.get("available_slots", [])
     selected_slot = None
 
-    logger.info(f"🔍 DEBUG: available_slots count = {len(available_slots) if available_slots else 0}")
-    logger.info(f"🔍 DEBUG: available_slots = {available_slots}")
+    logger.debug("🔍 DEBUG: available_slots count = {}", len(available_slots) if available_slots else 0)
+    logger.trace("🔍 DEBUG: available_slots = {}", available_slots)
 
     logger.info(f"🔍 Searching for slot: UUID={providing_entity_availability_uuid}, Time={selected_time}, Date={selected_date}")
 
     # SMART LOOKUP: Check date-keyed slot_cache for precise date+time matching
-    from utils.date_parser import parse_readable_date
     slot_cache = flow_manager.state.get("slot_cache", {})
     date_key = parse_readable_date(selected_date) if selected_date else None
 
@@ -1698,107 +1868,83 @@ async def select_slot_and_book(args: FlowArgs, flow_manager: FlowManager) -> Tup
     if not selected_slot:
         logger.info(f"🔍 FALLBACK: Using traditional UUID/time matching in all {len(available_slots)} slots")
 
-        for slot in available_slots:
-            if slot.get("providing_entity_availability_uuid") == providing_entity_availability_uuid:
-                # If we have time info, use it for precise matching
-                if selected_time:
-                    # IMPORTANT: Convert UTC database times to Italian local time for comparison
-                    # because user selected Italian time but database has UTC times
-                    from services.timezone_utils import utc_to_italian_display
-
-                    italian_start = utc_to_italian_display(slot.get("start_time", ""))
-                    italian_end = utc_to_italian_display(slot.get("end_time", ""))
+        # selected_time-derived values are the same for every slot
+        # Normalize times for comparison (remove leading zeros from both)
+        normalized_selected = selected_time.lstrip('0').replace(':0', ':') if selected_time.startswith('0') else selected_time
+        # Start-time strings that count as an exact match
+        accepted_starts = frozenset((normalized_selected, selected_time))
+        # Also parse selected_time to check if it falls within the slot range
+        selected_hm = None
+        if ':' in selected_time:
+            try:
+                hour_min = selected_time.strip().split(':')
+                hour = int(hour_min[0])
+                minute = int(hour_min[1]) if len(hour_min) > 1 else 0
+                if 0 <= hour < 24 and 0 <= minute < 60:
+                    selected_hm = (hour, minute)
+            except ValueError:
+                pass
+
+        slots_by_uuid, _ = _slot_index(flow_manager, available_slots)
+        for slot, slot_times in slots_by_uuid.get(providing_entity_availability_uuid, []):
+            # If we have time info, use it for precise matching
+            if selected_time:
+                if slot_times is None:
+                    # Continue to check other slots
+                    continue
 
-                    try:
-                        if not italian_start or not italian_end:
-                            # Fallback to original method if conversion fails
-                            logger.warning(f"⚠️ Timezone conversion failed for slot comparison, using UTC times")
-                            start_time_str = slot.get("start_time", "").replace("T", " ").replace("+00:00", "")
-                            end_time_str = slot.get("end_time", "").replace("T", " ").replace("+00:00", "")
-                            start_dt = datetime.strptime(start_time_str, "%Y-%m-%d %H:%M:%S")
-                            end_dt = datetime.strptime(end_time_str, "%Y-%m-%d %H:%M:%S")
-                        else:
-                            # Use converted Italian times for comparison
-                            start_dt = datetime.strptime(italian_start, "%Y-%m-%d %H:%M:%S")
-                            end_dt = datetime.strptime(italian_end, "%Y-%m-%d %H:%M:%S")
+                try:
+                    start_dt, end_dt, slot_time_start, slot_time_full = slot_times
 
-                        # Format slot time to match selected_time format (H:MM - H:MM)
-                        slot_time_full = f"{start_dt.strftime('%-H:%M')} - {end_dt.strftime('%-H:%M')}"
-                        slot_time_start = start_dt.strftime('%-H:%M')
+                    # Parse the selected time on the same date
+                    selected_dt = start_dt.replace(hour=selected_hm[0], minute=selected_hm[1]) if selected_hm else None
 
-                        # Normalize times for comparison (remove leading zeros from both)
-                        normalized_selected = selected_time.lstrip('0').replace(':0', ':') if selected_time.startswith('0') else selected_time
-                        normalized_slot_start = slot_time_start
+                    logger.debug(
+                        "🕐 Comparing times: slot='{}' (Italian) vs selected='{}' (normalized: '{}') vs slot_start='{}'",
+                        slot_time_full, selected_time, normalized_selected, slot_time_start
+                    )
 
-                        # Also try parsing selected_time to check if it falls within the slot range
-                        selected_dt = None
-                        try:
-                            # Parse the selected time on the same date
-                            selected_time_clean = selected_time.replace(':', ':').strip()
-                            if ':' in selected_time_clean:
-                                hour_min = selected_time_clean.split(':')
-                                hour = int(hour_min[0])
-                                minute = int(hour_min[1]) if len(hour_min) > 1 else 0
-                                selected_dt = start_dt.replace(hour=hour, minute=minute)
-                        except Exception:
-                            pass
-
-                        logger.info(f"🕐 Comparing times: slot='{slot_time_full}' (Italian) vs selected='{selected_time}' (normalized: '{normalized_selected}') vs slot_start='{normalized_slot_start}'")
-
-                        # Match multiple ways:
-                        # 1. Exact slot start time match (normalized)
-                        # 2. Selected time falls within slot time range
-                        # 3. Full format match
-                        time_matches = (
-                            normalized_slot_start == normalized_selected or  # Start time match
-                            normalized_slot_start == selected_time or        # Direct match
-                            slot_time_start == selected_time or              # Exact match
-                            slot_time_full == selected_time or               # Full range match
-                            (selected_dt and start_dt <= selected_dt < end_dt)  # Falls within range
-                        )
+                    # Match multiple ways:
+                    # 1. Exact slot start time match (normalized or direct)
+                    # 2. Selected time falls within slot time range
+                    # 3. Full format match
+                    time_matches = (
+                        slot_time_start in accepted_starts or            # Start time match
+                        slot_time_full == selected_time or               # Full range match
+                        (selected_dt and start_dt <= selected_dt < end_dt)  # Falls within range
+                    )
 
-                        if time_matches:
-                            selected_slot = slot
-                            logger.info(f"✅ Found exact time match: {slot_time_full}")
-                            break
-                    except Exception as e:
-                        logger.warning(f"⚠️ Time parsing error for slot: {e}")
-                        # Continue to check other slots
-                        continue
-                else:
-                    # Fallback to first match by UUID (old behavior)
-                    selected_slot = slot
-                    logger.warning(f"⚠️ Using UUID-only matching (no time provided)")
-                    break
+                    if time_matches:
+                        selected_slot = slot
+                        logger.info(f"✅ Found exact time match: {slot_time_full}")
+                        break
+                except Exception as e:
+                    logger.warning(f"⚠️ Time parsing error for slot: {e}")
+                    # Continue to check other slots
+                    continue
+            else:
+                # Fallback to first match by UUID (old behavior)
+                selected_slot = slot
+                logger.warning(f"⚠️ Using UUID-only matching (no time provided)")
+                break
 
     if not selected_slot:
         logger.error(f"❌ DEBUG: Slot not found: UUID={providing_entity_availability_uuid}, Time={selected_time}")
 
         # Debug: Log all available UUIDs for comparison
-        logger.error("❌ DEBUG: Available slot UUIDs:")
-        for i, slot in enumerate(available_slots):
-            uuid = slot.get("providing_entity_availability_uuid", "MISSING_UUID")
-            logger.error(f"   [{i}] UUID: {uuid}")
+        logger.opt(lazy=True).debug(
+            "❌ DEBUG: Available slot UUIDs:\n{}",
+            lambda: "\n".join(
+                f"   [{i}] UUID: {slot.get('providing_entity_availability_uuid', 'MISSING_UUID')}"
+                for i, slot in enumerate(available_slots)
+            )
+        )
 
         # Provide more helpful error message with available times (in Italian local time)
         if available_slots:
-            available_times = []
-            from services.timezone_utils import utc_to_italian_display
-
-            for slot in available_slots[:5]:  # Show first 5 available times
-                try:
-                    # Convert UTC to Italian time for user display
-                    italian_start = utc_to_italian_display(slot.get("start_time", ""))
-                    if italian_start:
-                        start_dt = datetime.strptime(italian_start, "%Y-%m-%d %H:%M:%S")
-                        available_times.append(start_dt.strftime('%-H:%M'))
-                    else:
-                        # Fallback to UTC if conversion fails
-                        start_time_str = slot.get("start_time", "").replace("T", " ").replace("+00:00", "")
-                        start_dt = datetime.strptime(start_time_str, "%Y-%m-%d %H:%M:%S")
-                        available_times.append(start_dt.strftime('%-H:%M'))
-                except:
-                    continue
+            # Show first 5 available times (Italian time, UTC if conversion failed)
+            _, parsed_times = _slot_index(flow_manager, available_slots)
+            available_times = [slot_times[2] for slot_times in parsed_times[:5] if slot_times]
 
             if available_times:
                 times_text = ", ".join(available_times)
@@ -1810,28 +1956,21 @@ async def select_slot_and_book(args: FlowArgs, flow_manager: FlowManager) -> Tup
 
         return {"success": False, "message": error_message}, None
 
-    # Store selected slot
-    logger.info(f"🔍 DEBUG: STORING selected_slot in state: {selected_slot}")
-    flow_manager.state["selected_slot"] = selected_slot
-    logger.info(f"🔍 DEBUG: State after storing selected_slot: selected_slot key exists = {'selected_slot' in flow_manager.state}")
-
     # Extract pricing — always use non-cerba price at selection time.
     # Cerba membership asked AFTER reservation, prices recalculated then.
     health_services = selected_slot.get("health_services", [])
 
-    logger.info(f"🔍 DEBUG: health_services = {health_services}")
+    logger.debug("🔍 DEBUG: health_services = {}", health_services)
 
-    slot_price = 0
-    if health_services:
-        service = health_services[0]
-        slot_price = service.get("price", 0)
-        logger.info(f"💰 Price from slot health_services: {slot_price}")
+    slot_price = health_services[0].get("price", 0) if health_services else 0
 
-    flow_manager.state["slot_price"] = slot_price
+    # Store selected slot and its price in one state write
+    logger.debug("🔍 DEBUG: STORING selected_slot in state: {}", selected_slot)
+    flow_manager.state.update(selected_slot=selected_slot, slot_price=slot_price)
     logger.info(f"💰 Stored slot_price in state: {slot_price}")
 
     logger.info(f"🎯 Slot selected: {selected_slot['start_time']} to {selected_slot['end_time']}")
-    logger.info(f"🔍 DEBUG: === SLOT SELECTION COMPLETED SUCCESSFULLY ===")
+    logger.debug("🔍 DEBUG: === SLOT SELECTION COMPLETED SUCCESSFULLY ===")
 
     # Get required data for booking
     selected_services = flow_manager.state.get("selected_services", [])
@@ -1840,12 +1979,9 @@ async def select_slot_and_book(args: FlowArgs, flow_manager: FlowManager) -> Tup
     if not selected_services or not selected_center:
         return {"success": False, "message": "Missing booking information"}, None
 
-    individual_slot_price = health_services[0].get("price", 0) if health_services else 0
-    flow_manager.state["slot_price"] = individual_slot_price
-
     logger.info(f"🎯 Going to slot booking creation:")
     logger.info(f"   Selected slot time: {selected_slot['start_time']} to {selected_slot['end_time']}")
-    logger.info(f"   Individual price: {individual_slot_price} euro")
+    logger.info(f"   Individual price: {slot_price} euro")
     logger.info(f"   Center: {selected_center.name}")
 
     # Store slot booking parameters for inline perform
@@ -1906,9 +2042,10 @@ async def _proceed_to_cerba_or_summary(flow_manager, slot_uuid) -> Tuple[Dict[st
 
 async def perform_slot_booking_and_transition(args: FlowArgs, flow_manager: FlowManager) -> Tuple[Dict[str, Any], NodeConfig]:
     """Perform the actual slot booking after TTS message"""
+    state = flow_manager.state
     try:
         # Get stored slot booking parameters
-        params = flow_manager.state.get("pending_slot_booking_params", {})
+        params = state.get("pending_slot_booking_params", {})
         if not params:
             from flows.nodes.completion import create_error_node
             return {
@@ -1927,31 +2064,26 @@ async def perform_slot_booking_and_transition(args: FlowArgs, flow_manager: Flow
         providing_entity_availability = selected_slot["providing_entity_availability_uuid"]
 
         # Convert datetime format for create_slot function
-        start_slot = start_time.replace("T", " ").replace("+00:00", "")
-        end_slot = end_time.replace("T", " ").replace("+00:00", "")
+        start_slot = utc_to_naive_string(start_time)
+        end_slot = utc_to_naive_string(end_time)
 
         # DETAILED SLOT VERIFICATION LOGGING
         logger.info("=" * 80)
         logger.info("🔍 SLOT RESERVATION VERIFICATION")
         logger.info("=" * 80)
-        logger.info(f"📋 Full Selected Slot Data:")
-        logger.info(f"   Raw slot object: {selected_slot}")
-        logger.info(f"   Start Time (original): {start_time}")
-        logger.info(f"   End Time (original): {end_time}")
-        logger.info(f"   PEA UUID: {providing_entity_availability}")
-        logger.info(f"   Converted Start: {start_slot}")
-        logger.info(f"   Converted End: {end_slot}")
+        logger.debug("   Raw slot object: {}", selected_slot)
+        logger.info("   Start: {} | End: {} | PEA UUID: {}", start_time, end_time, providing_entity_availability)
+        logger.debug("   Converted Start: {} | Converted End: {}", start_slot, end_slot)
 
         # Verify against available_slots to confirm LLM didn't hallucinate
-        available_slots = flow_manager.state.get("available_slots", [])
-        slot_found_in_available = False
-        for idx, avail_slot in enumerate(available_slots):
-            if (avail_slot.get("start_time") == start_time and
-                avail_slot.get("providing_entity_availability_uuid") == providing_entity_availability):
-                slot_found_in_available = True
-                logger.info(f"✅ VERIFIED: Slot exists in available_slots at index {idx}")
-                logger.info(f"   Available slot data: {avail_slot}")
-                break
+        available_slots = state.get("available_slots", [])
+        by_uuid, _ = _slot_index(flow_manager, available_slots)
+        slot_found_in_available = any(
+            avail_slot.get("start_time") == start_time
+            for avail_slot, _ in by_uuid.get(providing_entity_availability, ())
+        )
+        if slot_found_in_available:
+            logger.info("✅ VERIFIED: Slot exists in available_slots")
 
         if not slot_found_in_available:
             logger.error(f"❌ Selected slot NOT in available_slots — aborting to prevent stale booking")
@@ -1968,24 +2100,18 @@ async def perform_slot_booking_and_transition(args: FlowArgs, flow_manager: Flow
         logger.info("=" * 80)
         logger.info(f"📝 Proceeding with slot reservation: {start_slot} to {end_slot}")
 
-        # Call create_slot with retry in executor to avoid blocking event loop (lets TTS filler play)
-        import asyncio
-        loop = asyncio.get_event_loop()
-
-        def _create_slot_with_retry():
-            return retry_api_call(
-                api_func=lambda: create_slot(start_slot, end_slot, providing_entity_availability),
-                max_retries=2,
-                retry_delay=1.0,
-                func_name="Slot Reservation API"
-            )
-
-        slot_result, slot_error = await loop.run_in_executor(None, _create_slot_with_retry)
+        # Each create_slot attempt runs in a worker thread and the retry delay is an
+        # asyncio.sleep, so the event loop stays free (lets TTS filler play)
+        slot_result, slot_error = await retry_api_call_async(
+            api_func=lambda: asyncio.to_thread(create_slot, start_slot, end_slot, providing_entity_availability),
+            max_retries=2,
+            retry_delay=1.0,
+            func_name="Slot Reservation API"
+        )
 
         # Handle API failure after all retries
         if slot_error:
             logger.error(f"❌ Slot reservation failed after 2 retries: {slot_error}")
-            from flows.nodes.transfer import create_transfer_node_with_escalation
             return {
                 "success": False,
                 "error": str(slot_error),
@@ -1997,11 +2123,10 @@ async def perform_slot_booking_and_transition(args: FlowArgs, flow_manager: Flow
         if status_code == 200 or status_code == 201:
 
             # Store slot reservation information
-            if "booked_slots" not in flow_manager.state:
-                flow_manager.state["booked_slots"] = []
+            booked_slots = state.setdefault("booked_slots", [])
 
             # Get the current service name (which may be combined for bundle/separate scenarios)
-            current_service_name = flow_manager.state.get("current_service_name", "")
+            current_service_name = state.get("current_service_name", "")
             if not current_service_name:
                 # Fallback to legacy behavior
                 current_service_name = selected_services[current_service_index].name if selected_services else "Service"
@@ -2018,9 +2143,9 @@ async def perform_slot_booking_and_transition(args: FlowArgs, flow_manager: Flow
 
                 # BUNDLED SERVICE PRICE MULTIPLICATION
                 # If this is a bundled group with multiple services, multiply the base price
-                booking_scenario = flow_manager.state.get("booking_scenario", "legacy")
-                service_groups = flow_manager.state.get("service_groups", [])
-                current_group_index = flow_manager.state.get("current_group_index", 0)
+                booking_scenario = state.get("booking_scenario", "legacy")
+                service_groups = state.get("service_groups", [])
+                current_group_index = state.get("current_group_index", 0)
 
                 if booking_scenario in ["bundle", "separate"] and service_groups and current_group_index < len(service_groups):
                     current_group = service_groups[current_group_index]
@@ -2041,7 +2166,7 @@ async def perform_slot_booking_and_transition(args: FlowArgs, flow_manager: Flow
 
             logger.info(f"📝 Storing booked slot: {current_service_name} at {start_time} - Price: {slot_price}€")
 
-            flow_manager.state["booked_slots"].append({
+            booked_slots.append({
                 "slot_uuid": slot_uuid,
                 "service_name": current_service_name,  # Use combined name for bundle/separate
                 "start_time": start_time,
@@ -2051,112 +2176,128 @@ async def perform_slot_booking_and_transition(args: FlowArgs, flow_manager: Flow
             })
 
             logger.success(f"✅ Slot reserved successfully: {slot_uuid}")
+            _invalidate_slot_searches(flow_manager)
 
             # === STEP 3.1: Check for multi-group booking (Scenario 3: Separate) ===
             logger.info("=" * 80)
             logger.info("🔍 BOOKING COMPLETION: Checking for more groups to book...")
             logger.info("=" * 80)
 
-            booking_scenario = flow_manager.state.get("booking_scenario", "legacy")
-            service_groups = flow_manager.state.get("service_groups", [])
-            current_group_index = flow_manager.state.get("current_group_index", 0)
+            booking_scenario = state.get("booking_scenario", "legacy")
+            service_groups = state.get("service_groups", [])
+            current_group_index = state.get("current_group_index", 0)
 
-            logger.info(f"📋 Booking Scenario: {booking_scenario}")
-            logger.info(f"📊 Total Service Groups: {len(service_groups)}")
-            logger.info(f"📍 Current Group Index: {current_group_index}")
+            logger.info(
+                "📋 Booking Scenario: {} | 📊 Total Service Groups: {} | 📍 Current Group Index: {}",
+                booking_scenario, len(service_groups), current_group_index
+            )
 
             # Scenario 3 (Separate): Check if more groups remain
             if booking_scenario == "separate" and current_group_index + 1 < len(service_groups):
                 # More groups to book - automatically proceed with next service
                 next_group_index = current_group_index + 1
-                flow_manager.state["current_group_index"] = next_group_index
+                state["current_group_index"] = next_group_index
 
                 next_group = service_groups[next_group_index]
-                next_group_services = next_group["services"]
-                next_group_service_names = " più ".join([svc.name for svc in next_group_services])
+                next_group_service_names = next_group["name"]
 
                 total_groups = len(service_groups)
                 progress_text = f"Appointment {next_group_index + 1} of {total_groups}"
 
-                logger.info(f"📦 MULTI-GROUP BOOKING: Moving to next group")
-                logger.info(f"   Next group index: {next_group_index}")
-                logger.info(f"   Next group services: {next_group_service_names}")
-                logger.info(f"   Progress: {progress_text}")
-                logger.info(f"   Remaining groups: {total_groups - next_group_index}")
+                logger.info("📦 MULTI-GROUP BOOKING: Moving to next group — {} ({})", next_group_service_names, progress_text)
+                logger.debug(
+                    "   Next group index: {} | Remaining groups: {}",
+                    next_group_index, total_groups - next_group_index
+                )
 
                 # Get the first booked slot to calculate automatic date/time
-                booked_slots = flow_manager.state.get("booked_slots", [])
                 if booked_slots:
                     first_slot = booked_slots[0]
                     first_slot_end_time = first_slot.get("end_time")  # UTC time string
 
                     # Calculate automatic date/time: same date, +1 hour from first service end
                     try:
-                        from datetime import datetime, timedelta
-                        from zoneinfo import ZoneInfo
+                        # The anchor is the first booked slot, so every remaining group gets the
+                        # same values: derive them once and reuse while the anchor is unchanged
+                        auto_scheduling = state.get("auto_scheduling")
+                        if auto_scheduling and auto_scheduling["anchor_end_time"] == first_slot_end_time:
+                            auto_date = auto_scheduling["auto_date"]
+                            auto_time = auto_scheduling["auto_time"]
+                            auto_time_italian = auto_scheduling["auto_time_italian"]
+                            start_time_constraint = auto_scheduling["start_time_constraint"]
+                        else:
+                            # Parse first service end time (UTC)
+                            first_end_dt = parse_iso_datetime(first_slot_end_time)
 
-                        # Parse first service end time (UTC)
-                        first_end_dt = datetime.fromisoformat(first_slot_end_time.replace('Z', '+00:00'))
+                            # Add 1 hour buffer
+                            auto_start_dt = first_end_dt + timedelta(hours=1)
 
-                        # Add 1 hour buffer
-                        auto_start_dt = first_end_dt + timedelta(hours=1)
+                            # Store automatic date/time in state for slot search
+                            auto_date = auto_start_dt.date().isoformat()
+                            auto_time = auto_start_dt.strftime("%H:%M")
 
-                        # Store automatic date/time in state for slot search
-                        auto_date = auto_start_dt.strftime("%Y-%m-%d")
-                        auto_time = auto_start_dt.strftime("%H:%M")
+                            # Convert to Italian time for user display
+                            auto_start_italian = auto_start_dt.astimezone(ITALIAN_TZ)
+                            auto_time_italian = auto_start_italian.strftime("%H:%M")
 
-                        # Convert to Italian time for user display
-                        italian_tz = ZoneInfo("Europe/Rome")
-                        auto_start_italian = auto_start_dt.astimezone(italian_tz)
-                        auto_time_italian = auto_start_italian.strftime("%H:%M")
+                            # Start time constraint in the slot API format
+                            start_time_constraint = f"{auto_date} {auto_time}:00+00"
 
-                        flow_manager.state["auto_date"] = auto_date
-                        flow_manager.state["auto_start_time"] = auto_time
-                        flow_manager.state["preferred_date"] = auto_date  # For slot search
-                        flow_manager.state["time_preference"] = "any"  # Search any time after auto start
+                            state["auto_scheduling"] = {
+                                "anchor_end_time": first_slot_end_time,
+                                "auto_date": auto_date,
+                                "auto_time": auto_time,
+                                "auto_time_italian": auto_time_italian,
+                                "start_time_constraint": start_time_constraint,
+                            }
+
+                        state["auto_date"] = auto_date
+                        state["auto_start_time"] = auto_time
+                        state["preferred_date"] = auto_date  # For slot search
+                        state["time_preference"] = "any"  # Search any time after auto start
 
                         # CRITICAL: Set start_time in the correct format for the slot API
-                        flow_manager.state["start_time"] = f"{auto_date} {auto_time}:00+00"
-                        flow_manager.state["end_time"] = None  # No end time constraint
+                        state["start_time"] = start_time_constraint
+                        state["end_time"] = None  # No end time constraint
 
                         # CRITICAL FIX: Update pending_slot_search_params with the new start_time constraint
                         # This ensures perform_slot_search_and_transition uses the updated time constraint
-                        if "pending_slot_search_params" in flow_manager.state:
-                            flow_manager.state["pending_slot_search_params"]["start_time"] = f"{auto_date} {auto_time}:00+00"
-                            flow_manager.state["pending_slot_search_params"]["end_time"] = None
-                            flow_manager.state["pending_slot_search_params"]["preferred_date"] = auto_date
+                        pending_search_params = state.get("pending_slot_search_params")
+                        if pending_search_params is not None:
+                            pending_search_params["start_time"] = start_time_constraint
+                            pending_search_params["end_time"] = None
+                            pending_search_params["preferred_date"] = auto_date
                             logger.info(f"   ✅ Updated pending_slot_search_params with time constraint")
 
-                        logger.info(f"⏰ AUTOMATIC SCHEDULING:")
-                        logger.info(f"   First service ended at: {first_slot_end_time}")
-                        logger.info(f"   Auto date: {auto_date}")
-                        logger.info(f"   Auto start time (UTC): {auto_time}")
-                        logger.info(f"   Auto start time (Italian): {auto_time_italian}")
-                        logger.info(f"   ✅ Set start_time constraint: {auto_date} {auto_time}:00+00")
-                        logger.info("=" * 80)
+                        logger.info(
+                            "⏰ AUTOMATIC SCHEDULING: {} from {} UTC ({} Italian)",
+                            auto_date, auto_time, auto_time_italian
+                        )
+                        logger.debug(
+                            "   First service ended at: {} | start_time constraint: {}",
+                            first_slot_end_time, start_time_constraint
+                        )
+                        logger.info(_SEP)
 
                     except Exception as e:
                         logger.error(f"❌ Failed to calculate automatic date/time: {e}")
                         # Fallback: use first service date
                         auto_date = first_slot.get("start_time", "").split("T")[0]
-                        flow_manager.state["auto_date"] = auto_date
-                        flow_manager.state["preferred_date"] = auto_date
-                        flow_manager.state["time_preference"] = "any"
+                        state["auto_date"] = auto_date
+                        state["preferred_date"] = auto_date
+                        state["time_preference"] = "any"
 
                 # Clear slot-related state for next booking
                 logger.info("🧹 Clearing slot state for next service (available_slots, slot_cache, etc.)")
-                flow_manager.state.pop("available_slots", None)
-                flow_manager.state.pop("cached_all_slots", None)
-                flow_manager.state.pop("cached_search_params", None)
-                flow_manager.state.pop("first_available_mode", None)
-                flow_manager.state.pop("slot_cache", None)
+                for key in _SLOT_STATE_KEYS:
+                    state.pop(key, None)
 
                 # Speak TTS filler and search slots inline (no intermediate processing node)
                 just_booked_ordinal = current_group_index + 1
                 next_appointment_ordinal = next_group_index + 1
                 user_message = f"Perfetto! L'appuntamento {just_booked_ordinal} di {total_groups} è stato prenotato con successo: {current_service_name}. Ora prenoto l'appuntamento {next_appointment_ordinal} di {total_groups}: {next_group_service_names}. Cerco orari disponibili nello stesso giorno, a partire da 1 ora dopo il primo appuntamento."
 
-                tts_service = flow_manager.state.get("tts_service")
+                tts_service = state.get("tts_service")
                 if tts_service:
                     await tts_service.queue_frame(TTSSpeakFrame(user_message))
                 return await perform_slot_search_and_transition(args, flow_manager)
@@ -2164,7 +2305,7 @@ async def perform_slot_booking_and_transition(args: FlowArgs, flow_manager: Flow
             # Legacy scenario: Check if there are more services to book (old behavior)
             elif booking_scenario == "legacy" and current_service_index + 1 < len(selected_services):
                 # More services to book - continue with slot creation for next service
-                flow_manager.state["current_service_index"] = current_service_index + 1
+                state["current_service_index"] = current_service_index + 1
                 next_service = selected_services[current_service_index + 1]
 
                 logger.info(f"🔄 LEGACY: Moving to next service")
@@ -2179,33 +2320,31 @@ async def perform_slot_booking_and_transition(args: FlowArgs, flow_manager: Flow
                 logger.info("=" * 80)
 
                 # Check if there's a pending additional service to book
-                pending = flow_manager.state.get("pending_additional_request")
-                already_resolved = flow_manager.state.get("pending_additional_resolved", False)
+                pending = state.get("pending_additional_request")
+                already_resolved = state.get("pending_additional_resolved", False)
 
                 if pending and not already_resolved:
                     logger.info(f"📋 Starting second service loop: '{pending}'")
-                    flow_manager.state.pop("pending_additional_request", None)
-                    flow_manager.state["second_service_loop_active"] = True
+                    state.pop("pending_additional_request", None)
+                    state["second_service_loop_active"] = True
 
                     # Clear first-booking slot state (keep patient data, center, booked_slots)
                     for key in ["available_slots", "cached_all_slots", "cached_search_params",
                                 "first_available_mode", "booking_scenario", "service_groups",
                                 "current_group_index", "current_service_index",
                                 "pending_slot_search_params", "selected_slot", "slot_cache"]:
-                        flow_manager.state.pop(key, None)
+                        state.pop(key, None)
 
                     # Store search term for the handler to pick up
-                    flow_manager.state["pending_search_term"] = pending
-                    flow_manager.state["second_service_search_term"] = pending
+                    state["pending_search_term"] = pending
+                    state["second_service_search_term"] = pending
 
                     # Get first service name for confirmation message
-                    booked_slots = flow_manager.state.get("booked_slots", [])
                     first_service_name = booked_slots[-1].get("service_name", "") if booked_slots else ""
                     if first_service_name:
                         tts = f"Perfetto! La prenotazione per {first_service_name} è stata confermata. Ora procediamo con {pending}."
                     else:
                         tts = f"Perfetto! La prima prenotazione è stata confermata. Ora procediamo con {pending}."
-                    from flows.nodes.second_service import create_second_service_search_node
                     return {"success": True, "slot_id": slot_uuid}, create_second_service_search_node(pending, tts)
                 else:
                     return await _proceed_to_cerba_or_summary(flow_manager, slot_uuid)
@@ -2260,7 +2399,6 @@ async def confirm_booking_summary_and_proceed(args: FlowArgs, flow_manager: Flow
 
         # Try to find existing patient
         if caller_phone and patient_dob:
-            from services.patient_lookup import lookup_by_phone_and_dob, populate_patient_state
 
             # Perform lookup
             found_patient = lookup_by_phone_and_dob(caller_phone, patient_dob)
@@ -2273,7 +2411,6 @@ async def confirm_booking_summary_and_proceed(args: FlowArgs, flow_manager: Flow
                 populate_patient_state(flow_manager, found_patient)
 
                 # Transition to patient summary confirmation
-                from flows.nodes.patient_summary import create_patient_summary_node
                 return {
                     "success": True,
                     "message": "Patient found in database, showing summary for confirmation",
@@ -2287,7 +2424,6 @@ async def confirm_booking_summary_and_proceed(args: FlowArgs, flow_manager: Flow
             logger.warning(f"⚠️ Cannot perform patient lookup: missing phone ({bool(caller_phone)}) or DOB ({bool(patient_dob)})")
 
         # Fallback: Normal full name collection flow for new patients
-        from flows.nodes.patient_details import create_collect_full_name_node
         return {
             "success": True,
             "message": "Booking confirmed, starting personal information collection",
@@ -2304,9 +2440,10 @@ async def confirm_booking_summary_and_proceed(args: FlowArgs, flow_manager: Flow
             last_uuid = last_slot.get("slot_uuid")
             if last_uuid:
                 try:
-                    delete_response = delete_slot(last_uuid)
+                    delete_response = await asyncio.to_thread(delete_slot, last_uuid)
                     if delete_response.status_code == 200:
                         logger.info(f"🗑️ Cancelled last slot for change: {last_uuid}")
+                        _invalidate_slot_searches(flow_manager)
                     else:
                         logger.warning(f"⚠️ Failed to cancel slot {last_uuid}: HTTP {delete_response.status_code}")
                 except Exception as e:
@@ -2345,19 +2482,55 @@ async def confirm_booking_summary_and_proceed(args: FlowArgs, flow_manager: Flow
         return {"success": False, "message": "Please let me know if you want to proceed or change the time slot"}, None
 
 
+def _earliest_day_slots(flow_manager: FlowManager, cached_slots: list) -> Tuple[str, list, int]:
+    """Earliest Italian date among cached_slots and the slots on that date.
+
+    Returns (earliest_date, same_day_slots, parsed_count); earliest_date is None if
+    no slot could be parsed. Computed when the "show more" cache is written and
+    kept in state["_cached_earliest_day"], so the handler only filters.
+    """
+    cached = flow_manager.state.get("_cached_earliest_day")
+    if cached and cached[0] is cached_slots:
+        return cached[1]
+
+    date_keys = []
+    for slot in cached_slots:
+        try:
+            # Parse slot start_time (API uses 'start_time' field, not 'datetime')
+            slot_datetime_str = slot.get('start_time', '')
+            if not slot_datetime_str:
+                logger.warning(f"⚠️ Slot missing 'start_time' field")
+                continue
+            slot_dt_local = parse_iso_datetime(slot_datetime_str).astimezone(ITALIAN_TZ)
+            date_keys.append((slot_dt_local, slot_dt_local.date().isoformat(), slot))
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to parse slot datetime: {e}")
+
+    if date_keys:
+        earliest_date = min(date_keys, key=lambda x: x[0])[1]
+        same_day = sorted((x for x in date_keys if x[1] == earliest_date), key=lambda x: x[0])
+        same_day_slots = [slot for _, _, slot in same_day]
+    else:
+        earliest_date, same_day_slots = None, []
+    result = (earliest_date, same_day_slots, len(date_keys))
+    flow_manager.state["_cached_earliest_day"] = (cached_slots, result)
+    return result
+
+
 async def show_more_same_day_slots_handler(args: FlowArgs, flow_manager: FlowManager) -> Tuple[Dict[str, Any], NodeConfig]:
     """
     Show additional slots on the same day as the earliest slot
     Uses cached slots from first available mode search
     """
+    state = flow_manager.state
     try:
         logger.info("🔍 SHOW MORE SAME DAY: User requested additional slots on same day")
 
         # Get cached data
-        cached_slots = flow_manager.state.get("cached_all_slots", [])
-        cached_params = flow_manager.state.get("cached_search_params", {})
+        cached_slots = state.get("cached_all_slots", [])
+        cached_params = state.get("cached_search_params", {})
 
-        logger.info(f"🔍 DEBUG: Found {len(cached_slots)} cached slots")
+        logger.debug("🔍 DEBUG: Found {} cached slots", len(cached_slots))
 
         if not cached_slots:
             logger.error("❌ No cached slots found - first available mode may not have been used")
@@ -2366,48 +2539,18 @@ async def show_more_same_day_slots_handler(args: FlowArgs, flow_manager: FlowMan
                 "message": "No cached slot data available. Please search for slots first."
             }, None
 
-        # Parse all cached slots and find the earliest date
-        from datetime import datetime
-        from zoneinfo import ZoneInfo
-
-        all_slots_with_dt = []
-        for slot in cached_slots:
-            try:
-                # Parse slot start_time (API uses 'start_time' field, not 'datetime')
-                slot_datetime_str = slot.get('start_time', '')
-                if not slot_datetime_str:
-                    logger.warning(f"⚠️ Slot missing 'start_time' field")
-                    continue
+        # Earliest date and its slots (precomputed when the cache was written)
+        earliest_date, same_day_slots, parsed_count = _earliest_day_slots(flow_manager, cached_slots)
 
-                slot_dt = datetime.fromisoformat(slot_datetime_str.replace('Z', '+00:00'))
-                slot_dt_local = slot_dt.astimezone(ZoneInfo("Europe/Rome"))
-
-                all_slots_with_dt.append({
-                    'slot_data': slot,
-                    'datetime': slot_dt_local,
-                    'date_key': slot_dt_local.strftime('%Y-%m-%d')
-                })
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to parse slot datetime: {e}")
-                continue
-
-        if not all_slots_with_dt:
+        if earliest_date is None:
             logger.error("❌ Could not parse any cached slots")
             return {
                 "success": False,
                 "message": "Error processing cached slots"
             }, None
 
-        # Sort by datetime and get the earliest date
-        all_slots_with_dt.sort(key=lambda x: x['datetime'])
-        earliest_date = all_slots_with_dt[0]['date_key']
-
-        # Filter to only slots on that earliest date
-        same_day_slots = [s['slot_data'] for s in all_slots_with_dt if s['date_key'] == earliest_date]
-
         logger.info(f"📅 Found {len(same_day_slots)} total slots on earliest day ({earliest_date})")
-        logger.info(f"🔍 DEBUG: all_slots_with_dt count: {len(all_slots_with_dt)}")
-        logger.info(f"🔍 DEBUG: Parsed dates: {[s['date_key'] for s in all_slots_with_dt]}")
+        logger.debug("🔍 DEBUG: parsed cached slots count: {}", parsed_count)
 
         if len(same_day_slots) <= 1:
             # Only 1 slot on that day (the one already shown)
@@ -2417,10 +2560,9 @@ async def show_more_same_day_slots_handler(args: FlowArgs, flow_manager: FlowMan
             }, None
 
         # Turn off first available mode and show all slots on that day
-        flow_manager.state["first_available_mode"] = False
+        state["first_available_mode"] = False
 
         from flows.nodes.booking import create_slot_selection_node
-        from models.requests import HealthService
 
         # Reconstruct service from cached params
         service_data = cached_params.get("service", {})
@@ -2439,7 +2581,7 @@ async def show_more_same_day_slots_handler(args: FlowArgs, flow_manager: FlowMan
             user_preferred_date=earliest_date,
             time_preference=cached_params.get("time_preference", "any time"),
             first_available_mode=False,  # Show all slots now
-            slot_cache=flow_manager.state.setdefault("slot_cache", {})
+            slot_cache=state.setdefault("slot_cache", {})
         )
 
     except Exception as e:
@@ -2455,6 +2597,7 @@ async def search_different_date_handler(args: FlowArgs, flow_manager: FlowManage
     Search for slots on a specific different date requested by user
     Performs a new API call with the requested date
     """
+    state = flow_manager.state
     try:
         new_date = args.get("new_date")
         time_preference = args.get("time_preference", "any time")
@@ -2469,15 +2612,15 @@ async def search_different_date_handler(args: FlowArgs, flow_manager: FlowManage
         logger.info(f"🔍 SEARCH DIFFERENT DATE: User requested slots on {new_date} with preference '{time_preference}'")
 
         # Clear first available mode
-        flow_manager.state["first_available_mode"] = False
-        flow_manager.state["preferred_date"] = new_date
-        flow_manager.state["time_preference"] = time_preference
+        state["first_available_mode"] = False
+        state["preferred_date"] = new_date
+        state["time_preference"] = time_preference
 
         # Get current service info - ALWAYS use current_group_index
-        current_group_index = flow_manager.state.get("current_group_index", 0)
-        service_groups = flow_manager.state.get("service_groups", [])
-        selected_services = flow_manager.state.get("selected_services", [])
-        selected_center = flow_manager.state.get("selected_center")
+        current_group_index = state.get("current_group_index", 0)
+        service_groups = state.get("service_groups", [])
+        selected_services = state.get("selected_services", [])
+        selected_center = state.get("selected_center")
 
         if not selected_center:
             logger.error("❌ No health center selected")
@@ -2491,14 +2634,14 @@ async def search_different_date_handler(args: FlowArgs, flow_manager: FlowManage
             # Use service groups if available (bundle/combined/separate scenarios)
             current_group = service_groups[current_group_index]
             current_group_services = current_group["services"]
-            uuid_exam = [svc.uuid for svc in current_group_services]
-            current_service_name = " più ".join([svc.name for svc in current_group_services])
+            uuid_exam = current_group["uuids"]
+            current_service_name = current_group["name"]
             # Use first service from group as display service
             current_service = current_group_services[0]
             logger.info(f"🔍 DIFFERENT DATE: Using service group {current_group_index} - {current_service_name}")
         else:
             # Fallback to legacy single-service logic
-            current_service_index = flow_manager.state.get("current_service_index", 0)
+            current_service_index = state.get("current_service_index", 0)
             if not selected_services or current_service_index >= len(selected_services):
                 logger.error("❌ No service information found")
                 return {
@@ -2506,7 +2649,7 @@ async def search_different_date_handler(args: FlowArgs, flow_manager: FlowManage
                     "message": "Service information not found. Please start the booking process again."
                 }, None
             current_service = selected_services[current_service_index]
-            uuid_exam = [current_service.uuid]
+            uuid_exam = (current_service.uuid,)
             current_service_name = current_service.name
             logger.info(f"🔍 DIFFERENT DATE: Using legacy service {current_service_index} - {current_service_name}")
 
@@ -2514,29 +2657,25 @@ async def search_different_date_handler(args: FlowArgs, flow_manager: FlowManage
         logger.info(f"🔎 Searching slots for {current_service_name} on {new_date}")
 
         # Speak TTS filler before slot search
-        tts_service = flow_manager.state.get("tts_service")
+        tts_service = state.get("tts_service")
         if tts_service:
             await tts_service.queue_frame(TTSSpeakFrame(f"Cerco disponibilità per {current_service_name.replace(' + ', ' più ')} nella nuova data. Un momento."))
 
         # Format DOB for API (remove dashes)
-        patient_dob = flow_manager.state.get("patient_dob", "1980-04-13")
-        dob_formatted = patient_dob.replace("-", "")
+        patient_dob = state.get("patient_dob", "1980-04-13")
+        dob_formatted = format_dob_for_api(state, patient_dob)
 
-        import asyncio
-        loop = asyncio.get_event_loop()
-        slots_response = await loop.run_in_executor(
-            None,
-            lambda: list_slot(
-                health_center_uuid=selected_center.uuid,
-                date_search=new_date,
-                uuid_exam=uuid_exam,
-                gender=flow_manager.state.get("patient_gender", "m"),
-                date_of_birth=dob_formatted
-            )
+        slots_response = await asyncio.to_thread(
+            cached_list_slot,
+            health_center_uuid=selected_center.uuid,
+            date_search=new_date,
+            uuid_exam=uuid_exam,
+            gender=state.get("patient_gender", "m"),
+            date_of_birth=dob_formatted
         )
 
         if slots_response and len(slots_response) > 0:
-            flow_manager.state["available_slots"] = slots_response
+            state["available_slots"] = slots_response
             logger.success(f"✅ Found {len(slots_response)} slots on {new_date}")
 
             from flows.nodes.booking import create_slot_selection_node
@@ -2548,16 +2687,16 @@ async def search_different_date_handler(args: FlowArgs, flow_manager: FlowManage
             }, create_slot_selection_node(
                 slots=slots_response,
                 service=current_service,
-                is_cerba_member=flow_manager.state.get("is_cerba_member", False),
+                is_cerba_member=state.get("is_cerba_member", False),
                 user_preferred_date=new_date,
                 time_preference=time_preference,
                 first_available_mode=False,
-                slot_cache=flow_manager.state.setdefault("slot_cache", {})
+                slot_cache=state.setdefault("slot_cache", {})
             )
         else:
             logger.warning(f"⚠️ No slots found on {new_date}")
             from flows.nodes.booking import create_no_slots_node
-            has_booked = bool(flow_manager.state.get("booked_slots"))
+            has_booked = bool(state.get("booked_slots"))
             booked_info = _build_booked_slots_summary(flow_manager) if has_booked else ""
             return {
                 "success": False,
@@ -2685,7 +2824,6 @@ def _fuzzy_match_doctor_in_slots(requested_name: str, doctors: List[Dict]) -> Li
     """Fuzzy match against doctors extracted from slots.
     Returns ALL doctors with their scores, sorted descending.
     """
-    from rapidfuzz import fuzz
     requested_lower = requested_name.lower().strip()
     results = []
     for doc in doctors:
@@ -2714,7 +2852,6 @@ def _fuzzy_match_doctor(requested_name: str, doctors: List[Dict]) -> List[Dict]:
     For each doctor, compute max score across name, surname, and full name.
     Returns doctors with score >= 80, sorted by score descending.
     """
-    from rapidfuzz import fuzz
 
     results = []
     requested_lower = requested_name.lower().strip()
@@ -2755,7 +2892,6 @@ async def fetch_doctors_and_match(args: FlowArgs, flow_manager: FlowManager) ->
 
         logger.info(f"🩺 Fetching providing entities for doctor '{requested_name}' at {selected_center.name}")
 
-        import asyncio
         loop = asyncio.get_event_loop()
 
         def _fetch():
@@ -2830,7 +2966,6 @@ async def fetch_doctors_and_match(args: FlowArgs, flow_manager: FlowManager) ->
 
     except Exception as e:
         logger.error(f"❌ Doctor matching error: {e}")
-        from flows.nodes.transfer import create_transfer_node_with_escalation
         return {
             "success": False,
             "error": str(e)
@@ -2943,7 +3078,6 @@ async def handle_show_available_doctors(args: FlowArgs, flow_manager: FlowManage
             is_alternative=True
         )
     else:
-        from flows.nodes.transfer import create_transfer_node_with_escalation
         return {"success": False}, await create_transfer_node_with_escalation(flow_manager)
 
 
@@ -2995,20 +3129,19 @@ async def handle_get_price_info(args: FlowArgs, flow_manager: FlowManager) -> Di
 
 
 def _get_current_service_info(flow_manager: FlowManager):
-    """Get current service, uuid_exam list, and service name from flow state."""
+    """Get current service and uuid_exam tuple from flow state."""
     current_group_index = flow_manager.state.get("current_group_index", 0)
     service_groups = flow_manager.state.get("service_groups", [])
     selected_services = flow_manager.state.get("selected_services", [])
 
     if service_groups and current_group_index < len(service_groups):
         current_group = service_groups[current_group_index]
-        current_group_services = current_group["services"]
-        uuid_exam = [svc.uuid for svc in current_group_services]
-        current_service = current_group_services[0]
+        uuid_exam = current_group["uuids"]
+        current_service = current_group["services"][0]
     else:
         current_service_index = flow_manager.state.get("current_service_index", 0)
         current_service = selected_services[current_service_index] if selected_services else None
-        uuid_exam = [current_service.uuid] if current_service else []
+        uuid_exam = (current_service.uuid,) if current_service else ()
 
     return current_service, uuid_exam
 
@@ -3086,16 +3219,14 @@ async def filter_slots_by_doctor(args: FlowArgs, flow_manager: FlowManager) -> T
             # Calculate next search date (day after last slot date)
             if not dates:
                 break
-            last_date = datetime.strptime(dates[-1], "%Y-%m-%d")
-            next_date = (last_date + timedelta(days=1)).strftime("%Y-%m-%d")
+            next_date = (date.fromisoformat(dates[-1]) + timedelta(days=1)).isoformat()
 
             logger.info(f"👨‍⚕️ Doctor '{doctor_name}' not found (attempt {attempt}/{MAX_AUTO_SEARCHES}). Auto-searching from {next_date}...")
 
             # Search new slots via API
             patient_dob = flow_manager.state.get("patient_dob", "1980-04-13")
-            dob_formatted = patient_dob.replace("-", "")
+            dob_formatted = format_dob_for_api(flow_manager.state, patient_dob)
 
-            import asyncio
             loop = asyncio.get_event_loop()
             try:
                 new_slots = await loop.run_in_executor(
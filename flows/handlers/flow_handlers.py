@@ -3,14 +3,22 @@ Flow generation and navigation handlers
 """
 
 import json
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Tuple
 from loguru import logger
 
 from pipecat_flows import FlowManager, NodeConfig, FlowArgs
-from services.get_flowNb import genera_flow
+from services.get_flowNb import cached_genera_flow
 from services.cerba_api import cerba_api
 from utils.api_retry import retry_api_call
+from utils.cache import TTLCache
+from utils.date_parser import format_dob_for_api
 from models.requests import HealthService
+from flows.nodes.completion import create_error_node
+from flows.nodes.patient_info import create_recollect_address_node
+from flows.nodes.transfer import create_transfer_node_with_escalation
+# flows.nodes.booking imports this module at load time, so its node factories stay function-local
 
 # Fallback HC UUID (Tradate) if center search finds nothing at max radius
 FALLBACK_HC_UUID = "c5535638-6c18-444c-955d-89139d8276be"
@@ -18,6 +26,15 @@ FALLBACK_HC_UUID = "c5535638-6c18-444c-955d-89139d8276be"
 # Silent radius expansion steps (no user interaction)
 SILENT_RADIUS_STEPS = [None, 42]  # None = API default 22km, max 42km
 
+# Dedicated threads for the blocking center-search and genera_flow calls, so they don't queue
+# behind other work on the default executor; sized to match the cerba_api connection pool
+_CERBA_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="cerba-api")
+
+# Inputs whose generated flow had no related services: the orange box is skipped for them
+# without the silent center search or genera_flow round-trips
+EMPTY_FLOW_TTL = 3600  # seconds
+_empty_flow_keys = TTLCache(default_ttl=EMPTY_FLOW_TTL)
+
 
 def prune_empty_flow_nodes(node: dict) -> dict:
     """Remove nodes with empty list_health_services from flow tree.
@@ -54,78 +71,97 @@ def prune_empty_flow_nodes(node: dict) -> dict:
 
 async def perform_silent_center_search_and_generate_flow(args: FlowArgs, flow_manager: FlowManager) -> Tuple[Dict[str, Any], NodeConfig]:
     """Silent center search + flow generation in one step. No TTS, no user interaction."""
+    state = flow_manager.state
     try:
         # Doctor-specific booking: skip orange box entirely → go to center search
-        if flow_manager.state.get("doctor_booking_mode"):
+        if state.get("doctor_booking_mode"):
             logger.info("🩺 Doctor booking mode: skipping orange box, going to center search")
             from flows.nodes.booking import create_final_center_search_node
             return {"success": True, "message": "Skipped orange box for doctor-specific booking"}, create_final_center_search_node()
 
-        selected_services = flow_manager.state.get("selected_services", [])
+        selected_services = state.get("selected_services", [])
         if not selected_services:
-            from flows.nodes.completion import create_error_node
             return {"success": False}, create_error_node("No service selected. Please restart booking.")
 
         primary_service = selected_services[0]
-        gender = flow_manager.state.get("patient_gender", "m")
-        dob = flow_manager.state.get("patient_dob", "")
-        address = flow_manager.state.get("patient_address", "")
+        gender = state.get("patient_gender", "m")
+        dob = state.get("patient_dob", "")
+        address = state.get("patient_address", "")
 
         # Format DOB: "1979-06-19" → "19790619"
-        dob_formatted = dob.replace("-", "") if dob else "19900811"
+        dob_formatted = format_dob_for_api(state, dob, "19900811")
 
         # Get service UUIDs for center search
         service_uuids = [s.uuid for s in selected_services]
 
+        # The centers genera_flow sees come from a search over all selected services, so they are part of the key
+        empty_flow_key = "|".join([primary_service.uuid, ",".join(sorted(service_uuids)), gender, dob_formatted, address])
+        if _empty_flow_keys.get(empty_flow_key):
+            logger.info(f"⚡ Flow for {primary_service.name} known to have no related services, skipping flow navigation")
+            from flows.nodes.booking import create_final_center_search_node
+            return {
+                "success": True,
+                "skipped_navigation": True,
+                "message": f"No additional services for {primary_service.name}"
+            }, create_final_center_search_node()
+
         logger.info(f"🔇 Silent center search for {len(service_uuids)} services near {address}")
 
         # --- Silent auto-expanding center search ---
-        import asyncio
+        # All radii are searched concurrently; results are taken smallest radius first,
+        # so a miss at the default radius no longer costs a full extra round-trip
         loop = asyncio.get_event_loop()
         health_centers = []
 
-        for radius in SILENT_RADIUS_STEPS:
-            radius_display = radius if radius else "22 (default)"
-            logger.info(f"🔍 Trying radius={radius_display}km")
-
-            def _search(r=radius):
-                result, error = retry_api_call(
-                    api_func=cerba_api.get_health_centers,
-                    max_retries=2,
-                    retry_delay=1.0,
-                    func_name=f"Silent HC Search (radius={radius_display}km)",
-                    health_services=service_uuids,
-                    gender=gender,
-                    date_of_birth=dob_formatted,
-                    address=address,
-                    radius=r,
-                )
-                if error:
-                    raise error
-                return result
-
-            try:
-                health_centers = await loop.run_in_executor(None, _search)
-                if health_centers:
-                    logger.success(f"✅ Found {len(health_centers)} centers at radius={radius_display}km")
-                    for hc in health_centers:
-                        logger.debug(f"🏥 Center: {hc.name} | {hc.uuid}")
-                    break
-            except Exception as e:
-                logger.warning(f"⚠️ Center search failed at radius={radius_display}km: {e}")
+        def _search(r):
+            radius_display = r if r else "22 (default)"
+            result, error = retry_api_call(
+                api_func=cerba_api.get_health_centers,
+                max_retries=2,
+                retry_delay=1.0,
+                func_name=f"Silent HC Search (radius={radius_display}km)",
+                health_services=service_uuids,
+                gender=gender,
+                date_of_birth=dob_formatted,
+                address=address,
+                radius=r,
+            )
+            if error:
+                raise error
+            return result
+
+        logger.opt(lazy=True).info(
+            "🔍 Trying radii={}km concurrently", lambda: [r if r else "22 (default)" for r in SILENT_RADIUS_STEPS]
+        )
+        searches = [loop.run_in_executor(_CERBA_POOL, _search, r) for r in SILENT_RADIUS_STEPS]
+        try:
+            for radius, search in zip(SILENT_RADIUS_STEPS, searches):
+                radius_display = radius if radius else "22 (default)"
+                try:
+                    health_centers = await search
+                    if health_centers:
+                        logger.success(f"✅ Found {len(health_centers)} centers at radius={radius_display}km")
+                        for hc in health_centers:
+                            logger.debug(f"🏥 Center: {hc.name} | {hc.uuid}")
+                        break
+                except Exception as e:
+                    logger.warning(f"⚠️ Center search failed at radius={radius_display}km: {e}")
+        finally:
+            # Drop the larger-radius searches once a smaller one has answered
+            for search in searches:
+                if not search.cancel() and not search.cancelled():
+                    search.exception()
 
         # Check if all failures were due to invalid address
         if not health_centers:
-            address_retry_count = flow_manager.state.get("address_retry_count", 0)
+            address_retry_count = state.get("address_retry_count", 0)
 
             if address_retry_count == 0:
-                flow_manager.state["address_retry_count"] = 1
+                state["address_retry_count"] = 1
                 logger.warning(f"⚠️ Address '{address}' not recognized, asking patient to retry")
-                from flows.nodes.patient_info import create_recollect_address_node
                 return {"success": False, "message": "Address not recognized"}, create_recollect_address_node()
             else:
                 logger.error(f"❌ Address still invalid after retry, offering transfer")
-                from flows.nodes.transfer import create_transfer_node_with_escalation
                 return {
                     "success": False,
                     "message": "Mi dispiace, non riesco a trovare il tuo indirizzo. Ti trasferisco a un operatore che potrà aiutarti."
@@ -135,20 +171,20 @@ async def perform_silent_center_search_and_generate_flow(args: FlowArgs, flow_ma
         if health_centers:
             hc_uuids = [hc.uuid for hc in health_centers]
             # Reset address retry counter on success
-            flow_manager.state.pop("address_retry_count", None)
+            state.pop("address_retry_count", None)
         else:
             logger.warning(f"⚠️ No centers found at max radius, falling back to Tradate UUID")
             hc_uuids = [FALLBACK_HC_UUID]
 
-        flow_manager.state["orange_box_hc_uuids"] = hc_uuids
+        state["orange_box_hc_uuids"] = hc_uuids
         logger.info(f"🏥 Using {len(hc_uuids)} HC UUIDs for genera_flow")
 
         # --- Generate flow ---
         logger.info(f"🔄 Calling genera_flow for {primary_service.name}")
 
         generated_flow = await loop.run_in_executor(
-            None,
-            genera_flow,
+            _CERBA_POOL,
+            cached_genera_flow,
             hc_uuids,
             primary_service.uuid,
             gender,
@@ -160,26 +196,30 @@ async def perform_silent_center_search_and_generate_flow(args: FlowArgs, flow_ma
             from flows.nodes.booking import create_final_center_search_node
             return {"success": True, "message": "No flow generated, proceeding to center search"}, create_final_center_search_node()
 
-        logger.debug(f"📋 Generated flow for {primary_service.name}: {json.dumps(generated_flow, ensure_ascii=False)[:500]}")
-
-        # Parse generated flow
-        if isinstance(generated_flow, str):
-            generated_flow = json.loads(generated_flow)
+        logger.opt(lazy=True).debug(
+            "📋 Generated flow for {}: {}",
+            lambda: primary_service.name, lambda: json.dumps(generated_flow, ensure_ascii=False)[:500]
+        )
 
         # Prune nested nodes with empty list_health_services before LLM sees them
         generated_flow = prune_empty_flow_nodes(generated_flow)
 
-        logger.info(f"✂️ Pruned flow for {primary_service.name}: {json.dumps(generated_flow, ensure_ascii=False)[:500]}")
+        logger.opt(lazy=True).debug(
+            "✂️ Pruned flow for {}: {}",
+            lambda: primary_service.name, lambda: json.dumps(generated_flow, ensure_ascii=False)[:500]
+        )
 
         # Check if list_health_services is empty → skip flow navigation
         list_hs = generated_flow.get("list_health_services", [])
         has_services = bool(list_hs) and list_hs != []
 
         # Store flow in state
-        flow_manager.state["generated_flow"] = generated_flow
+        state["generated_flow"] = generated_flow
 
         if not has_services:
             logger.info(f"📋 No related services for {primary_service.name}, skipping flow navigation")
+            _empty_flow_keys.cleanup_expired()
+            _empty_flow_keys.set(empty_flow_key, True)
             from flows.nodes.booking import create_final_center_search_node
             return {
                 "success": True,
@@ -191,7 +231,7 @@ async def perform_silent_center_search_and_generate_flow(args: FlowArgs, flow_ma
         logger.success(f"✅ Flow generated with services, proceeding to navigation")
 
         from flows.nodes.booking import create_flow_navigation_node
-        pending = flow_manager.state.get("pending_additional_request", "")
+        pending = state.get("pending_additional_request", "")
         return {
             "success": True,
             "flow_generated": True,
@@ -207,21 +247,22 @@ async def perform_silent_center_search_and_generate_flow(args: FlowArgs, flow_ma
 
 async def finalize_services_and_search_centers(args: FlowArgs, flow_manager: FlowManager) -> Tuple[Dict[str, Any], NodeConfig]:
     """Extract final service selections from flow navigation and search centers"""
+    state = flow_manager.state
     try:
         # Get parameters from LLM flow navigation
         additional_services = args.get("additional_services", [])
         flow_path = args.get("flow_path", "")
 
         # Get existing selected services from state
-        selected_services = flow_manager.state.get("selected_services", [])
+        selected_services = state.get("selected_services", [])
 
         # Get the generated flow to understand what services were offered
-        generated_flow = flow_manager.state.get("generated_flow", {})
+        generated_flow = state.get("generated_flow", {})
 
-        logger.info(f"🔍 Flow navigation complete:")
-        logger.info(f"   Additional services: {additional_services}")
-        logger.info(f"   Flow path: {flow_path}")
-        logger.info(f"   Original services: {[s.name for s in selected_services]}")
+        logger.opt(lazy=True).info(
+            "🔍 Flow navigation complete: additional={} path={} original={}",
+            lambda: additional_services, lambda: flow_path, lambda: [s.name for s in selected_services]
+        )
         
         # Add additional services to state (avoid duplicates by UUID)
         existing_uuids = {service.uuid for service in selected_services}
@@ -233,11 +274,10 @@ async def finalize_services_and_search_centers(args: FlowArgs, flow_manager: Flo
             service_code = additional_service.get("code", "").strip(" ,")
             service_sector = additional_service.get("sector", "").strip()
 
-            logger.debug(f"🔍 Processing additional service from LLM:")
-            logger.debug(f"   Name: {service_name}")
-            logger.debug(f"   UUID: {service_uuid}")
-            logger.debug(f"   Code: {service_code}")
-            logger.debug(f"   Sector: {service_sector}")
+            logger.debug(
+                "🔍 Processing additional service from LLM: name={} uuid={} code={} sector={}",
+                service_name, service_uuid, service_code, service_sector
+            )
 
             # Check for duplicates FIRST (before validation)
             # This handles cases where LLM includes the original service without proper code/sector
@@ -246,7 +286,7 @@ async def finalize_services_and_search_centers(args: FlowArgs, flow_manager: Flo
                 continue
 
             if service_uuid in existing_uuids:
-                logger.debug(f"⚠️ Service '{service_name}' (UUID: {service_uuid}) already in selected services, skipping")
+                logger.debug("⚠️ Service '{}' (UUID: {}) already in selected services, skipping", service_name, service_uuid)
                 continue
 
             # Validate required fields for NEW services only
@@ -276,13 +316,12 @@ async def finalize_services_and_search_centers(args: FlowArgs, flow_manager: Flo
         # Ensure we have at least the original service
         if not selected_services:
             logger.warning("⚠️  No services in final selection, this shouldn't happen")
-            from flows.nodes.completion import create_error_node
             return {"success": False, "message": "No services selected"}, create_error_node("No services selected. Please restart booking.")
         
-        flow_manager.state["selected_services"] = selected_services
+        state["selected_services"] = selected_services
 
         # Check if pending additional service was satisfied during orange box navigation
-        pending_req = flow_manager.state.get("pending_additional_request", "")
+        pending_req = state.get("pending_additional_request", "")
         if pending_req:
             # Check 1: LLM explicitly flagged pending_matched=true
             matched = args.get("pending_matched", False)
@@ -291,28 +330,29 @@ async def finalize_services_and_search_centers(args: FlowArgs, flow_manager: Flo
             if not matched:
                 pending_lower = pending_req.lower().strip()
                 for svc in selected_services:
-                    if pending_lower in svc.name.lower() or svc.name.lower().strip() in pending_lower:
+                    svc_lower = svc.name.lower()
+                    if pending_lower in svc_lower or svc_lower.strip() in pending_lower:
                         matched = True
                         logger.info(f"✅ Programmatic match: '{svc.name}' matches pending '{pending_req}'")
                         break
 
             if matched:
-                flow_manager.state["pending_additional_resolved"] = True
-                flow_manager.state.pop("pending_additional_request", None)
+                state["pending_additional_resolved"] = True
+                state.pop("pending_additional_request", None)
                 logger.info("✅ Pending additional service resolved via orange box flow")
 
-        logger.success(f"🎯 Final service selection: {[s.name for s in selected_services]}")
+        final_services = [s.name for s in selected_services]
+        logger.success(f"🎯 Final service selection: {final_services}")
         logger.success(f"📊 Service count: {len(selected_services)}")
         
         # Transition to final center search with all services
         from flows.nodes.booking import create_final_center_search_node
         return {
             "success": True,
-            "final_services": [s.name for s in selected_services],
+            "final_services": final_services,
             "service_count": len(selected_services)
         }, create_final_center_search_node()
         
     except Exception as e:
         logger.error(f"Service finalization error: {e}")
-        from flows.nodes.completion import create_error_node
         return {"success": False, "message": "Failed to finalize services"}, create_error_node("Failed to finalize services. Please try again.")
\ No newline at end of file
@@ -8,6 +8,7 @@ Global functions:
 """
 
 from typing import Tuple, Dict, Any, Optional
+from datetime import datetime
 import asyncio
 from loguru import logger
 
@@ -15,17 +16,59 @@ from pipecat_flows import FlowManager, NodeConfig, FlowArgs
 
 # Import services from new locations
 from services.call_data_extractor import get_call_extractor
+from services.knowledge_base import knowledge_base_service
+from services.pricing_service import pricing_service
+from services.exam_service import exam_service, VALID_VISIT_TYPES
+from services.clinic_info_service import clinic_info_service
+from services.slotAgenda import delete_slot, invalidate_slot_cache
+from services.escalation_service import call_escalation_api, send_escalation_direct
+from services.ivr_routing import is_valid_queue_code, resolve_fallback_queue
+from utils.failure_tracker import FailureTracker
+from flows.nodes.transfer import create_transfer_node, create_transfer_node_with_escalation
+from flows.nodes.router import create_router_node
+from flows.nodes.greeting import create_greeting_node
+from flows.nodes.sports_medicine import create_sports_medicine_type_node
 from config.settings import settings
 
 
+_BOOKING_REMINDER = {
+    "IMPORTANT_INSTRUCTION": "A booking is in progress. After responding to the user, you MUST immediately continue with the booking by repeating the last question you asked. Do NOT abandon the booking unless user explicitly says to cancel.",
+    "continue_booking": True,
+}
+
+
 def _add_booking_reminder(result: Dict[str, Any], flow_manager: FlowManager) -> Dict[str, Any]:
     """Add booking continuation reminder if booking is in progress"""
     if flow_manager.state.get("booking_in_progress"):
-        result["IMPORTANT_INSTRUCTION"] = "A booking is in progress. After responding to the user, you MUST immediately continue with the booking by repeating the last question you asked. Do NOT abandon the booking unless user explicitly says to cancel."
-        result["continue_booking"] = True
+        result.update(_BOOKING_REMINDER)
     return result
 
 
+def _norm(args: FlowArgs, key: str, upper: bool = False) -> str:
+    """Stripped string arg ("" when missing or null), optionally uppercased"""
+    value = args.get(key)
+    if not value:
+        return ""
+    return value.strip().upper() if upper else value.strip()
+
+
+# Info lookups already in flight, keyed by service call + arguments
+_inflight: Dict[tuple, asyncio.Future] = {}
+
+
+async def _single_flight(key: tuple, call):
+    """Share one in-flight service call between concurrent identical lookups"""
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(call())
+        _inflight[key] = future
+        future.add_done_callback(lambda _: _inflight.pop(key, None))
+    else:
+        logger.debug("⚡ Joining in-flight lookup {}", key)
+    # Shielded so a cancelled caller doesn't cancel the lookup for the others
+    return await asyncio.shield(future)
+
+
 # ============================================================================
 # 1. KNOWLEDGE BASE (Global)
 # ============================================================================
@@ -39,7 +82,7 @@ async def global_knowledge_base(
     Returns None to stay at current node (allows mid-booking info).
     """
     try:
-        query = args.get("query", "").strip()
+        query = _norm(args, "query")
 
         if not query:
             logger.warning("⚠️ Empty knowledge base query")
@@ -47,8 +90,7 @@ async def global_knowledge_base(
 
         logger.info(f"📚 [GLOBAL] Knowledge Base Query: {query[:100]}...")
 
-        from services.knowledge_base import knowledge_base_service
-        result = await knowledge_base_service.query(query)
+        result = await _single_flight(("knowledge_base", query), lambda: knowledge_base_service.query(query))
 
         if result.success:
             logger.success(f"✅ Knowledge base answer (confidence: {result.confidence})")
@@ -73,7 +115,6 @@ async def global_knowledge_base(
             return _add_booking_reminder(response, flow_manager), None  # Stay at current node
         else:
             logger.error(f"❌ Knowledge base failed: {result.error}")
-            from flows.nodes.transfer import create_transfer_node_with_escalation
             return {
                 "success": False,
                 "error": result.error,
@@ -82,7 +123,6 @@ async def global_knowledge_base(
 
     except Exception as e:
         logger.error(f"❌ Knowledge base error: {e}")
-        from flows.nodes.transfer import create_transfer_node_with_escalation
         return {"success": False, "error": str(e)}, await create_transfer_node_with_escalation(flow_manager)
 
 
@@ -99,20 +139,16 @@ async def global_competitive_pricing(
     Requires: age, gender, sport, region
     """
     try:
-        logger.info(f"🔥 COMPETITIVE PRICING CALLED with args: {args}")
+        logger.debug("🔥 Competitive pricing args: {}", args)
 
         age = args.get("age")
-        gender = args.get("gender", "").strip().upper() if args.get("gender") else ""
-        sport = args.get("sport", "").strip() if args.get("sport") else ""
-        region = args.get("region", "").strip() if args.get("region") else ""
+        gender = _norm(args, "gender", upper=True)
+        sport = _norm(args, "sport")
+        region = _norm(args, "region")
 
-        logger.info(f"   Parsed: age={age}, gender={gender}, sport={sport}, region={region}")
+        logger.debug("   Parsed: age={}, gender={}, sport={}, region={}", age, gender, sport, region)
 
-        missing = []
-        if not age: missing.append("age")
-        if not gender: missing.append("gender")
-        if not sport: missing.append("sport")
-        if not region: missing.append("region")
+        missing = [k for k, v in (("age", age), ("gender", gender), ("sport", sport), ("region", region)) if not v]
 
         if missing:
             logger.warning(f"⚠️ Missing params for competitive pricing: {missing}")
@@ -124,8 +160,10 @@ async def global_competitive_pricing(
 
         logger.info(f"💰 [GLOBAL] Competitive Pricing: age={age}, gender={gender}, sport={sport}")
 
-        from services.pricing_service import pricing_service
-        result = await pricing_service.get_competitive_price(age, gender, sport, region)
+        result = await _single_flight(
+            ("competitive_price", age, gender, sport, region),
+            lambda: pricing_service.get_competitive_price(age, gender, sport, region)
+        )
 
         if result.success:
             logger.success(f"✅ Competitive price: €{result.price}")
@@ -151,12 +189,10 @@ async def global_competitive_pricing(
             return _add_booking_reminder(response, flow_manager), None
         else:
             logger.error(f"❌ Competitive pricing failed: {result.error}")
-            from flows.nodes.transfer import create_transfer_node_with_escalation
             return {"success": False, "error": result.error}, await create_transfer_node_with_escalation(flow_manager)
 
     except Exception as e:
         logger.error(f"❌ Competitive pricing error: {e}")
-        from flows.nodes.transfer import create_transfer_node_with_escalation
         return {"success": False, "error": str(e)}, await create_transfer_node_with_escalation(flow_manager)
 
 
@@ -185,8 +221,10 @@ async def global_non_competitive_pricing(
 
         logger.info(f"💰 [GLOBAL] Non-Competitive Pricing: ECG under stress = {ecg_under_stress}")
 
-        from services.pricing_service import pricing_service
-        result = await pricing_service.get_non_competitive_price(ecg_under_stress)
+        result = await _single_flight(
+            ("non_competitive_price", ecg_under_stress),
+            lambda: pricing_service.get_non_competitive_price(ecg_under_stress)
+        )
 
         if result.success:
             logger.success(f"✅ Non-competitive price: €{result.price}")
@@ -208,12 +246,10 @@ async def global_non_competitive_pricing(
             return _add_booking_reminder(response, flow_manager), None
         else:
             logger.error(f"❌ Non-competitive pricing failed: {result.error}")
-            from flows.nodes.transfer import create_transfer_node_with_escalation
             return {"success": False, "error": result.error}, await create_transfer_node_with_escalation(flow_manager)
 
     except Exception as e:
         logger.error(f"❌ Non-competitive pricing error: {e}")
-        from flows.nodes.transfer import create_transfer_node_with_escalation
         return {"success": False, "error": str(e)}, await create_transfer_node_with_escalation(flow_manager)
 
 
@@ -229,7 +265,7 @@ async def global_exam_by_visit(
     Get exam list for visit type code (A1, A2, A3, B1-B5).
     """
     try:
-        visit_type = args.get("visit_type", "").strip().upper()
+        visit_type = _norm(args, "visit_type", upper=True)
 
         if not visit_type:
             logger.warning("⚠️ Missing visit_type")
@@ -239,10 +275,17 @@ async def global_exam_by_visit(
                 "message": "Need visit type code (A1, A2, A3, B1-B5)"
             }, None
 
+        if visit_type not in VALID_VISIT_TYPES:
+            logger.warning(f"⚠️ Invalid visit_type '{visit_type}'")
+            return {
+                "success": False,
+                "missing_params": ["visit_type"],
+                "message": "Invalid visit type code, must be one of A1, A2, A3, B1-B5"
+            }, None
+
         logger.info(f"📋 [GLOBAL] Exam List by Visit: {visit_type}")
 
-        from services.exam_service import exam_service
-        result = await exam_service.get_exams_by_visit_type(visit_type)
+        result = await _single_flight(("exams_by_visit", visit_type), lambda: exam_service.get_exams_by_visit_type(visit_type))
 
         if result.success:
             logger.success(f"✅ Exams for {visit_type}: {len(result.exams)} items")
@@ -266,12 +309,10 @@ async def global_exam_by_visit(
             return _add_booking_reminder(response, flow_manager), None
         else:
             logger.error(f"❌ Exam by visit failed: {result.error}")
-            from flows.nodes.transfer import create_transfer_node_with_escalation
             return {"success": False, "error": result.error}, await create_transfer_node_with_escalation(flow_manager)
 
     except Exception as e:
         logger.error(f"❌ Exam by visit error: {e}")
-        from flows.nodes.transfer import create_transfer_node_with_escalation
         return {"success": False, "error": str(e)}, await create_transfer_node_with_escalation(flow_manager)
 
 
@@ -287,7 +328,7 @@ async def global_exam_by_sport(
     Get exam list for specific sport.
     """
     try:
-        sport = args.get("sport", "").strip()
+        sport = _norm(args, "sport")
 
         if not sport:
             logger.warning("⚠️ Missing sport")
@@ -299,8 +340,7 @@ async def global_exam_by_sport(
 
         logger.info(f"📋 [GLOBAL] Exam List by Sport: {sport}")
 
-        from services.exam_service import exam_service
-        result = await exam_service.get_exams_by_sport(sport)
+        result = await _single_flight(("exams_by_sport", sport), lambda: exam_service.get_exams_by_sport(sport))
 
         if result.success:
             logger.success(f"✅ Exams for {sport}: {len(result.exams)} items")
@@ -324,12 +364,10 @@ async def global_exam_by_sport(
             return _add_booking_reminder(response, flow_manager), None
         else:
             logger.error(f"❌ Exam by sport failed: {result.error}")
-            from flows.nodes.transfer import create_transfer_node_with_escalation
             return {"success": False, "error": result.error}, await create_transfer_node_with_escalation(flow_manager)
 
     except Exception as e:
         logger.error(f"❌ Exam by sport error: {e}")
-        from flows.nodes.transfer import create_transfer_node_with_escalation
         return {"success": False, "error": str(e)}, await create_transfer_node_with_escalation(flow_manager)
 
 
@@ -346,7 +384,7 @@ async def global_clinic_info(
     Natural language query including location.
     """
     try:
-        query = args.get("query", "").strip()
+        query = _norm(args, "query")
 
         if not query:
             logger.warning("⚠️ Missing clinic query")
@@ -358,8 +396,7 @@ async def global_clinic_info(
 
         logger.info(f"🏥 [GLOBAL] Clinic Info: {query}")
 
-        from services.clinic_info_service import clinic_info_service
-        result = await clinic_info_service.get_clinic_info(query)
+        result = await _single_flight(("clinic_info", query), lambda: clinic_info_service.get_clinic_info(query))
 
         if result.success:
             logger.success("✅ Clinic info retrieved")
@@ -381,12 +418,10 @@ async def global_clinic_info(
             return _add_booking_reminder(response, flow_manager), None
         else:
             logger.error(f"❌ Clinic info failed: {result.error}")
-            from flows.nodes.transfer import create_transfer_node_with_escalation
             return {"success": False, "error": result.error}, await create_transfer_node_with_escalation(flow_manager)
 
     except Exception as e:
         logger.error(f"❌ Clinic info error: {e}")
-        from flows.nodes.transfer import create_transfer_node_with_escalation
         return {"success": False, "error": str(e)}, await create_transfer_node_with_escalation(flow_manager)
 
 
@@ -434,8 +469,6 @@ async def global_request_transfer(
     Both paths blocked when call center is closed/after_hours.
     """
     try:
-        from utils.failure_tracker import FailureTracker
-
         reason = args.get("reason", "user request").strip()
         immediate = args.get("immediate", False)
 
@@ -452,7 +485,7 @@ async def global_request_transfer(
 
         # Store transfer info
         flow_manager.state["transfer_reason"] = reason
-        flow_manager.state["transfer_timestamp"] = str(asyncio.get_event_loop().time())
+        flow_manager.state["transfer_timestamp"] = datetime.now().isoformat()
 
         # PATH 1: IMMEDIATE — agent cannot help (sports medicine, lab, fondi)
         if immediate:
@@ -463,7 +496,6 @@ async def global_request_transfer(
             # Run escalation in background — transfer node pre_actions TTS plays immediately
             asyncio.create_task(_handle_transfer_escalation(flow_manager))
 
-            from flows.nodes.transfer import create_transfer_node
             return {
                 "success": True,
                 "reason": reason,
@@ -481,7 +513,6 @@ async def global_request_transfer(
             # Run escalation in background — transfer node pre_actions TTS plays immediately
             asyncio.create_task(_handle_transfer_escalation(flow_manager))
 
-            from flows.nodes.transfer import create_transfer_node
             return {
                 "success": True,
                 "reason": reason,
@@ -501,7 +532,6 @@ async def global_request_transfer(
 
     except Exception as e:
         logger.error(f"❌ Transfer request error: {e}")
-        from flows.nodes.transfer import create_transfer_node
         asyncio.create_task(_handle_transfer_escalation(flow_manager))
         return {
             "success": True,
@@ -523,9 +553,9 @@ async def global_check_service_price(
     Reuses booking flow but skips unnecessary steps, presents just the price.
     """
     try:
-        service_request = args.get("service_request", "").strip()
-        center_hint = (args.get("center_hint") or "").strip()
-        doctor_name = (args.get("doctor_name") or "").strip()
+        service_request = _norm(args, "service_request")
+        center_hint = _norm(args, "center_hint")
+        doctor_name = _norm(args, "doctor_name")
 
         logger.info(f"💰 [GLOBAL] Check Service Price: {service_request}" + (f" | center_hint={center_hint}" if center_hint else "") + (f" | doctor={doctor_name}" if doctor_name else ""))
 
@@ -539,7 +569,6 @@ async def global_check_service_price(
 
             await _handle_transfer_escalation(flow_manager)
 
-            from flows.nodes.transfer import create_transfer_node
             return {
                 "success": True,
                 "service_request": service_request,
@@ -569,7 +598,6 @@ async def global_check_service_price(
 
         logger.success("✅ Transitioning to price inquiry flow")
 
-        from flows.nodes.greeting import create_greeting_node
         return {
             "success": True,
             "service_request": service_request,
@@ -600,7 +628,7 @@ async def global_start_booking(
     If detected, redirect to transfer instead.
     """
     try:
-        service_request = args.get("service_request", "").strip()
+        service_request = _norm(args, "service_request")
 
         logger.info(f"📅 [GLOBAL] Start Booking: {service_request}")
 
@@ -617,7 +645,6 @@ async def global_start_booking(
             await _handle_transfer_escalation(flow_manager)
 
             # Transition to transfer node
-            from flows.nodes.transfer import create_transfer_node
             return {
                 "success": True,
                 "service_request": service_request,
@@ -646,7 +673,6 @@ async def global_start_booking(
 
             await _handle_transfer_escalation(flow_manager)
 
-            from flows.nodes.transfer import create_transfer_node
             return {
                 "success": True,
                 "service_request": service_request,
@@ -661,7 +687,7 @@ async def global_start_booking(
         flow_manager.state["current_agent"] = "booking"
 
         # Doctor-specific booking mode
-        doctor_name = (args.get("doctor_name") or "").strip()
+        doctor_name = _norm(args, "doctor_name")
         if doctor_name:
             flow_manager.state["doctor_booking_mode"] = True
             flow_manager.state["requested_doctor_name"] = doctor_name
@@ -669,7 +695,7 @@ async def global_start_booking(
 
         # Store additional service request if patient mentioned two services
         # When doctor_booking_mode, ignore additional service (single-service only)
-        additional = (args.get("additional_service_request") or "").strip()
+        additional = _norm(args, "additional_service_request")
         if additional and not flow_manager.state.get("doctor_booking_mode"):
             flow_manager.state["pending_additional_request"] = additional
             logger.info(f"📋 Stored additional service request: {additional}")
@@ -688,7 +714,6 @@ async def global_start_booking(
 
         logger.success("✅ Transitioning to booking flow")
 
-        from flows.nodes.greeting import create_greeting_node
         return {
             "success": True,
             "service_request": service_request,
@@ -720,7 +745,7 @@ async def global_start_sports_medicine_booking(
     LLM may pre-detect the type from patient utterance.
     """
     try:
-        visit_type = (args.get("visit_type") or "").strip().lower()
+        visit_type = _norm(args, "visit_type").lower()
 
         logger.info(f"🏅 [GLOBAL] Start Sports Medicine Booking: type={visit_type or 'unknown'}")
 
@@ -732,7 +757,6 @@ async def global_start_sports_medicine_booking(
             flow_manager.state["transfer_requested"] = True
             flow_manager.state["transfer_type"] = "capability_limitation"
             await _handle_transfer_escalation(flow_manager)
-            from flows.nodes.transfer import create_transfer_node
             return {
                 "success": True,
                 "message": "La prenotazione per visite di medicina sportiva non è disponibile tramite questo servizio. Ti trasferisco a un operatore."
@@ -748,7 +772,6 @@ async def global_start_sports_medicine_booking(
         flow_manager.state["sports_medicine_mode"] = True
         flow_manager.state["booking_in_progress"] = True
 
-        from flows.nodes.sports_medicine import create_sports_medicine_type_node
         return {
             "success": True,
             "visit_type": visit_type or "unknown"
@@ -789,19 +812,23 @@ async def global_cancel_and_restart(
         booked_slots = flow_manager.state.get("booked_slots", [])
         cancelled_count = 0
         if booked_slots:
-            from services.slotAgenda import delete_slot
-            for slot in booked_slots:
-                slot_uuid = slot.get("slot_uuid")
-                if slot_uuid:
-                    try:
-                        delete_response = delete_slot(slot_uuid)
-                        if delete_response.status_code == 200:
-                            cancelled_count += 1
-                            logger.info(f"🗑️ Cancelled slot: {slot_uuid}")
-                        else:
-                            logger.warning(f"⚠️ Failed to cancel slot {slot_uuid}: HTTP {delete_response.status_code}")
-                    except Exception as e:
-                        logger.error(f"❌ Error cancelling slot {slot_uuid}: {e}")
+            # Cancel all reserved slots concurrently: one round-trip instead of one per slot
+            slot_uuids = [slot.get("slot_uuid") for slot in booked_slots if slot.get("slot_uuid")]
+            delete_results = await asyncio.gather(
+                *(asyncio.to_thread(delete_slot, slot_uuid) for slot_uuid in slot_uuids),
+                return_exceptions=True
+            )
+            for slot_uuid, delete_response in zip(slot_uuids, delete_results):
+                if isinstance(delete_response, Exception):
+                    logger.error(f"❌ Error cancelling slot {slot_uuid}: {delete_response}")
+                elif delete_response.status_code == 200:
+                    cancelled_count += 1
+                    logger.info(f"🗑️ Cancelled slot: {slot_uuid}")
+                else:
+                    logger.warning(f"⚠️ Failed to cancel slot {slot_uuid}: HTTP {delete_response.status_code}")
+            selected_center = flow_manager.state.get("selected_center")
+            if cancelled_count and selected_center:
+                invalidate_slot_cache(selected_center.uuid)
 
         # Clear all booking-related state
         booking_keys = [
@@ -824,7 +851,7 @@ async def global_cancel_and_restart(
             "generated_flow", "pending_flow_params",
             "patient_gender", "patient_dob", "patient_address",
             "current_search_radius", "intent",
-            "auto_date", "auto_start_time",
+            "auto_date", "auto_start_time", "auto_scheduling",
             "llm_interpretation_reasoning", "llm_interpretation_summary",
             # Center hint + price inquiry doctor
             "center_hint", "price_inquiry_doctor",
@@ -856,7 +883,6 @@ async def global_cancel_and_restart(
 
         logger.success(f"✅ Booking cancelled ({cancelled_count} slots deleted), returning to router")
 
-        from flows.nodes.router import create_router_node
         return {
             "success": True,
             "cancelled_slots": cancelled_count,
@@ -865,7 +891,6 @@ async def global_cancel_and_restart(
 
     except Exception as e:
         logger.error(f"❌ Cancel and restart error: {e}")
-        from flows.nodes.router import create_router_node
         return {
             "success": False,
             "error": str(e),
@@ -901,11 +926,10 @@ async def global_cancel_previous_appointment(
         flow_manager.state["transfer_requested"] = True
         flow_manager.state["transfer_type"] = "previous_appointment_cancellation"
         flow_manager.state["transfer_reason"] = reason
-        flow_manager.state["transfer_timestamp"] = str(asyncio.get_event_loop().time())
+        flow_manager.state["transfer_timestamp"] = datetime.now().isoformat()
 
         await _handle_transfer_escalation(flow_manager)
 
-        from flows.nodes.transfer import create_transfer_node
         return {
             "success": True,
             "reason": reason,
@@ -914,7 +938,6 @@ async def global_cancel_previous_appointment(
 
     except Exception as e:
         logger.error(f"❌ Cancel previous appointment error: {e}")
-        from flows.nodes.transfer import create_transfer_node
         await _handle_transfer_escalation(flow_manager)
         return {
             "success": True,
@@ -983,7 +1006,6 @@ async def _handle_transfer_escalation(flow_manager: FlowManager) -> None:
             queue_code = "1|5"  # Disdetta
 
         # Validate queue_code
-        from services.ivr_routing import is_valid_queue_code, resolve_fallback_queue
         if not is_valid_queue_code(queue_code):
             ivr_path = flow_manager.state.get("ivr_path", "")
             sector = _determine_escalation_sector(flow_manager)
@@ -994,7 +1016,6 @@ async def _handle_transfer_escalation(flow_manager: FlowManager) -> None:
         # Route escalation based on transport type
         if flow_manager.state.get("is_talkdesk_direct"):
             # Direct mode: push TalkdeskControlFrame through pipeline (no bridge)
-            from services.escalation_service import send_escalation_direct
             success = await send_escalation_direct(
                 flow_manager=flow_manager,
                 summary=analysis["summary"][:250],
@@ -1006,7 +1027,6 @@ async def _handle_transfer_escalation(flow_manager: FlowManager) -> None:
         else:
             # Bridge mode: HTTP POST to bridge /escalation endpoint (legacy)
             stream_sid = flow_manager.state.get("stream_sid", "")
-            from services.escalation_service import call_escalation_api
             success = await call_escalation_api(
                 summary=analysis["summary"][:250],
                 sentiment=analysis["sentiment"],
@@ -5,6 +5,7 @@ Patient detail collection flow handlers
 from typing import Dict, Any, Tuple
 from loguru import logger
 
+from pipecat.frames.frames import TTSSpeakFrame
 from pipecat_flows import FlowManager, NodeConfig, FlowArgs
 from services.call_logger import call_logger
 from services.patient_lookup import normalize_phone
@@ -204,9 +205,9 @@ async def collect_marketing_authorization_and_transition(args: FlowArgs, flow_ma
     marketing_auth = args.get("marketing_authorization", False)
 
     # COMPREHENSIVE DEBUG LOGGING FOR FINAL STEP
-    logger.info("🔍 DEBUG: === MARKETING AUTHORIZATION HANDLER ===")
-    logger.info(f"🔍 DEBUG: Args received: {args}")
-    logger.info(f"🔍 DEBUG: marketing_auth = {marketing_auth}")
+    logger.debug("🔍 DEBUG: === MARKETING AUTHORIZATION HANDLER ===")
+    logger.debug("🔍 DEBUG: Args received: {}", args)
+    logger.debug("🔍 DEBUG: marketing_auth = {}", marketing_auth)
 
     # Store marketing authorization in state
     flow_manager.state["marketing_authorization"] = marketing_auth
@@ -215,15 +216,15 @@ async def collect_marketing_authorization_and_transition(args: FlowArgs, flow_ma
     logger.info("✅ All patient details collected, proceeding directly to final booking")
 
     # Log current state before final booking
-    logger.info(f"🔍 DEBUG: State keys before final booking: {list(flow_manager.state.keys())}")
-    logger.info(f"🔍 DEBUG: selected_slot exists: {'selected_slot' in flow_manager.state}")
-    logger.info(f"🔍 DEBUG: booked_slots exists: {'booked_slots' in flow_manager.state}")
+    logger.opt(lazy=True).debug("🔍 DEBUG: State keys before final booking: {}", lambda: list(flow_manager.state.keys()))
+    logger.debug("🔍 DEBUG: selected_slot exists: {}", 'selected_slot' in flow_manager.state)
+    logger.debug("🔍 DEBUG: booked_slots exists: {}", 'booked_slots' in flow_manager.state)
 
     # Skip bulk verification - proceed directly to booking creation
-    logger.info("🔍 DEBUG: Calling confirm_details_and_create_booking...")
+    logger.debug("🔍 DEBUG: Calling confirm_details_and_create_booking...")
     try:
         result = await confirm_details_and_create_booking({"details_confirmed": True}, flow_manager)
-        logger.info(f"🔍 DEBUG: confirm_details_and_create_booking returned: {result}")
+        logger.debug("🔍 DEBUG: confirm_details_and_create_booking returned: {}", result)
         return result
     except Exception as e:
         logger.error(f"❌ DEBUG: Exception in confirm_details_and_create_booking: {e}")
@@ -246,26 +247,26 @@ async def confirm_details_and_create_booking(args: FlowArgs, flow_manager: FlowM
     logger.info("✅ Patient details confirmed, proceeding to final booking")
 
     # COMPREHENSIVE DEBUG LOGGING - Track exactly what we have in state
-    logger.info("🔍 DEBUG: Starting booking data validation")
-    logger.info(f"🔍 DEBUG: Complete flow_manager.state keys: {list(flow_manager.state.keys())}")
+    logger.debug("🔍 DEBUG: Starting booking data validation")
+    logger.opt(lazy=True).debug("🔍 DEBUG: Complete flow_manager.state keys: {}", lambda: list(flow_manager.state.keys()))
 
     # Get all required data from state
     selected_services = flow_manager.state.get("selected_services", [])
     booked_slots = flow_manager.state.get("booked_slots", [])
 
-    logger.info(f"🔍 DEBUG: selected_services = {selected_services}")
-    logger.info(f"🔍 DEBUG: selected_services type = {type(selected_services)}")
-    logger.info(f"🔍 DEBUG: selected_services length = {len(selected_services) if selected_services else 'None'}")
+    logger.debug("🔍 DEBUG: selected_services = {}", selected_services)
+    logger.debug("🔍 DEBUG: selected_services type = {}", type(selected_services))
+    logger.debug("🔍 DEBUG: selected_services length = {}", len(selected_services) if selected_services else 'None')
 
-    logger.info(f"🔍 DEBUG: booked_slots = {booked_slots}")
-    logger.info(f"🔍 DEBUG: booked_slots type = {type(booked_slots)}")
-    logger.info(f"🔍 DEBUG: booked_slots length = {len(booked_slots) if booked_slots else 'None'}")
+    logger.debug("🔍 DEBUG: booked_slots = {}", booked_slots)
+    logger.debug("🔍 DEBUG: booked_slots type = {}", type(booked_slots))
+    logger.debug("🔍 DEBUG: booked_slots length = {}", len(booked_slots) if booked_slots else 'None')
 
     # Check if selected_slot exists
     selected_slot_exists = "selected_slot" in flow_manager.state
     selected_slot_value = flow_manager.state.get("selected_slot", "NOT_FOUND")
-    logger.info(f"🔍 DEBUG: selected_slot exists? {selected_slot_exists}")
-    logger.info(f"🔍 DEBUG: selected_slot value = {selected_slot_value}")
+    logger.debug("🔍 DEBUG: selected_slot exists? {}", selected_slot_exists)
+    logger.debug("🔍 DEBUG: selected_slot value = {}", selected_slot_value)
 
     # If booked_slots is empty but we have selected_slot, this is a CRITICAL ERROR
     # The slot should have been reserved via create_slot() API in select_slot_and_book()
@@ -286,7 +287,7 @@ async def confirm_details_and_create_booking(args: FlowArgs, flow_manager: FlowM
         }, create_error_node("Slot reservation failed. The time slot was not properly reserved. Please start the booking process again.")
     else:
         if booked_slots:
-            logger.info(f"🔍 DEBUG: booked_slots already exists: {booked_slots}")
+            logger.debug("🔍 DEBUG: booked_slots already exists: {}", booked_slots)
         if not selected_slot_exists:
             logger.error("❌ DEBUG: No selected_slot found in state - this is a problem!")
 
@@ -301,27 +302,27 @@ async def confirm_details_and_create_booking(args: FlowArgs, flow_manager: FlowM
     # Use separate first name and surname for API
     patient_name = patient_first_name
 
-    logger.info(f"🔍 DEBUG: patient_first_name = '{patient_first_name}'")
-    logger.info(f"🔍 DEBUG: patient_surname = '{patient_surname}'")
-    logger.info(f"🔍 DEBUG: patient_name (for API) = '{patient_name}'")
-    logger.info(f"🔍 DEBUG: patient_surname (for API) = '{patient_surname}'")
-    logger.info(f"🔍 DEBUG: patient_phone = '{patient_phone}'")
-    logger.info(f"🔍 DEBUG: patient_email = '{patient_email}'")
+    logger.debug("🔍 DEBUG: patient_first_name = '{}'", patient_first_name)
+    logger.debug("🔍 DEBUG: patient_surname = '{}'", patient_surname)
+    logger.debug("🔍 DEBUG: patient_name (for API) = '{}'", patient_name)
+    logger.debug("🔍 DEBUG: patient_surname (for API) = '{}'", patient_surname)
+    logger.debug("🔍 DEBUG: patient_phone = '{}'", patient_phone)
+    logger.debug("🔍 DEBUG: patient_email = '{}'", patient_email)
 
     # Also check for patient data from test setup
     patient_data_dict = flow_manager.state.get("patient_data", {})
     patient_gender = flow_manager.state.get("patient_gender", patient_data_dict.get("gender", "m"))
     patient_dob = flow_manager.state.get("patient_dob", patient_data_dict.get("date_of_birth", ""))
 
-    logger.info(f"🔍 DEBUG: patient_data_dict = {patient_data_dict}")
-    logger.info(f"🔍 DEBUG: patient_gender = '{patient_gender}'")
-    logger.info(f"🔍 DEBUG: patient_dob = '{patient_dob}'")
+    logger.debug("🔍 DEBUG: patient_data_dict = {}", patient_data_dict)
+    logger.debug("🔍 DEBUG: patient_gender = '{}'", patient_gender)
+    logger.debug("🔍 DEBUG: patient_dob = '{}'", patient_dob)
 
     reminder_auth = flow_manager.state.get("reminder_authorization", False)
     marketing_auth = flow_manager.state.get("marketing_authorization", False)
 
-    logger.info(f"🔍 DEBUG: reminder_authorization = {reminder_auth}")
-    logger.info(f"🔍 DEBUG: marketing_authorization = {marketing_auth}")
+    logger.debug("🔍 DEBUG: reminder_authorization = {}", reminder_auth)
+    logger.debug("🔍 DEBUG: marketing_authorization = {}", marketing_auth)
 
     # Detailed validation check
     # Note: email is optional per Cerba API (nullable string)
@@ -333,7 +334,7 @@ async def confirm_details_and_create_booking(args: FlowArgs, flow_manager: FlowM
         "patient_phone": bool(patient_phone)
     }
 
-    logger.info(f"🔍 DEBUG: Validation results: {validation_results}")
+    logger.debug("🔍 DEBUG: Validation results: {}", validation_results)
 
     missing_fields = [field for field, is_valid in validation_results.items() if not is_valid]
     if missing_fields:
@@ -382,7 +383,6 @@ async def confirm_details_and_create_booking(args: FlowArgs, flow_manager: FlowM
         }
 
         # Speak TTS filler directly to TTS processor, then perform booking inline
-        from pipecat.frames.frames import TTSSpeakFrame
         tts_service = flow_manager.state.get("tts_service")
         if tts_service:
             await tts_service.queue_frame(TTSSpeakFrame("Creazione della prenotazione con tutti i dettagli forniti. Attendi..."))
@@ -402,13 +402,13 @@ async def perform_booking_creation_and_transition(args: FlowArgs, flow_manager:
     """Perform the actual booking creation after TTS message"""
     try:
         # COMPREHENSIVE DEBUG LOGGING FOR BOOKING CREATION
-        logger.info("🔍 DEBUG: === BOOKING CREATION STARTED ===")
-        logger.info(f"🔍 DEBUG: Args received: {args}")
+        logger.debug("🔍 DEBUG: === BOOKING CREATION STARTED ===")
+        logger.debug("🔍 DEBUG: Args received: {}", args)
 
         # Get stored booking parameters
         params = flow_manager.state.get("pending_booking_params", {})
-        logger.info(f"🔍 DEBUG: pending_booking_params exists: {bool(params)}")
-        logger.info(f"🔍 DEBUG: pending_booking_params keys: {list(params.keys()) if params else 'EMPTY'}")
+        logger.debug("🔍 DEBUG: pending_booking_params exists: {}", bool(params))
+        logger.opt(lazy=True).debug("🔍 DEBUG: pending_booking_params keys: {}", lambda: list(params.keys()) if params else 'EMPTY')
 
         if not params:
             logger.error("❌ DEBUG: No pending_booking_params found!")
@@ -433,19 +433,19 @@ async def perform_booking_creation_and_transition(args: FlowArgs, flow_manager:
         patient_found_in_db = params.get("patient_found_in_db", False)
         patient_db_id = params.get("patient_db_id", "")
 
-        logger.info(f"🔍 DEBUG: Extracted booking parameters:")
-        logger.info(f"   - selected_services: {selected_services}")
-        logger.info(f"   - booked_slots: {booked_slots}")
-        logger.info(f"   - patient_name: '{patient_name}'")
-        logger.info(f"   - patient_surname: '{patient_surname}'")
-        logger.info(f"   - patient_phone: '{patient_phone}'")
-        logger.info(f"   - patient_email: '{patient_email}'")
-        logger.info(f"   - patient_gender: '{patient_gender}'")
-        logger.info(f"   - patient_dob: '{patient_dob}'")
-        logger.info(f"   - reminder_auth: {reminder_auth}")
-        logger.info(f"   - marketing_auth: {marketing_auth}")
-        logger.info(f"   - patient_found_in_db: {patient_found_in_db}")
-        logger.info(f"   - patient_db_id: '{patient_db_id}'")
+        logger.debug("🔍 DEBUG: Extracted booking parameters:")
+        logger.debug("   - selected_services: {}", selected_services)
+        logger.debug("   - booked_slots: {}", booked_slots)
+        logger.debug("   - patient_name: '{}'", patient_name)
+        logger.debug("   - patient_surname: '{}'", patient_surname)
+        logger.debug("   - patient_phone: '{}'", patient_phone)
+        logger.debug("   - patient_email: '{}'", patient_email)
+        logger.debug("   - patient_gender: '{}'", patient_gender)
+        logger.debug("   - patient_dob: '{}'", patient_dob)
+        logger.debug("   - reminder_auth: {}", reminder_auth)
+        logger.debug("   - marketing_auth: {}", marketing_auth)
+        logger.debug("   - patient_found_in_db: {}", patient_found_in_db)
+        logger.debug("   - patient_db_id: '{}'", patient_db_id)
 
         # Import and call booking service with retry logic
         from services.booking_api import create_booking
@@ -11,10 +11,11 @@ from loguru import logger
 
 from pipecat_flows import FlowManager, NodeConfig, FlowArgs
 from services.fuzzy_search import fuzzy_search_service
-from services.sorting_api import call_sorting_api
+from services.sorting_api import call_sorting_api, build_service_group
 from services.llm_interpretation import interpret_sorting_scenario
 from models.requests import HealthService
 from config.settings import settings
+from utils.date_parser import format_dob_for_api
 
 
 def _normalize_service_name(name: str) -> str:
@@ -195,7 +196,7 @@ async def perform_second_service_sorting_and_transition(args: FlowArgs, flow_man
         selected_services = flow_manager.state.get("selected_services", [])
         patient_gender = flow_manager.state.get("patient_gender", "m")
         patient_dob = flow_manager.state.get("patient_dob", "")
-        dob_formatted = patient_dob.replace("-", "") if patient_dob else "19800413"
+        dob_formatted = format_dob_for_api(flow_manager.state, patient_dob, "19800413")
 
         if not selected_center or not selected_services:
             from flows.nodes.completion import create_error_node
@@ -244,7 +245,7 @@ async def perform_second_service_sorting_and_transition(args: FlowArgs, flow_man
                         except Exception as e:
                             logger.error(f"❌ Failed to create HealthService for {svc_name}: {e}")
                     if services:
-                        service_groups.append({"services": services, "is_group": is_group})
+                        service_groups.append(build_service_group(services, is_group))
 
             if not service_groups:
                 logger.warning("⚠️ No valid groups from sorting API for second service, falling back to center search")
@@ -268,8 +269,7 @@ async def perform_second_service_sorting_and_transition(args: FlowArgs, flow_man
             logger.success(f"✅ Second service sorting OK: scenario={llm_interpretation['booking_scenario']}")
 
             # Get display name
-            first_group_services = service_groups[0]["services"]
-            display_name = " più ".join([svc.name for svc in first_group_services])
+            display_name = service_groups[0]["name"]
             center_name = selected_center.name
 
             from flows.handlers.booking_handlers import auto_search_first_available
@@ -7,6 +7,7 @@ import re
 from typing import Dict, Any, Tuple, List, Optional
 from loguru import logger
 
+from pipecat.frames.frames import TTSSpeakFrame
 from pipecat_flows import FlowManager, NodeConfig, FlowArgs
 from services.fuzzy_search import fuzzy_search_service
 from models.requests import HealthService
@@ -61,7 +62,6 @@ async def search_health_services_and_transition(args: FlowArgs, flow_manager: Fl
         # Speak TTS filler directly to TTS processor (bypasses pipeline source queue)
         tts_service = flow_manager.state.get("tts_service")
         if tts_service:
-            from pipecat.frames.frames import TTSSpeakFrame
             await tts_service.queue_frame(TTSSpeakFrame(f"Cerco il servizio {search_term}. Un momento."))
 
         # Fuzzy search inline (~23ms local operation)
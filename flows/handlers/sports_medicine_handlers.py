@@ -416,19 +416,16 @@ async def handle_demographics_collection(
     luogo_nascita = args.get("luogo_nascita", "").strip()
 
     # Validate required fields
-    missing = []
-    if not nome:
-        missing.append("nome")
-    if not cognome:
-        missing.append("cognome")
-    if sex not in ("M", "F"):
-        missing.append("sesso (M/F)")
-    if not dt_nascita:
-        missing.append("data di nascita")
-    if not email:
-        missing.append("email")
-    if not telefono:
-        missing.append("telefono")
+    missing = [
+        label for label, value in (
+            ("nome", nome),
+            ("cognome", cognome),
+            ("sesso (M/F)", sex in ("M", "F")),
+            ("data di nascita", dt_nascita),
+            ("email", email),
+            ("telefono", telefono),
+        ) if not value
+    ]
 
     if missing:
         return {
@@ -156,6 +156,7 @@ async def initialize_flow_manager(flow_manager: TrackedFlowManager, start_node:
     elif start_node == "cerba_card":
         from flows.nodes.booking import create_cerba_membership_node
         from models.requests import HealthService, HealthCenter
+        from services.sorting_api import build_service_group
 
         # Pre-populate state with test data up to the point where Cerba Card question is asked
         service1 = HealthService(
@@ -177,8 +178,8 @@ async def initialize_flow_manager(flow_manager: TrackedFlowManager, start_node:
             # Multi-service booking data
             "selected_services": [service1, service2],
             "service_groups": [
-                {"services": [service2], "is_group": False},  # First group: Visita Ortopedica
-                {"services": [service1], "is_group": False}   # Second group: RX Caviglia
+                build_service_group([service2], False),  # First group: Visita Ortopedica
+                build_service_group([service1], False)   # Second group: RX Caviglia
             ],
             "booking_scenario": "separate",
             "current_group_index": 0,
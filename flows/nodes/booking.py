@@ -6,7 +6,7 @@ import json
 import re
 import html as html_module
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
+from functools import lru_cache
 from typing import Dict, Any, List
 from pipecat_flows import NodeConfig, FlowsFunctionSchema, ContextStrategyConfig, ContextStrategy
 from loguru import logger
@@ -33,7 +33,7 @@ from flows.handlers.booking_handlers import (
 )
 from config.settings import settings
 from utils.italian_time import time_to_italian_words
-
+from services.timezone_utils import ITALIAN_TZ
 
 
 def create_flow_navigation_node(generated_flow: dict, service_name: str, pending_additional_request: str = "") -> NodeConfig:
@@ -522,7 +522,7 @@ def create_slot_selection_node(slots: List[Dict], service: HealthService, is_cer
 
     for slot in slots:
         # Convert UTC slot times to Italian local time for user display
-        from services.timezone_utils import utc_to_italian_display, format_time_for_display
+        from services.timezone_utils import utc_to_italian_display, utc_to_naive_string, format_time_for_display
 
         italian_start = utc_to_italian_display(slot["start_time"])
         italian_end = utc_to_italian_display(slot["end_time"])
@@ -530,8 +530,8 @@ def create_slot_selection_node(slots: List[Dict], service: HealthService, is_cer
         # Fallback to original if conversion fails
         if not italian_start or not italian_end:
             logger.warning(f"⚠️ Timezone conversion failed, using original times")
-            start_time_str = slot["start_time"].replace("T", " ").replace("+00:00", "")
-            end_time_str = slot["end_time"].replace("T", " ").replace("+00:00", "")
+            start_time_str = utc_to_naive_string(slot["start_time"])
+            end_time_str = utc_to_naive_string(slot["end_time"])
             start_dt = datetime.strptime(start_time_str, "%Y-%m-%d %H:%M:%S")
             end_dt = datetime.strptime(end_time_str, "%Y-%m-%d %H:%M:%S")
         else:
@@ -583,8 +583,7 @@ def create_slot_selection_node(slots: List[Dict], service: HealthService, is_cer
         logger.info("🎯 FIRST AVAILABLE MODE: Sending ALL slots from earliest available date (TOMORROW)")
 
         # Get tomorrow's date in Italian timezone (API already searched from tomorrow)
-        italian_tz = ZoneInfo("Europe/Rome")
-        today_dt = datetime.now(italian_tz)
+        today_dt = datetime.now(ITALIAN_TZ)
         tomorrow_dt = today_dt + timedelta(days=1)
         tomorrow_date_key = tomorrow_dt.strftime('%Y-%m-%d')
 
@@ -920,7 +919,7 @@ Ask the user which time works best for them."""
         }
 
         logger.success(f"🚀 OPTIMIZED: Sending only {len(minimal_slots_for_llm)} slots to LLM instead of {len(slots)}")
-        logger.info(f"🚀 Times (Italian): {[slot['time_italian'] for slot in minimal_slots_for_llm]}")
+        logger.opt(lazy=True).info("🚀 Times (Italian): {}", lambda: [slot['time_italian'] for slot in minimal_slots_for_llm])
         logger.info(f"🚀 Italian→UUID mapping: {slot_context['italian_to_uuid_map']}")
 
         # Build price info for get_price_info function (stored in state via slot_cache)
@@ -1144,6 +1143,7 @@ def create_slot_refresh_node(service_name: str) -> NodeConfig:
     )
 
 
+@lru_cache(maxsize=64)
 def create_no_slots_node(date: str, time_preference: str = "any time", first_appointment_date: str = None, is_automatic_search: bool = False, has_booked_slots: bool = False, booked_slots_info: str = "", service_name: str = "") -> NodeConfig:
     """Create node when no slots are available — offer operator transfer first, then alternative dates.
 
@@ -1155,6 +1155,8 @@ def create_no_slots_node(date: str, time_preference: str = "any time", first_app
         has_booked_slots: True if there are already-booked slots from previous services
         booked_slots_info: Human-readable summary of already-booked services
         service_name: Name of the service being searched (to avoid LLM confusion in multi-service flows)
+
+    Memoized per argument tuple: the returned node is shared, do not mutate it.
     """
     # Build constraint message for multi-service bookings
     system_constraint_msg = ""
@@ -1248,7 +1250,7 @@ def create_booking_summary_confirmation_node(selected_services: List[HealthServi
     preparation_notes = []
     for i, slot in enumerate(selected_slots):
         # Convert UTC slot times to Italian local time for user display
-        from services.timezone_utils import utc_to_italian_display
+        from services.timezone_utils import utc_to_italian_display, utc_to_naive_string
 
         italian_start = utc_to_italian_display(slot["start_time"])
         italian_end = utc_to_italian_display(slot["end_time"])
@@ -1256,8 +1258,8 @@ def create_booking_summary_confirmation_node(selected_services: List[HealthServi
         # Fallback to original if conversion fails
         if not italian_start or not italian_end:
             logger.warning(f"⚠️ Timezone conversion failed for booking summary, using original times")
-            start_time_str = slot["start_time"].replace("T", " ").replace("+00:00", "")
-            end_time_str = slot["end_time"].replace("T", " ").replace("+00:00", "")
+            start_time_str = utc_to_naive_string(slot["start_time"])
+            end_time_str = utc_to_naive_string(slot["end_time"])
             start_dt = datetime.strptime(start_time_str, "%Y-%m-%d %H:%M:%S")
             end_dt = datetime.strptime(end_time_str, "%Y-%m-%d %H:%M:%S")
         else:
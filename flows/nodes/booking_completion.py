@@ -8,6 +8,7 @@ from typing import List, Dict
 from pipecat_flows import NodeConfig, FlowsFunctionSchema
 
 from flows.handlers.service_handlers import search_health_services_and_transition
+from services.timezone_utils import utc_to_italian_display, utc_to_naive_string, parse_iso_datetime
 from config.settings import settings
 
 
@@ -26,8 +27,6 @@ def create_booking_success_final_node(booking_info: Dict, selected_services: Lis
 
     for slot in booked_slots:
         # Convert UTC times to Italian local time for user display
-        from services.timezone_utils import utc_to_italian_display
-
         italian_start = utc_to_italian_display(slot['start_time'])
         italian_end = utc_to_italian_display(slot['end_time'])
 
@@ -35,8 +34,8 @@ def create_booking_success_final_node(booking_info: Dict, selected_services: Lis
         if not italian_start or not italian_end:
             from loguru import logger
             logger.warning(f"⚠️ Timezone conversion failed for booking completion display, using original times")
-            start_time_str = slot['start_time'].replace("T", " ").replace("+00:00", "")
-            end_time_str = slot['end_time'].replace("T", " ").replace("+00:00", "")
+            start_time_str = utc_to_naive_string(slot['start_time'])
+            end_time_str = utc_to_naive_string(slot['end_time'])
             start_dt = datetime.strptime(start_time_str, "%Y-%m-%d %H:%M:%S")
             end_dt = datetime.strptime(end_time_str, "%Y-%m-%d %H:%M:%S")
         else:
@@ -64,7 +63,7 @@ def create_booking_success_final_node(booking_info: Dict, selected_services: Lis
     # Create confirmation message
     if creation_date:
         try:
-            created_dt = datetime.fromisoformat(creation_date.replace('Z', '+00:00'))
+            created_dt = parse_iso_datetime(creation_date)
             created_date = created_dt.strftime("%d %B %Y at %-H:%M")
         except:
             created_date = creation_date
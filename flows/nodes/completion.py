@@ -3,6 +3,7 @@ Success, error, and completion handling nodes
 """
 
 from datetime import datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 from typing import List, Dict
 from pipecat_flows import NodeConfig, FlowsFunctionSchema
@@ -14,8 +15,9 @@ from flows.handlers.agent_routing_handlers import transfer_from_booking_to_info_
 from config.settings import settings
 
 
+@lru_cache(maxsize=64)
 def create_error_node(error_message: str) -> NodeConfig:
-    """Dynamically create error node with custom message"""
+    """Dynamically create error node with custom message (memoized per message; do not mutate the result)"""
     return NodeConfig(
         name="booking_error",
         role_messages=[{
@@ -64,7 +66,7 @@ def create_booking_success_multi_node(booked_slots: List[Dict], total_price: flo
     bookings_text = []
     for slot in booked_slots:
         # Convert UTC times to Italian local time for user display
-        from services.timezone_utils import utc_to_italian_display
+        from services.timezone_utils import utc_to_italian_display, utc_to_naive_string
 
         italian_start = utc_to_italian_display(slot['start_time'])
         italian_end = utc_to_italian_display(slot['end_time'])
@@ -72,8 +74,8 @@ def create_booking_success_multi_node(booked_slots: List[Dict], total_price: flo
         # Fallback to original if conversion fails
         if not italian_start or not italian_end:
             logger.warning(f"⚠️ Timezone conversion failed for completion display, using original times")
-            start_time_str = slot['start_time'].replace("T", " ").replace("+00:00", "")
-            end_time_str = slot['end_time'].replace("T", " ").replace("+00:00", "")
+            start_time_str = utc_to_naive_string(slot['start_time'])
+            end_time_str = utc_to_naive_string(slot['end_time'])
             start_dt = datetime.strptime(start_time_str, "%Y-%m-%d %H:%M:%S")
             end_dt = datetime.strptime(end_time_str, "%Y-%m-%d %H:%M:%S")
         else:
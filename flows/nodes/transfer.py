@@ -3,15 +3,18 @@ Transfer Node
 Handles transfer to human operator with escalation API call
 """
 
+from functools import lru_cache
 from loguru import logger
 from pipecat_flows import NodeConfig
 from config.settings import settings
 
 
+@lru_cache(maxsize=2)
 def create_transfer_node(include_end_conversation: bool = True) -> NodeConfig:
     """
     Create transfer node (NodeConfig only, no escalation).
     Use create_transfer_node_with_escalation() instead for most cases.
+    Memoized per argument: the returned node is shared, do not mutate it.
 
     Args:
         include_end_conversation: If True, add end_conversation post_action.
@@ -4,6 +4,7 @@ Handles all interactions with the Cerba healthcare API
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 from typing import Dict, List, Optional, Any
 from fastapi import HTTPException
@@ -24,6 +25,9 @@ class CerbaAPIService:
     
     def __init__(self):
         self.base_url = config.CERBA_BASE_URL
+        # Pooled keep-alive connections, shared by the executor threads handlers call us from
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
     
     @trace_sync_call("api.cerba_request", add_args=False)
     def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Any:
@@ -52,7 +56,7 @@ class CerbaAPIService:
             
             logger.info(f"📡 CERBA API: {endpoint} | params={params}")
             
-            response = requests.get(
+            response = self.session.get(
                 url,
                 headers=headers,
                 params=params,
@@ -15,6 +15,27 @@ from utils.tracing import trace_api_call, add_span_attributes
 # Bridge escalation endpoint
 ESCALATION_API_URL = os.getenv("BRIDGE_ESCALATION_URL", "https://bridgepiemonte-efhqhzdjdyb6a0g6.francecentral-01.azurewebsites.net/escalation")
 
+# Shared HTTP session so repeated escalations reuse the bridge connection (no TCP+TLS setup per call)
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """Create the shared escalation HTTP session on first use"""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession()
+        logger.debug("🔌 HTTP session created for escalation API")
+    return _session
+
+
+async def close_session():
+    """Close the shared escalation HTTP session"""
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+        logger.debug("🔌 HTTP session closed for escalation API")
+
 
 @trace_api_call("api.escalation_transfer")
 async def call_escalation_api(
@@ -107,21 +128,21 @@ async def call_escalation_api(
 
         timeout = aiohttp.ClientTimeout(total=10)
 
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(
-                ESCALATION_API_URL,
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                status = response.status
-                response_text = await response.text()
-
-                if status == 200:
-                    logger.info(f"✅ Escalation API success: {response_text}")
-                    return True
-                else:
-                    logger.error(f"❌ Escalation API failed: status={status}, response={response_text}")
-                    return False
+        async with _get_session().post(
+            ESCALATION_API_URL,
+            json=payload,
+            headers={"Content-Type": "application/json"},
+            timeout=timeout
+        ) as response:
+            status = response.status
+            response_text = await response.text()
+
+            if status == 200:
+                logger.info(f"✅ Escalation API success: {response_text}")
+                return True
+            else:
+                logger.error(f"❌ Escalation API failed: status={status}, response={response_text}")
+                return False
 
     except aiohttp.ClientError as e:
         logger.error(f"❌ Escalation API network error: {e}")
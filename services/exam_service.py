@@ -13,6 +13,9 @@ from loguru import logger
 from config.settings import settings
 from utils.tracing import trace_api_call, add_span_attributes
 
+# Sports medicine visit codes: A1-A3 agonistic, B1-B5 non-agonistic
+VALID_VISIT_TYPES = frozenset({"A1", "A2", "A3", "B1", "B2", "B3", "B4", "B5"})
+
 
 @dataclass
 class ExamResult:
@@ -61,16 +64,15 @@ class ExamService:
             await self.initialize()
             
             # Validate visit type
-            valid_types = ["A1", "A2", "A3", "B1", "B2", "B3", "B4", "B5"]
             visit_type = visit_type.upper()
             
-            if visit_type not in valid_types:
+            if visit_type not in VALID_VISIT_TYPES:
                 logger.warning(f"⚠️ Invalid visit type '{visit_type}'")
                 return ExamResult(
                     exams=[],
                     visit_type=visit_type,
                     success=False,
-                    error=f"Invalid visit type. Must be one of: {', '.join(valid_types)}"
+                    error=f"Invalid visit type. Must be one of: {', '.join(sorted(VALID_VISIT_TYPES))}"
                 )
             
             logger.info(f"🔬 Getting exams for visit type: {visit_type}")
@@ -3,9 +3,13 @@
 """
 ambiente="prod"
 import requests
-import json
+import copy
 from loguru import logger
 from services.amb_json_flow_eng import recupera_amb_json_flow
+from utils.cache import TTLCache
+
+# Keep-alive connection pool for the token and flow endpoints
+_session = requests.Session()
 
 def get_token():
     url = 'https://cerbahc.auth.eu-central-1.amazoncognito.com/oauth2/token'
@@ -21,7 +25,7 @@ def get_token():
     "Content-Type": "application/x-www-form-urlencoded"
 }
 
-    response = requests.post(url, data=payload, headers=headers)
+    response = _session.post(url, data=payload, headers=headers)
     
     token=""
     if response.status_code == 200:
@@ -57,12 +61,10 @@ def genera_flow(hc_uuid, medical_exam_id, gender="m", date_of_birth="19900811"):
         'date_of_birth': date_of_birth,
         'health_centers':hc_uuid, # I'll pass you a multi-health center so that you can recover the services that can be performed in these centers.
     }
-    response = requests.get(api_url,headers=headers,params=request_data)#,params=request_data
+    response = _session.get(api_url,headers=headers,params=request_data)#,params=request_data
     #print(request_data,medical_exam_id)
     if response.status_code == 200:
         data = response.json()
-        formatted_json = json.dumps(data, indent=4)
-        #print(formatted_json)
         #print(data)
         resp=data
         uuid = data['uuid']
@@ -174,7 +176,7 @@ def genera_flow(hc_uuid, medical_exam_id, gender="m", date_of_birth="19900811"):
                    dizionario['list_health_servicesUUID'].extend(accessorie_uuid)
                    dizionario['health_service_code'].extend(accessorie_code)
                    dizionario['sector'].extend([voce] * lungo)
-                   resp=json.dumps(dizionario, indent=4, ensure_ascii=False)
+                   resp=dizionario
                    #return resp
                 elif follow_up==True:#Visita di Controllo
                     dizionario = recupera_amb_json_flow(2)
@@ -190,7 +192,7 @@ def genera_flow(hc_uuid, medical_exam_id, gender="m", date_of_birth="19900811"):
                     dizionario['no']['yes']['action']=f"cancella_carrello({name}),salva_carrello({follow_up_health_services[0]['name']},'health_services')"
                     dizionario['no']['sector'].extend([sector])
                     #print(follow_up_health_services[0]['name'])
-                    resp=json.dumps(dizionario, indent=4, ensure_ascii=False)
+                    resp=dizionario
                     #return resp
             elif medical_examination==False:
                 if requires_prescription==True:#Esame Strumentale con prescrizione
@@ -226,7 +228,7 @@ def genera_flow(hc_uuid, medical_exam_id, gender="m", date_of_birth="19900811"):
                     dizionario['yes']['yes']['health_service_code'].extend(prima_visita_code)
 
                     dizionario['yes']['yes']['sector'].extend([voce_a] * lungo_b)
-                    resp=json.dumps(dizionario, indent=4, ensure_ascii=False)
+                    resp=dizionario
                 elif requires_prescription==False:
                     if requires_preliminary_visit==True:#Prima visita obbligatoria
                         dizionario = recupera_amb_json_flow(4)
@@ -256,7 +258,7 @@ def genera_flow(hc_uuid, medical_exam_id, gender="m", date_of_birth="19900811"):
                         dizionario['no']['yes']['health_service_code'].extend(list_health_services)
                         dizionario['no']['no']['action']=f"cancella_carrello({name}),salva_carrello({visita_specialistas},'health_services')"
                         dizionario['no']['no']['sector']=sector_b
-                        resp=json.dumps(dizionario, indent=4, ensure_ascii=False)
+                        resp=dizionario
                         #return resp
                     elif requires_preliminary_visit==False:
                         lungo=len(accessorie)
@@ -279,10 +281,33 @@ def genera_flow(hc_uuid, medical_exam_id, gender="m", date_of_birth="19900811"):
                         dizionario['yes']['no']['sector'].extend([voce_a] * lungo_a)
                         dizionario['yes']['no']['yes']['action']=f"salva_carrello({name},{commento},'health_services','opinions')"
                         dizionario['yes']['no']['no']['action']=f"salva_carrello({name},'health_services')"
-                        resp=json.dumps(dizionario, indent=4, ensure_ascii=False)
+                        resp=dizionario
        
         return resp
     
+# Generated flows only depend on (centers, service, gender, date of birth)
+FLOW_CACHE_TTL = 600  # seconds
+_genera_flow_cache = TTLCache(default_ttl=FLOW_CACHE_TTL)
+
+
+def cached_genera_flow(hc_uuid, medical_exam_id, gender="m", date_of_birth="19900811"):
+    """
+    genera_flow, reusing the flow generated for the same inputs in the last FLOW_CACHE_TTL seconds.
+    Returns a deep copy because callers prune the flow tree in place.
+    """
+    key = "|".join([",".join(sorted(hc_uuid)), medical_exam_id, gender, date_of_birth])
+    flow = _genera_flow_cache.get(key)
+    if flow is not None:
+        logger.info(f'⚡ genera_flow: cache hit for {medical_exam_id}')
+        return copy.deepcopy(flow)
+
+    flow = genera_flow(hc_uuid, medical_exam_id, gender, date_of_birth)
+    if flow:
+        _genera_flow_cache.cleanup_expired()
+        _genera_flow_cache.set(key, flow)
+        return copy.deepcopy(flow)
+    return flow
+
 ##########Health Center############
 # Tradate # c5535638-6c18-444c-955d-89139d8276be
 ################################################
@@ -11,8 +11,12 @@ from dataclasses import dataclass
 from loguru import logger
 
 from config.settings import settings
+from utils.cache import TTLCache
 from utils.tracing import trace_api_call, add_span_attributes
 
+# Successful price lookups are reused for the same parameters; failures are never cached
+PRICE_CACHE_TTL = 60  # seconds
+
 
 @dataclass
 class PriceResult:
@@ -32,6 +36,7 @@ class PricingService:
         self.non_agonistic_url = settings.info_api_endpoints["price_non_agonistic"]
         self.timeout = settings.api_timeout
         self.session: Optional[aiohttp.ClientSession] = None
+        self.price_cache = TTLCache(default_ttl=PRICE_CACHE_TTL)
         logger.info(f"💰 Pricing Service initialized")
         logger.debug(f"💰 Agonistica URL: {self.agonistic_url}")
         logger.debug(f"💰 Non-Agonistica URL: {self.non_agonistic_url}")
@@ -70,7 +75,13 @@ class PricingService:
             if gender not in ["M", "F"]:
                 logger.warning(f"⚠️ Invalid gender '{gender}', defaulting to M")
                 gender = "M"
-            
+
+            cache_key = f"agonistic|{age}|{gender}|{sport.strip().casefold()}|{region.strip().casefold()}"
+            cached = self.price_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"⚡ Agonistica price from cache: €{cached.price}")
+                return cached
+
             logger.info(f"💰 Getting Agonistica price: age={age}, gender={gender}, sport={sport}, region={region}")
 
             # VAPI-compatible request format
@@ -135,12 +146,14 @@ class PricingService:
 
                 logger.success(f"✅ Agonistica price: €{price} (visit type: {visit_type})")
 
-                return PriceResult(
+                result = PriceResult(
                     price=price,
                     visit_type=visit_type,
                     currency="EUR",
                     success=True
                 )
+                self.price_cache.set(cache_key, result)
+                return result
                 
         except aiohttp.ClientResponseError as e:
             logger.error(f"❌ Agonistica price API error {e.status}: {e.message}")
@@ -185,7 +198,13 @@ class PricingService:
         """
         try:
             await self.initialize()
-            
+
+            cache_key = f"non_agonistic|{bool(ecg_under_stress)}"
+            cached = self.price_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"⚡ Non-Agonistica price from cache: €{cached.price}")
+                return cached
+
             logger.info(f"💰 Getting non-Agonistica price: ECG under stress={ecg_under_stress}")
 
             # VAPI-compatible request format
@@ -245,12 +264,14 @@ class PricingService:
 
                 logger.success(f"✅ Non-Agonistica price: €{price}")
 
-                return PriceResult(
+                result = PriceResult(
                     price=price,
                     visit_type=visit_type,
                     currency="EUR",
                     success=True
                 )
+                self.price_cache.set(cache_key, result)
+                return result
                 
         except aiohttp.ClientResponseError as e:
             logger.error(f"❌ Non-Agonisticaprice API error {e.status}: {e.message}")
@@ -279,6 +300,11 @@ class PricingService:
                 error=str(e)
             )
     
+    def clear_cache(self):
+        """Drop cached prices (e.g. after a pricing config change)"""
+        self.price_cache.clear()
+        logger.debug("💰 Pricing cache cleared")
+
     async def cleanup(self):
         """Close HTTP session"""
         if self.session:
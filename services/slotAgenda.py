@@ -6,6 +6,7 @@ from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
 from loguru import logger
 from utils.tracing import trace_sync_call, add_span_attributes
+from utils.cache import TTLCache
 
 load_dotenv(override=True)
 #from auth import get_token
@@ -43,7 +44,7 @@ def list_slot(health_center_uuid, date_search, uuid_exam, gender='m', date_of_bi
     add_span_attributes({
         "slot.center_uuid": health_center_uuid,
         "slot.date": date_search,
-        "slot.service_count": len(uuid_exam) if isinstance(uuid_exam, list) else 1,
+        "slot.service_count": len(uuid_exam) if isinstance(uuid_exam, (list, tuple)) else 1,
         "slot.start_time": start_time or "not_specified",
         "slot.end_time": end_time or "not_specified"
     })
@@ -61,7 +62,7 @@ def list_slot(health_center_uuid, date_search, uuid_exam, gender='m', date_of_bi
     request_data = {
         'gender': gender,
         'date_of_birth': date_of_birth,
-        'health_services': uuid_exam,  # uuid_exam is already a list
+        'health_services': uuid_exam,  # uuid_exam is already a list/tuple
         'start_date': date_search, # Date of appointment
         'start_time': start_time, # 2025-09-12 09:00:00+00
         'end_time': end_time, # 2025-09-12 10:00:00+00
@@ -109,6 +110,33 @@ def list_slot(health_center_uuid, date_search, uuid_exam, gender='m', date_of_bi
         raise Exception(f"Slot API returned {response.status_code}: {response.text[:200]}")
 
 
+# Short-lived cache for identical slot searches (backtracking, re-confirmed dates)
+SLOT_CACHE_TTL = 30  # seconds
+_list_slot_cache = TTLCache[list](default_ttl=SLOT_CACHE_TTL)
+
+
+def cached_list_slot(health_center_uuid, date_search, uuid_exam, gender='m', date_of_birth='1980-04-13', start_time=None, end_time=None, providing_entity=None):
+    """list_slot, reusing the response of an identical search made in the last SLOT_CACHE_TTL seconds."""
+    key = "|".join([
+        health_center_uuid, date_search, ",".join(sorted(uuid_exam)), gender, date_of_birth,
+        start_time or "", end_time or "", providing_entity or ""
+    ])
+    slots = _list_slot_cache.get(key)
+    if slots is not None:
+        logger.info(f'⚡ SLOT API: cache hit, {len(slots)} slots')
+        return slots
+
+    slots = list_slot(health_center_uuid, date_search, uuid_exam, gender, date_of_birth, start_time, end_time, providing_entity)
+    _list_slot_cache.cleanup_expired()
+    _list_slot_cache.set(key, slots)
+    return slots
+
+
+def invalidate_slot_cache(health_center_uuid):
+    """Drop cached slot searches for a center after its availability changed."""
+    return _list_slot_cache.delete_prefix(f"{health_center_uuid}|")
+
+
 @trace_sync_call("api.slot_create")
 def create_slot(start_slot,end_slot,pea):
     # Add slot details to span for debugging
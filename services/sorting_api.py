@@ -286,3 +286,25 @@ async def call_sorting_api(
             "error": f"Unexpected error: {str(e)}",
             "error_type": "unexpected"
         }
+
+
+def build_service_group(services: List[HealthService], is_group: bool) -> Dict[str, Any]:
+    """
+    Build a service group entry for state["service_groups"]
+
+    The display name and UUID tuple are computed once here so the booking
+    flow can read them on every turn without re-joining.
+
+    Args:
+        services: HealthService objects in the group
+        is_group: Whether the sorting API bundles them into one appointment
+
+    Returns:
+        Dictionary with services, is_group, name and uuids
+    """
+    return {
+        "services": services,
+        "is_group": is_group,
+        "name": " più ".join([svc.name for svc in services]),
+        "uuids": tuple(svc.uuid for svc in services)
+    }
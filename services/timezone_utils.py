@@ -4,15 +4,56 @@ Handles conversion between UTC (database/API) and Italian local time (user displ
 """
 
 from datetime import datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 from loguru import logger
 from typing import Optional
 
+ITALIAN_TZ = ZoneInfo("Europe/Rome")
+UTC_TZ = ZoneInfo("UTC")
 
+try:
+    from ciso8601 import parse_datetime as _ciso_parse_datetime
+except ImportError:
+    _ciso_parse_datetime = None
+
+
+def parse_iso_datetime(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp, using ciso8601 when installed
+
+    Falls back to datetime.fromisoformat when ciso8601 is missing or rejects
+    the input, so behaviour matches fromisoformat either way.
+    """
+    if _ciso_parse_datetime is not None:
+        try:
+            return _ciso_parse_datetime(value)
+        except ValueError:
+            pass
+    return datetime.fromisoformat(value)
+
+
+def utc_to_naive_string(utc_datetime_str: str) -> str:
+    """
+    Strip an API UTC timestamp to "YYYY-MM-DD HH:MM:SS" (no timezone conversion)
+
+    Args:
+        utc_datetime_str: UTC datetime string like "2025-11-08T09:55:00+00:00"
+
+    Returns:
+        Naive string like "2025-11-08 09:55:00"
+    """
+    return utc_datetime_str.replace("T", " ", 1).removesuffix("+00:00")
+
+
+@lru_cache(maxsize=4096)
 def utc_to_italian_display(utc_datetime_str: str) -> Optional[str]:
     """
     Convert UTC datetime from API to Italian local time for user display
 
+    Memoized: the same slot timestamps are converted during search, selection
+    matching and summaries.
+
     Args:
         utc_datetime_str: UTC datetime string like "2025-11-08T09:55:00+00:00"
 
@@ -21,10 +62,10 @@ def utc_to_italian_display(utc_datetime_str: str) -> Optional[str]:
     """
     try:
         # Parse the UTC datetime
-        dt_utc = datetime.fromisoformat(utc_datetime_str)
+        dt_utc = parse_iso_datetime(utc_datetime_str)
 
         # Convert to Italian timezone (handles DST automatically)
-        dt_italian = dt_utc.astimezone(ZoneInfo("Europe/Rome"))
+        dt_italian = dt_utc.astimezone(ITALIAN_TZ)
 
         # Format for display (same format as current system uses)
         italian_display = dt_italian.strftime("%Y-%m-%d %H:%M:%S")
@@ -53,10 +94,10 @@ def italian_to_utc_for_api(italian_datetime_str: str) -> Optional[str]:
         dt_italian = datetime.strptime(italian_datetime_str, "%Y-%m-%d %H:%M:%S")
 
         # Set timezone to Italy (handles DST automatically)
-        dt_italian = dt_italian.replace(tzinfo=ZoneInfo("Europe/Rome"))
+        dt_italian = dt_italian.replace(tzinfo=ITALIAN_TZ)
 
         # Convert back to UTC
-        dt_utc = dt_italian.astimezone(ZoneInfo("UTC"))
+        dt_utc = dt_italian.astimezone(UTC_TZ)
 
         # Format for booking API (same format as current system expects)
         utc_for_api = dt_utc.strftime("%Y-%m-%d %H:%M:%S")
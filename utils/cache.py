@@ -103,6 +103,25 @@ class TTLCache(Generic[T]):
                 return True
             return False
     
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        Delete all items whose key starts with prefix
+        
+        Args:
+            prefix: Key prefix
+            
+        Returns:
+            Number of items deleted
+        """
+        with self._lock:
+            keys = [key for key in self._cache if key.startswith(prefix)]
+            for key in keys:
+                del self._cache[key]
+        
+        if keys:
+            logger.debug(f"Cache deleted {len(keys)} entries with prefix: {prefix}")
+        return len(keys)
+    
     def clear(self) -> None:
         """Clear all cache entries"""
         with self._lock:
@@ -1,4 +1,4 @@
-"""Parse LLM date strings to YYYY-MM-DD format."""
+"""Parse LLM date strings to YYYY-MM-DD format, and format DOBs for the Cerba APIs."""
 
 from datetime import datetime
 
@@ -15,3 +15,15 @@ def parse_readable_date(date_str: str) -> str | None:
         except ValueError:
             continue
     return None
+
+
+def format_dob_for_api(state: dict, patient_dob: str, default: str = "") -> str:
+    """patient_dob in the API's YYYYMMDD form, kept in state next to the DOB it came from."""
+    if not patient_dob:
+        return default
+    cached = state.get("patient_dob_api")
+    if cached and cached[0] == patient_dob:
+        return cached[1]
+    dob_api = patient_dob.replace("-", "")
+    state["patient_dob_api"] = (patient_dob, dob_api)
+    return dob_api